@@ -2,41 +2,52 @@ import pygame
 import os
 
 class Animation:
+    # 犬種ごとの色
+    DOG_COLORS = {
+        "コーギー": (255, 200, 100),
+        "ミニチュアダックスフンド": (150, 100, 50),
+        "柴犬": (255, 150, 50)
+    }
+    
+    # 成長段階ごとのサイズ
+    GROWTH_SIZES = {
+        "子犬": (100, 80),
+        "成犬": (150, 120),
+        "老犬": (140, 110)
+    }
+    
+    # アニメーションの種類と順番
+    ANIMATION_NAMES = ["idle", "walk", "happy"]
+    FRAMES_PER_ANIMATION = 4
+    
+    # 1フレームを表示する時間（ミリ秒）
+    ANIMATION_SPEED = 200
+    
     def __init__(self, dog_type, growth_stage):
         self.dog_type = dog_type
         self.growth_stage = growth_stage
         self.animations = {}
         self.current_animation = "idle"
         self.frame_index = 0
-        self.last_update_time = 0
-        self.animation_speed = 200  # ミリ秒単位
         
         # アニメーションの初期化
         self.load_animations()
     
     def load_animations(self):
         """犬種と成長段階に応じたアニメーションをロード"""
-        # 各犬種のアニメーションを作成（プレースホルダー）
-        self.create_placeholder_animations()
+        # 共有のスプライトアトラスからフレームを取得（描画処理は起動時に一度だけ）
+        from sprite_atlas import SpriteAtlas
+        self.animations = SpriteAtlas.get_shared().get_frames(self.dog_type, self.growth_stage)
     
     def create_placeholder_animations(self):
         """プレースホルダーアニメーションを作成"""
-        # 犬種ごとの色
-        colors = {
-            "コーギー": (255, 200, 100),
-            "ミニチュアダックスフンド": (150, 100, 50),
-            "柴犬": (255, 150, 50)
-        }
-        
-        # 成長段階ごとのサイズ
-        sizes = {
-            "子犬": (100, 80),
-            "成犬": (150, 120),
-            "老犬": (140, 110)
-        }
-        
-        color = colors[self.dog_type]
-        size = sizes[self.growth_stage]
+        self.animations = Animation.create_placeholder_frames(self.dog_type, self.growth_stage)
+    
+    @staticmethod
+    def create_placeholder_frames(dog_type, growth_stage):
+        """プレースホルダーアニメーションのフレームを描画"""
+        color = Animation.DOG_COLORS[dog_type]
+        size = Animation.GROWTH_SIZES[growth_stage]
         
         # アイドルアニメーション（瞬き）
         idle_frames = []
@@ -51,14 +62,14 @@ class Animation:
             pygame.draw.circle(frame, color, (size[0] // 4 * 3, size[1] // 3), head_size // 2)
             
             # 耳
-            if self.dog_type == "コーギー":
+            if dog_type == "コーギー":
                 # コーギーの三角形の耳
                 pygame.draw.polygon(frame, color, [
                     (size[0] // 4 * 3, size[1] // 3 - head_size // 2),
                     (size[0] // 4 * 3 + head_size // 2, size[1] // 3 - head_size),
                     (size[0] // 4 * 3 + head_size // 2, size[1] // 3 - head_size // 2)
                 ])
-            elif self.dog_type == "ミニチュアダックスフンド":
+            elif dog_type == "ミニチュアダックスフンド":
                 # ダックスフンドの垂れ耳
                 pygame.draw.ellipse(frame, color, (
                     size[0] // 4 * 3 - head_size // 4,
@@ -66,7 +77,7 @@ class Animation:
                     head_size // 2,
                     head_size // 1.5
                 ))
-            elif self.dog_type == "柴犬":
+            elif dog_type == "柴犬":
                 # 柴犬の三角形の耳
                 pygame.draw.polygon(frame, color, [
                     (size[0] // 4 * 3, size[1] // 3 - head_size // 3),
@@ -103,20 +114,20 @@ class Animation:
             pygame.draw.circle(frame, color, (size[0] // 4 * 3, size[1] // 3), head_size // 2)
             
             # 耳（犬種ごとに異なる）
-            if self.dog_type == "コーギー":
+            if dog_type == "コーギー":
                 pygame.draw.polygon(frame, color, [
                     (size[0] // 4 * 3, size[1] // 3 - head_size // 2),
                     (size[0] // 4 * 3 + head_size // 2, size[1] // 3 - head_size),
                     (size[0] // 4 * 3 + head_size // 2, size[1] // 3 - head_size // 2)
                 ])
-            elif self.dog_type == "ミニチュアダックスフンド":
+            elif dog_type == "ミニチュアダックスフンド":
                 pygame.draw.ellipse(frame, color, (
                     size[0] // 4 * 3 - head_size // 4,
                     size[1] // 3 - head_size // 2,
                     head_size // 2,
                     head_size // 1.5
                 ))
-            elif self.dog_type == "柴犬":
+            elif dog_type == "柴犬":
                 pygame.draw.polygon(frame, color, [
                     (size[0] // 4 * 3, size[1] // 3 - head_size // 3),
                     (size[0] // 4 * 3 + head_size // 2, size[1] // 3 - head_size // 1.5),
@@ -165,20 +176,20 @@ class Animation:
             pygame.draw.circle(frame, color, (size[0] // 4 * 3, head_y), head_size // 2)
             
             # 耳（犬種ごとに異なる）
-            if self.dog_type == "コーギー":
+            if dog_type == "コーギー":
                 pygame.draw.polygon(frame, color, [
                     (size[0] // 4 * 3, head_y - head_size // 2),
                     (size[0] // 4 * 3 + head_size // 2, head_y - head_size),
                     (size[0] // 4 * 3 + head_size // 2, head_y - head_size // 2)
                 ])
-            elif self.dog_type == "ミニチュアダックスフンド":
+            elif dog_type == "ミニチュアダックスフンド":
                 pygame.draw.ellipse(frame, color, (
                     size[0] // 4 * 3 - head_size // 4,
                     head_y - head_size // 2,
                     head_size // 2,
                     head_size // 1.5
                 ))
-            elif self.dog_type == "柴犬":
+            elif dog_type == "柴犬":
                 pygame.draw.polygon(frame, color, [
                     (size[0] // 4 * 3, head_y - head_size // 3),
                     (size[0] // 4 * 3 + head_size // 2, head_y - head_size // 1.5),
@@ -211,18 +222,15 @@ class Animation:
             
             happy_frames.append(frame)
         
-        # アニメーションを登録
-        self.animations = {
+        return {
             "idle": idle_frames,
             "walk": walk_frames,
             "happy": happy_frames
         }
     
-    def update(self, current_time):
-        """アニメーションを更新"""
-        if current_time - self.last_update_time > self.animation_speed:
-            self.frame_index = (self.frame_index + 1) % len(self.animations[self.current_animation])
-            self.last_update_time = current_time
+    def advance(self):
+        """次のフレームに進める（ANIMATION_SPEEDごとにタイマーから呼ばれる）"""
+        self.frame_index = (self.frame_index + 1) % len(self.animations[self.current_animation])
     
     def set_animation(self, animation_name):
         """アニメーションを設定"""
@@ -0,0 +1,169 @@
+import time
+import asyncio
+import logging
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+class AsyncRunner:
+    # 自動保存の間隔（秒）
+    AUTOSAVE_INTERVAL = 5.0
+
+    # 音楽の状態を確認する間隔（秒）
+    MUSIC_CHECK_INTERVAL = 0.25
+
+    # メッセージの期限がない時に確認する間隔（秒）
+    MESSAGE_CHECK_INTERVAL = 0.25
+
+    def __init__(self, game):
+        """asyncioでゲームを動かすランナーの初期化"""
+        self.game = game
+        self.running = False
+
+        # ディスクへの書き込み（順番を守るため1スレッド）と、音声の処理用のスレッド
+        self.disk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk")
+        self.audio_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio")
+
+        # セーブデータの書き込みと削除はすべてディスク用のスレッドに順番に任せる
+        # （保存した後に死んだ犬のファイルが、削除の後に書き戻されないように）
+        game.game_state.save_manager.disk_writer = self.write_later
+
+        # 統計情報（タスク名 -> [実行回数, 合計時間, 最大時間]）
+        self.task_stats = {}
+
+        # シミュレーション、メッセージ、音楽は専用のタスクで行う
+        # （アニメーションとカーソルの点滅はフレームのタスクでタイマーから実行）
+        for name in ("simulation", "message", "music"):
+            game.timers.cancel(name)
+
+    def write_later(self, write, *args):
+        """ディスク用のスレッドで書き込む（失敗した場合はログに残す）"""
+        future = self.disk_executor.submit(write, *args)
+        future.add_done_callback(self.log_write_error)
+
+    def log_write_error(self, future):
+        """書き込みの例外をログに残す"""
+        error = future.exception()
+        if error is not None:
+            logger.error("Failed to write save data: %s", error, exc_info=error)
+
+    def record(self, name, start):
+        """タスクの1回分の実行時間を記録"""
+        elapsed = time.perf_counter() - start
+        stats = self.task_stats.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], elapsed)
+
+    async def run(self):
+        """すべてのタスクを開始して、ウィンドウが閉じられるまで実行する"""
+        self.running = True
+        tasks = [
+            asyncio.create_task(self.frame_loop(), name="frame"),
+            asyncio.create_task(self.simulation_loop(), name="simulation"),
+            asyncio.create_task(self.autosave_loop(), name="autosave"),
+            asyncio.create_task(self.message_loop(), name="message"),
+            asyncio.create_task(self.music_loop(), name="music")
+        ]
+
+        try:
+            # どれかのタスクが終わる（ウィンドウが閉じられる）か例外が出るまで待つ
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        finally:
+            self.running = False
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.shutdown()
+
+    async def shutdown(self):
+        """最後の保存と音楽の停止をワーカースレッドで行ってから終了する"""
+        loop = asyncio.get_running_loop()
+        game_state = self.game.game_state
+        game_state.save()
+        # それまでに頼んだ書き込みが終わるのを待ってから、その場で書き込むように戻す
+        await loop.run_in_executor(self.disk_executor, lambda: None)
+        game_state.save_manager.disk_writer = None
+        await loop.run_in_executor(self.audio_executor, self.game.music_manager.shutdown)
+        self.disk_executor.shutdown()
+        self.audio_executor.shutdown()
+
+        logger.info(self.report())
+        self.game.shutdown()
+
+    async def frame_loop(self):
+        """イベントの処理と描画"""
+        game = self.game
+        while self.running:
+            start = time.perf_counter()
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+                game.handle_event(event)
+
+            game.update_screen()
+            game.timers.advance(pygame.time.get_ticks())
+            game.render_frame()
+            self.record("frame", start)
+
+            await game.frame_scheduler.wait_async(game.timers.time_until_next(pygame.time.get_ticks()))
+
+    async def simulation_loop(self):
+        """一定間隔で犬のステータスを更新"""
+        game = self.game
+        while self.running:
+            await asyncio.sleep(game.update_interval)
+
+            start = time.perf_counter()
+            game.game_state.simulate()
+            game.last_update_time = time.time()
+            # ステータスが変わるので再描画
+            game.frame_scheduler.request_redraw()
+            self.record("simulation", start)
+
+    async def autosave_loop(self):
+        """一定間隔で犬を保存（保存データはここで作り、書き込みはディスク用のスレッドで行う）"""
+        game_state = self.game.game_state
+        while self.running:
+            await asyncio.sleep(self.AUTOSAVE_INTERVAL)
+
+            start = time.perf_counter()
+            game_state.save()
+            self.record("autosave", start)
+
+    async def message_loop(self):
+        """メッセージの表示時間が過ぎたら犬の様子に戻す"""
+        game = self.game
+        while self.running:
+            # 期限があればその時刻まで眠る（新しいメッセージに備えて長くは眠らない）
+            delay = self.MESSAGE_CHECK_INTERVAL
+            if game.game_state.message_timeout > 0:
+                delay = min(delay, max(0.0, game.game_state.message_timeout - time.time()))
+            await asyncio.sleep(delay)
+
+            start = time.perf_counter()
+            if game.game_state.expire_message():
+                game.frame_scheduler.request_redraw()
+            self.record("message", start)
+
+    async def music_loop(self):
+        """犬が死んだ時に音楽を切り替える（曲の切り替え自体はクロスフェード用のスレッドで行われる）"""
+        game = self.game
+        while self.running:
+            await asyncio.sleep(self.MUSIC_CHECK_INTERVAL)
+
+            start = time.perf_counter()
+            if game.state == "main_game":
+                game.update_main_game_music()
+            self.record("music", start)
+
+    def report(self):
+        """タスクごとの実行時間のレポートを文字列で取得"""
+        parts = []
+        for name, (count, total, longest) in self.task_stats.items():
+            average = total / count if count else 0.0
+            parts.append(f"{name} {count}x avg {average * 1000:.2f} ms max {longest * 1000:.2f} ms")
+        return "Async tasks: " + ", ".join(parts)
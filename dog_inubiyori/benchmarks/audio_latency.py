@@ -0,0 +1,58 @@
+"""オーディオのバッファサイズの設定ごとに、ミキサーの初期化時間と出力の遅れを計測する
+
+使い方: python benchmarks/audio_latency.py
+（音を出さずに実行する場合は SDL_AUDIODRIVER=dummy を指定）
+"""
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+from music_manager import MusicManager
+
+RUNS = 5
+
+def measure(profile, manifest_path):
+    """1つの設定でミキサーを初期化して (初期化時間, バッファの遅れ, 効果音を鳴らす時間) を返す"""
+    pygame.mixer.quit()
+    music_manager = MusicManager(manifest_path=manifest_path, audio_profile=profile)
+
+    start = time.perf_counter()
+    if not music_manager.init_audio():
+        return None
+    init_time = time.perf_counter() - start
+
+    # 効果音を鳴らす処理そのものにかかる時間（デコード済みの音を渡すだけ）
+    music_manager.preload_sfx()
+    start = time.perf_counter()
+    music_manager.play_sfx("feed")
+    play_time = time.perf_counter() - start
+
+    latency = music_manager.get_output_latency()
+    music_manager.shutdown()
+    return init_time, latency, play_time
+
+def main():
+    manifest_path = os.path.join(tempfile.gettempdir(), "inubiyori_benchmark_manifest.json")
+
+    print(f"{'profile':<14}{'buffer':>8}{'init ms (median)':>18}{'output latency ms':>19}{'play_sfx ms':>13}")
+    for profile, buffer in MusicManager.AUDIO_PROFILES.items():
+        results = [measure(profile, manifest_path) for _ in range(RUNS)]
+        results = [result for result in results if result is not None]
+        if not results:
+            print(f"{profile:<14}{buffer:>8}  audio unavailable")
+            continue
+
+        init_times = sorted(result[0] for result in results)
+        latency = results[0][1]
+        play_time = max(result[2] for result in results)
+        print(f"{profile:<14}{buffer:>8}{init_times[len(init_times) // 2] * 1000:>18.2f}"
+              f"{latency * 1000:>19.1f}{play_time * 1000:>13.3f}")
+
+    pygame.mixer.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""画面ごとの1フレームあたりの描画呼び出し回数を計測する
+
+使い方: python benchmarks/draw_calls.py
+（ウィンドウを開かずに実行する場合は SDL_VIDEODRIVER=dummy を指定）
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+from dog import Dog
+from ui import UI
+
+FRAMES = 200
+
+class DrawCounter:
+    def __init__(self):
+        """pygame.drawの関数を置き換えて呼び出し回数を数える"""
+        self.count = 0
+        self.originals = {}
+
+    def install(self):
+        for name in ("rect", "circle", "line", "lines", "polygon", "ellipse", "arc"):
+            original = getattr(pygame.draw, name)
+            self.originals[name] = original
+            setattr(pygame.draw, name, self.wrap(original))
+
+    def wrap(self, original):
+        def counted(*args, **kwargs):
+            self.count += 1
+            return original(*args, **kwargs)
+        return counted
+
+class FakeGameState:
+    message = "ポチはご飯を美味しそうに食べた！"
+
+def make_screens(ui):
+    """計測する画面の一覧（名前, 描画関数）"""
+    dog = Dog("柴犬", "ポチ")
+    dogs = []
+    for i in range(12):
+        other = Dog(["コーギー", "ミニチュアダックスフンド", "柴犬"][i % 3], f"犬{i}")
+        other.id = f"dog_{i}"
+        dogs.append(other)
+    graveyard = [{"name": f"犬{i}", "dog_type": "柴犬", "growth_stage": "成犬", "lifespan": 10 + i} for i in range(9)]
+    trainer_data = {
+        "trainer_level": 3, "trainer_exp": 120, "total_deaths": 2, "max_growth_stage": "成犬",
+        "dogs_raised": {"コーギー": 1, "ミニチュアダックスフンド": 2, "柴犬": 3},
+        "bonuses": {"feed_bonus": 1.1, "happiness_bonus": 1.0, "discipline_bonus": 1.05,
+                    "cleanliness_bonus": 1.0, "energy_bonus": 1.2}
+    }
+    return [
+        ("select_dog", lambda: ui.draw_dog_selection(["コーギー", "ミニチュアダックスフンド", "柴犬"])),
+        ("main_game", lambda: ui.draw_main_game(dog, FakeGameState())),
+        ("dog_management", lambda: ui.draw_dog_management(dogs)),
+        ("graveyard", lambda: ui.draw_graveyard(graveyard)),
+        ("trainer_info", lambda: ui.draw_trainer_info(trainer_data))
+    ]
+
+def main():
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((800, 600))
+    ui = UI(screen, 800, 600)
+    ui.setup_japanese_fonts()
+
+    counter = DrawCounter()
+    counter.install()
+
+    print(f"{'screen':<16}{'draw calls/frame':>18}{'panel blits/frame':>19}{'ms/frame':>10}")
+    for name, draw in make_screens(ui):
+        # 1回目はキャッシュの作成を含むので計測しない
+        draw()
+
+        panel_cache = getattr(ui, "panel_cache", None)
+        counter.count = 0
+        blits_before = panel_cache.blits if panel_cache else 0
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            draw()
+        elapsed = time.perf_counter() - start
+        blits = (panel_cache.blits - blits_before) if panel_cache else 0
+
+        print(f"{name:<16}{counter.count / FRAMES:>18.1f}{blits / FRAMES:>19.1f}{elapsed * 1000 / FRAMES:>10.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""ヘッドレスサーバーのAPIに複数のクライアントから同時にリクエストを送り、1秒あたりのリクエスト数と遅延を計測する
+
+使い方: python benchmarks/load_test.py [--clients 16] [--duration 10] [--url http://127.0.0.1:8080]
+--url を指定しない場合は、一時ディレクトリをセーブ先にしたサーバーをこのプロセスの中で起動する
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import threading
+import http.client
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from server import KennelServer, create_server
+
+DOG_TYPES = ["コーギー", "ミニチュアダックスフンド", "柴犬"]
+ACTIONS = ["feed", "walk", "train", "clean", "play"]
+
+# 状態の取得とお世話の割合（状態の取得の方が多い想定）
+READ_RATIO = 0.7
+
+def request(connection, method, path, body=None):
+    """1回のリクエストを送って (ステータスコード, レスポンスのJSON) を返す"""
+    payload = json.dumps(body).encode("utf-8") if body is not None else None
+    headers = {"Content-Type": "application/json"} if payload is not None else {}
+    connection.request(method, path, body=payload, headers=headers)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read().decode("utf-8"))
+
+def run_client(host, port, client_index, deadline, latencies, errors):
+    """1人のトレーナーとして犬を迎え、期限まで状態の取得とお世話を繰り返す"""
+    trainer_id = f"load_{client_index}"
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    rng = random.Random(client_index)
+
+    status, state = request(connection, "POST", f"/trainers/{trainer_id}/dogs",
+                            {"dog_type": rng.choice(DOG_TYPES), "name": f"犬{client_index}"})
+    if status != 201:
+        errors.append(status)
+        return
+    dog_id = state["current_dog_id"]
+
+    while time.perf_counter() < deadline:
+        if rng.random() < READ_RATIO:
+            method, path, body = "GET", f"/trainers/{trainer_id}", None
+        else:
+            method, path, body = "POST", f"/trainers/{trainer_id}/actions", {"action": rng.choice(ACTIONS), "dog_id": dog_id}
+
+        start = time.perf_counter()
+        try:
+            status, _ = request(connection, method, path, body)
+        except (OSError, http.client.HTTPException, ValueError):
+            errors.append("connection")
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+        # 犬が死んだ場合（409）もサーバーとしては正常な応答
+        if status >= 500:
+            errors.append(status)
+
+    connection.close()
+
+def percentile(sorted_values, fraction):
+    """並べ替え済みの値のパーセンタイル"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+def main():
+    parser = argparse.ArgumentParser(description="ヘッドレスサーバーの負荷テスト")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--url", help="既に起動しているサーバーのURL")
+    args = parser.parse_args()
+
+    kennel = httpd = temp_dir = None
+    if args.url:
+        url = urlparse(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        temp_dir = tempfile.mkdtemp(prefix="inubiyori_load_test_")
+        kennel = KennelServer(temp_dir)
+        kennel.start()
+        httpd = create_server(kennel, port=0)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        host, port = httpd.server_address
+
+    # クライアントごとにリストを分けて、記録でロックを取り合わないようにする
+    latencies = [[] for _ in range(args.clients)]
+    errors = [[] for _ in range(args.clients)]
+    start = time.perf_counter()
+    deadline = start + args.duration
+    threads = [threading.Thread(target=run_client, args=(host, port, i, deadline, latencies[i], errors[i]))
+               for i in range(args.clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    all_latencies = sorted(latency for client in latencies for latency in client)
+    error_count = sum(len(client) for client in errors)
+    print(f"{args.clients} clients, {elapsed:.1f}s: {len(all_latencies)} requests, {error_count} errors")
+    print(f"  {len(all_latencies) / elapsed:.0f} req/s")
+    print(f"  p50 {percentile(all_latencies, 0.50) * 1000:.2f} ms, "
+          f"p99 {percentile(all_latencies, 0.99) * 1000:.2f} ms, "
+          f"max {(all_latencies[-1] if all_latencies else 0.0) * 1000:.2f} ms")
+
+    if httpd is not None:
+        httpd.shutdown()
+        httpd.server_close()
+        kennel.shutdown()
+        print(f"  {kennel.report()}")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""起動してから最初のフレームを描画するまでの時間を、キャッシュなし（コールド）とあり（ウォーム）で計測する
+
+使い方: python benchmarks/warm_start.py
+（ウィンドウを開かずに実行する場合は SDL_VIDEODRIVER=dummy を指定）
+セーブデータとキャッシュは一時ディレクトリに作るので、普段のデータには影響しない
+"""
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+
+GAME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+RUNS = 3
+
+# 子プロセスで実行するスクリプト（最初のフレームを描画した時点で時間を出力して終了する）
+CHILD_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import main
+original_render = main.DogTamagotchi.render
+def render(self):
+    original_render(self)
+    print(time.perf_counter() - start)
+    sys.exit(0)
+main.DogTamagotchi.render = render
+main.DogTamagotchi().run()
+"""
+
+def time_to_first_frame(work_dir, cache_dir):
+    """ゲームを起動して最初のフレームまでの時間（秒）を取得"""
+    env = dict(os.environ, XDG_CACHE_HOME=cache_dir, INUBIYORI_SAVE_DIR=os.path.join(work_dir, "saves"))
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    result = subprocess.run([sys.executable, "-c", CHILD_SCRIPT, os.path.abspath(GAME_DIR)],
+                            cwd=work_dir, env=env, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+def main():
+    work_dir = tempfile.mkdtemp(prefix="inubiyori-bench-")
+    try:
+        cold = []
+        warm = []
+        for run in range(RUNS):
+            cache_dir = os.path.join(work_dir, f"cache{run}")
+            # 1回目はキャッシュが無い状態、2回目は1回目で保存したキャッシュを使う
+            cold.append(time_to_first_frame(work_dir, cache_dir))
+            warm.append(time_to_first_frame(work_dir, cache_dir))
+
+        print(f"{'start':<8}{'min ms':>10}{'median ms':>12}")
+        for name, times in (("cold", cold), ("warm", warm)):
+            times.sort()
+            print(f"{name:<8}{times[0] * 1000:>10.1f}{times[len(times) // 2] * 1000:>12.1f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
 import time  # 時間管理のためのインポート
 
 class Dog:
+    # 疲れていると断られるお世話（メソッド名）と、必要な元気度
+    MIN_ENERGY = {
+        "walk": 20,
+        "train": 15,
+        "play": 10
+    }
+    
     def __init__(self, dog_type, name=None, saved_data=None):
         self.dog_type = dog_type
         self.name = name if name else dog_type  # 初期値として犬種を名前にする
@@ -60,6 +67,10 @@ class Dog:
             self.growth_rate = 1.1  # やや早い成長速度
             self.max_lifespan = 28  # 最大寿命（日数）
     
+    def is_too_tired(self, action):
+        """元気度が足りずにお世話を断るかどうか（action はお世話のメソッド名）"""
+        return self.energy < self.MIN_ENERGY.get(action, 0)
+    
     def feed(self, trainer_bonuses=None):
         """ご飯をあげる"""
         if not self.is_alive:
@@ -83,7 +94,7 @@ class Dog:
         if not self.is_alive:
             return f"{self.name}はもういない..."
         
-        if self.energy < 20:
+        if self.is_too_tired("walk"):
             return f"{self.name}は疲れていて散歩に行きたがらない..."
         
         bonus = 1.0
@@ -106,7 +117,7 @@ class Dog:
         if not self.is_alive:
             return f"{self.name}はもういない..."
         
-        if self.energy < 15:
+        if self.is_too_tired("train"):
             return f"{self.name}は疲れていてしつけに集中できない..."
         
         bonus = 1.0
@@ -141,7 +152,7 @@ class Dog:
         if not self.is_alive:
             return f"{self.name}はもういない..."
         
-        if self.energy < 10:
+        if self.is_too_tired("play"):
             return f"{self.name}は疲れていて遊びたがらない..."
         
         bonus = 1.0
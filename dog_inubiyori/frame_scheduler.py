@@ -0,0 +1,167 @@
+import pygame
+import time
+import asyncio
+
+class FrameScheduler:
+    def __init__(self, active_fps=60, idle_fps=10, hover_grace_ms=300):
+        """フレームレートを状況に応じて切り替えるスケジューラーの初期化"""
+        # フレームレート設定
+        self.active_fps = active_fps  # アニメーション中のフレームレート
+        self.idle_fps = idle_fps      # 何も動いていない時のフレームレート
+
+        # 入力後にフルレートを維持する時間（ホバー効果の切り替え用）
+        self.hover_grace_ms = hover_grace_ms
+        self.active_until = 0
+
+        # ウィンドウの状態
+        self.minimized = False
+        self.focused = True
+
+        # 再描画が必要かどうか
+        self.redraw_requested = True
+
+        # 画面の一部だけを描き直す範囲（ホバー状態が変わったボタンなど）
+        self.redraw_rects = []
+
+        # 統計情報
+        self.start_time = time.perf_counter()
+        self.busy_time = 0.0
+        self.idle_time = 0.0
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+        self.partial_frames = 0
+        self.loop_start = time.perf_counter()
+
+    def handle_event(self, event):
+        """ウィンドウイベントと入力イベントを処理"""
+        if event.type == pygame.WINDOWMINIMIZED or event.type == pygame.WINDOWHIDDEN:
+            self.minimized = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED):
+            self.minimized = False
+            self.request_redraw()
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+            self.request_redraw()
+        elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                            pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.TEXTINPUT, pygame.TEXTEDITING):
+            # 入力があった場合はしばらくフルレートで描画
+            # （マウスの移動はホバー状態が変わった時だけ再描画を要求する）
+            self.mark_activity()
+
+    def mark_activity(self):
+        """入力などの活動を記録してフルレートに切り替える"""
+        self.active_until = pygame.time.get_ticks() + self.hover_grace_ms
+        self.redraw_requested = True
+
+    def request_redraw(self):
+        """次のフレームで再描画する"""
+        self.redraw_requested = True
+
+    def request_redraw_rects(self, rects):
+        """次のフレームで画面の一部だけを描き直す"""
+        self.redraw_rects.extend(rects)
+
+    def take_redraw_rects(self):
+        """描き直す範囲を取得（画面全体を描き直す場合はNone）"""
+        rects = self.redraw_rects
+        self.redraw_rects = []
+        if self.redraw_requested or self.is_active() or not rects:
+            return None
+        self.partial_frames += 1
+        return rects
+
+    def is_active(self):
+        """フルレートで描画すべきかどうか"""
+        return pygame.time.get_ticks() < self.active_until
+
+    def should_render(self):
+        """このフレームで描画すべきかどうか"""
+        # 最小化中やフォーカスがない場合は描画しない（シミュレーションは継続）
+        if self.minimized or not self.focused:
+            return False
+
+        return self.redraw_requested or bool(self.redraw_rects) or self.is_active()
+
+    def frame_done(self, rendered):
+        """フレームの描画結果を記録"""
+        if rendered:
+            self.frames_rendered += 1
+            self.redraw_requested = False
+        else:
+            self.frames_skipped += 1
+
+    def wait(self, clock, max_wait_ms=None):
+        """次のフレームまで待機する"""
+        now = time.perf_counter()
+        self.busy_time += now - self.loop_start
+
+        if self.is_active() and not self.minimized and self.focused:
+            # フルレート
+            clock.tick(self.active_fps)
+        elif self.minimized or not self.focused:
+            # 描画しない場合は次のイベントかシミュレーションの更新まで眠る
+            timeout = 1000 if max_wait_ms is None else max(1, int(max_wait_ms))
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.NOEVENT:
+                # 受け取ったイベントはメインループで処理するために戻す
+                pygame.event.post(event)
+            clock.tick()
+        elif max_wait_ms is not None and max_wait_ms < 1000 / self.idle_fps:
+            # 低レートの1フレームより先にタイマーの期限が来る場合はそこまで待つ
+            pygame.time.wait(max(0, int(max_wait_ms)))
+            clock.tick()
+        else:
+            # 低レート
+            clock.tick(self.idle_fps)
+
+        self.loop_start = time.perf_counter()
+        self.idle_time += self.loop_start - now
+
+    async def wait_async(self, max_wait_ms=None):
+        """次のフレームまで待機する（asyncio用。待っている間は他のタスクが動く）"""
+        now = time.perf_counter()
+        self.busy_time += now - self.loop_start
+
+        if self.minimized or not self.focused:
+            # 描画しない場合はイベントを確認する間隔だけ眠る
+            delay = 1.0 / self.idle_fps
+        else:
+            fps = self.active_fps if self.is_active() else self.idle_fps
+            delay = max(0.0, 1.0 / fps - (now - self.loop_start))
+        if max_wait_ms is not None:
+            delay = min(delay, max(0.0, max_wait_ms / 1000))
+        await asyncio.sleep(delay)
+
+        self.loop_start = time.perf_counter()
+        self.idle_time += self.loop_start - now
+
+    def get_stats(self):
+        """統計情報を取得"""
+        elapsed = max(time.perf_counter() - self.start_time, 1e-6)
+        frames = self.frames_rendered + self.frames_skipped
+
+        # フルレートで描画し続けた場合との比較
+        full_rate_frames = elapsed * self.active_fps
+        saved_frames = max(0.0, full_rate_frames - self.frames_rendered)
+
+        return {
+            "elapsed": elapsed,
+            "loops": frames,
+            "frames_rendered": self.frames_rendered,
+            "frames_skipped": self.frames_skipped,
+            "partial_frames": self.partial_frames,
+            "average_fps": self.frames_rendered / elapsed,
+            "busy_ratio": self.busy_time / elapsed,
+            "saved_frames_ratio": saved_frames / full_rate_frames if full_rate_frames > 0 else 0.0
+        }
+
+    def report(self):
+        """CPU削減効果のレポートを文字列で取得"""
+        stats = self.get_stats()
+        return (f"Frame scheduler: {stats['frames_rendered']} frames rendered in {stats['elapsed']:.1f}s "
+                f"(avg {stats['average_fps']:.1f} fps, {stats['frames_skipped']} skipped, "
+                f"{stats['partial_frames']} partial), "
+                f"CPU busy {stats['busy_ratio'] * 100:.1f}%, "
+                f"{stats['saved_frames_ratio'] * 100:.1f}% fewer frames than fixed {self.active_fps} fps")
@@ -0,0 +1,128 @@
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict, deque
+
+# ログのファイル出力先（F12でリングバッファの内容を書き出す）
+LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+class RateLimitFilter(logging.Filter):
+    def __init__(self, burst=3, interval=5.0, max_keys=256):
+        """同じメッセージの連続出力を制限するフィルタの初期化
+
+        同じ場所の同じメッセージ（引数は区別しない）は interval 秒ごとに burst 回まで通し、
+        それ以降は次の区間の最初のメッセージに抑制した件数を付けて出力する
+        """
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.max_keys = max_keys
+
+        # (ロガー名, レベル, メッセージの書式) -> [区間の開始時刻, 区間内の件数, 抑制した件数]
+        self.windows = OrderedDict()
+        self.lock = threading.Lock()
+
+        # 統計情報
+        self.suppressed = 0
+
+    def filter(self, record):
+        # 複数のハンドラで共有するので、同じレコードには最初の判定結果を使う
+        passed = getattr(record, "rate_limit_passed", None)
+        if passed is None:
+            passed = record.rate_limit_passed = self.check(record)
+        return passed
+
+    def check(self, record):
+        """レコードを通すかどうかを判定（複数のスレッドから呼ばれる）"""
+        key = (record.name, record.levelno, str(record.msg))
+
+        with self.lock:
+            now = time.monotonic()
+            window = self.windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window is not None else 0
+                self.windows[key] = [now, 1, 0]
+                self.windows.move_to_end(key)
+                if len(self.windows) > self.max_keys:
+                    self.windows.popitem(last=False)
+
+                if suppressed:
+                    record.msg = f"{record.msg} ({suppressed} similar messages suppressed)"
+                return True
+
+            window[1] += 1
+            if window[1] <= self.burst:
+                return True
+
+            window[2] += 1
+            self.suppressed += 1
+            return False
+
+class RingBufferHandler(logging.Handler):
+    def __init__(self, capacity=2000):
+        """直近のログを保持するハンドラの初期化（書式化は書き出す時だけ行う）"""
+        super().__init__(logging.DEBUG)
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def get_lines(self):
+        """保持しているログを文字列のリストで取得"""
+        return [self.format(record) for record in list(self.records)]
+
+    def dump(self, path):
+        """保持しているログをファイルに書き出す"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for line in self.get_lines():
+                f.write(line + "\n")
+        return path
+
+# setup_loggingで作成したリングバッファ
+ring_buffer = None
+
+def setup_logging(level=None, capacity=2000):
+    """ログの出力先を設定（何度呼んでも設定は一度だけ）
+
+    画面には level 以上（既定は環境変数 INUBIYORI_LOG_LEVEL か INFO）を出力し、
+    リングバッファにはDEBUG以上をすべて保持する
+    """
+    global ring_buffer
+    if ring_buffer is not None:
+        return ring_buffer
+
+    if level is None:
+        level = os.environ.get("INUBIYORI_LOG_LEVEL", "INFO").upper()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    # 画面とリングバッファで同じ制限を使う
+    rate_limit = RateLimitFilter()
+
+    console = logging.StreamHandler()
+    console.setLevel(level)
+    console.setFormatter(formatter)
+    console.addFilter(rate_limit)
+
+    ring_buffer = RingBufferHandler(capacity)
+    ring_buffer.setFormatter(formatter)
+    ring_buffer.addFilter(rate_limit)
+
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG)
+    root.addHandler(console)
+    root.addHandler(ring_buffer)
+    return ring_buffer
+
+def dump_log(path=None):
+    """リングバッファの内容をファイルに書き出してパスを返す"""
+    if ring_buffer is None:
+        return None
+
+    if path is None:
+        path = os.path.join(LOG_DIR, time.strftime("inubiyori-%Y%m%d-%H%M%S.log"))
+    return ring_buffer.dump(path)
@@ -3,7 +3,16 @@ from utils import SaveManager
 from dog import Dog
 
 class GameState:
-    def __init__(self):
+    # お世話の種類と犬のメソッド名
+    ACTION_METHODS = {
+        "ご飯をあげる": "feed",
+        "散歩にいく": "walk",
+        "しつけをする": "train",
+        "トイレを片付ける": "clean",
+        "おもちゃで遊ぶ": "play"
+    }
+    
+    def __init__(self, save_dir=None):
         self.dog = None  # 現在選択されている犬
         self.game_started = False
         self.last_update_time = 0
@@ -11,8 +20,11 @@ class GameState:
         self.actions = ["ご飯をあげる", "散歩にいく", "しつけをする", "トイレを片付ける", "おもちゃで遊ぶ"]
         self.message_timeout = 0
         
+        # 名前入力中の犬種
+        self.pending_dog_type = None
+        
         # セーブマネージャーの初期化
-        self.save_manager = SaveManager()
+        self.save_manager = SaveManager(save_dir)
         
         # トレーナーデータの読み込み
         self.trainer_data = self.save_manager.trainer_data
@@ -65,7 +77,12 @@ class GameState:
     
     def update(self):
         """ゲームの状態を更新する"""
-        # すべての犬を更新
+        self.simulate()
+        self.save()
+        self.expire_message()
+    
+    def simulate(self):
+        """すべての犬のステータスを更新する"""
         for dog in self.dogs:
             if dog.is_alive:
                 dog.update_status()
@@ -73,11 +90,17 @@ class GameState:
                 # 犬が死亡した場合
                 if not dog.is_alive:
                     self.handle_dog_death(dog)
-                else:
-                    # 生きている犬は保存
-                    self.save_manager.save_dog(dog.to_dict())
-        
-        current_time = time.time()
+    
+    def save(self):
+        """生きている犬を保存する"""
+        for dog in self.dogs:
+            if dog.is_alive:
+                self.save_manager.save_dog(dog.to_dict())
+    
+    def expire_message(self, current_time=None):
+        """表示時間が過ぎたメッセージを犬の様子に戻す（戻した場合はTrueを返す）"""
+        if current_time is None:
+            current_time = time.time()
         
         # 現在選択中の犬がいる場合
         if self.dog:
@@ -88,11 +111,13 @@ class GameState:
                 else:
                     self.message = f"{self.dog.name}はもういない..."
                 self.message_timeout = 0
+                return True
+        return False
     
     def perform_action(self, action):
-        """アクションを実行する"""
+        """アクションを実行する（お世話をした場合はTrue、疲れていて断られた場合や犬がいない場合はFalse）"""
         if not self.game_started or self.dog is None or not self.dog.is_alive:
-            return
+            return False
         
         # トレーナーボーナスを取得
         trainer_bonuses = self.save_manager.get_trainer_bonuses()
@@ -112,7 +137,12 @@ class GameState:
             # 犬のデータを保存
             if self.dog.is_alive:
                 self.save_manager.save_dog(self.dog.to_dict())
-            return
+            return True
+        
+        method = self.ACTION_METHODS.get(action)
+        if method is None:
+            return False
+        applied = not self.dog.is_too_tired(method)
         
         # 通常のアクション処理
         if action == "ご飯をあげる":
@@ -130,6 +160,7 @@ class GameState:
         
         # 犬のデータを保存
         self.save_manager.save_dog(self.dog.to_dict())
+        return applied
     
     def handle_dog_death(self, dog):
         """犬の死亡を処理する"""
@@ -149,6 +180,24 @@ class GameState:
         """新しい犬を追加するモードに移行"""
         self.state = "select_dog"
     
+    def begin_name_entry(self, dog_type):
+        """選んだ犬種の名前入力に移行"""
+        self.pending_dog_type = dog_type
+        self.state = "name_entry"
+    
+    def finish_name_entry(self, name):
+        """入力された名前で犬を作成してゲームを開始"""
+        dog_type = self.pending_dog_type
+        self.pending_dog_type = None
+        
+        # 入力が空の場合はデフォルト名（犬種）を使用
+        self.start_game(Dog(dog_type, name=name or dog_type))
+    
+    def cancel_name_entry(self):
+        """名前入力をやめて犬選択に戻る"""
+        self.pending_dog_type = None
+        self.state = "select_dog"
+    
     def show_dog_management(self):
         """犬管理画面を表示"""
         self.state = "dog_management"
@@ -0,0 +1,141 @@
+import calendar
+from datetime import datetime
+from bisect import bisect_left, bisect_right
+
+# 日付（YYYY-MM-DD） -> その日の0時の秒（同じ日のお墓が多いので日付ごとに一度だけ計算する）
+day_epochs = {}
+
+def to_epoch(value):
+    """"YYYY-MM-DD HH:MM:SS" かdatetimeを秒に変換（保存されている時刻をそのまま数えるのでタイムゾーンは考えない）"""
+    if isinstance(value, datetime):
+        return calendar.timegm(value.timetuple())
+
+    day = value[:10]
+    day_epoch = day_epochs.get(day)
+    if day_epoch is None:
+        day_epoch = day_epochs[day] = calendar.timegm((int(day[0:4]), int(day[5:7]), int(day[8:10]), 0, 0, 0))
+    return day_epoch + int(value[11:13]) * 3600 + int(value[14:16]) * 60 + int(value[17:19])
+
+class GraveyardIndex:
+    def __init__(self, graveyard=()):
+        """墓地の検索用のインデックスの初期化（お墓は墓地のリストでの位置で表す）"""
+        self.graves = []
+
+        # 亡くなった時刻の昇順に並べた時刻と位置（期間の検索に使う）
+        self.epochs = []
+        self.epoch_positions = []
+        # 位置 -> 時刻（他の条件の候補を期間で絞り込む時に使う）
+        self.position_epochs = []
+
+        # 犬種、成長段階 -> 位置のリスト（昇順）
+        self.breeds = {}
+        self.stages = {}
+
+        # 名前の前方一致の検索用のトライ木
+        # ノード: [子ノード（文字 -> ノード）, この名前のお墓の位置, 部分木のお墓の数]
+        self.trie = [{}, [], 0]
+
+        for grave in graveyard:
+            self.add(grave)
+
+    def __len__(self):
+        return len(self.graves)
+
+    def add(self, grave):
+        """お墓を1つ加える（墓地の末尾に追加されたお墓）"""
+        position = len(self.graves)
+        self.graves.append(grave)
+
+        # 普通は時刻の順に追加されるので末尾に足すだけ
+        epoch = to_epoch(grave["death_date"])
+        self.position_epochs.append(epoch)
+        if not self.epochs or epoch >= self.epochs[-1]:
+            self.epochs.append(epoch)
+            self.epoch_positions.append(position)
+        else:
+            index = bisect_right(self.epochs, epoch)
+            self.epochs.insert(index, epoch)
+            self.epoch_positions.insert(index, position)
+
+        self.breeds.setdefault(grave["dog_type"], []).append(position)
+        self.stages.setdefault(grave["growth_stage"], []).append(position)
+
+        node = self.trie
+        node[2] += 1
+        for char in grave["name"]:
+            child = node[0].get(char)
+            if child is None:
+                child = node[0][char] = [{}, [], 0]
+            node = child
+            node[2] += 1
+        node[1].append(position)
+
+    def find_prefix_node(self, prefix):
+        """名前の前方一致のノードを取得（無い場合はNone）"""
+        node = self.trie
+        for char in prefix:
+            node = node[0].get(char)
+            if node is None:
+                return None
+        return node
+
+    def collect_prefix(self, node):
+        """ノードの部分木にあるお墓の位置を集める"""
+        positions = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            positions.extend(node[1])
+            stack.extend(node[0].values())
+        return positions
+
+    def query(self, dog_type=None, stage=None, start=None, end=None, name_prefix=None):
+        """条件に合うお墓の位置を墓地の順で取得（Noneの条件は使わない）
+
+        start, end: 亡くなった時刻の範囲（秒、start以上end未満）
+        最も候補が少ない条件のインデックスから候補を取り出し、残りの条件はお墓ごとに確かめる
+        """
+        if dog_type is None and stage is None and start is None and end is None and not name_prefix:
+            return range(len(self.graves))
+
+        # 条件ごとの候補の数と、候補を取り出す関数
+        candidates = []
+        if dog_type is not None:
+            positions = self.breeds.get(dog_type, [])
+            candidates.append((len(positions), lambda positions=positions: positions))
+        if stage is not None:
+            positions = self.stages.get(stage, [])
+            candidates.append((len(positions), lambda positions=positions: positions))
+        if start is not None or end is not None:
+            low = bisect_left(self.epochs, start) if start is not None else 0
+            high = bisect_left(self.epochs, end) if end is not None else len(self.epochs)
+            high = max(low, high)
+            candidates.append((high - low, lambda low=low, high=high: sorted(self.epoch_positions[low:high])))
+        if name_prefix:
+            node = self.find_prefix_node(name_prefix)
+            count = node[2] if node is not None else 0
+            candidates.append((count, lambda node=node: sorted(self.collect_prefix(node)) if node else []))
+
+        count, get_positions = min(candidates, key=lambda candidate: candidate[0])
+        if count == 0:
+            return []
+        if len(candidates) == 1:
+            # 条件が1つだけなら候補がそのまま結果
+            return list(get_positions())
+
+        graves = self.graves
+        result = []
+        for position in get_positions():
+            grave = graves[position]
+            if dog_type is not None and grave["dog_type"] != dog_type:
+                continue
+            if stage is not None and grave["growth_stage"] != stage:
+                continue
+            if start is not None or end is not None:
+                epoch = self.position_epochs[position]
+                if (start is not None and epoch < start) or (end is not None and epoch >= end):
+                    continue
+            if name_prefix and not grave["name"].startswith(name_prefix):
+                continue
+            result.append(position)
+        return result
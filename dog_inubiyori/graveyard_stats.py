@@ -0,0 +1,116 @@
+import os
+import json
+import math
+import logging
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+class GraveyardStats:
+    # 保存形式のバージョン（形式を変えた場合は上げる）
+    VERSION = 1
+
+    def __init__(self):
+        """墓地の統計情報の初期化（お墓が1つ増えるごとに add で更新する）"""
+        # 犬種 -> [匹数, 寿命の平均, 平均との差の2乗の合計]（Welfordの方法で1件ずつ更新）
+        self.breeds = {}
+        # 成長段階 -> 匹数
+        self.stages = {}
+        # 日付（YYYY-MM-DD） -> 匹数
+        self.days = {}
+        # お墓の数（保存した統計と墓地が対応しているかの確認用）
+        self.count = 0
+
+    def add(self, grave):
+        """お墓を1つ加える"""
+        self.count += 1
+
+        breed = self.breeds.setdefault(grave["dog_type"], [0, 0.0, 0.0])
+        breed[0] += 1
+        delta = grave["lifespan"] - breed[1]
+        breed[1] += delta / breed[0]
+        breed[2] += delta * (grave["lifespan"] - breed[1])
+
+        stage = grave["growth_stage"]
+        self.stages[stage] = self.stages.get(stage, 0) + 1
+
+        # death_dateは "YYYY-MM-DD HH:MM:SS" なので先頭が日付
+        day = grave["death_date"][:10]
+        self.days[day] = self.days.get(day, 0) + 1
+
+    @classmethod
+    def rebuild(cls, graves):
+        """お墓を1回だけ順に読んで統計を作り直す（graves はジェネレーターでもよい）"""
+        stats = cls()
+        for grave in graves:
+            stats.add(grave)
+        return stats
+
+    def get_lifespan(self, dog_type):
+        """犬種ごとの (匹数, 寿命の平均, 寿命の標準偏差)"""
+        count, mean, m2 = self.breeds.get(dog_type, (0, 0.0, 0.0))
+        std = math.sqrt(m2 / count) if count > 0 else 0.0
+        return count, mean, std
+
+    def get_stage_count(self, stage):
+        """成長段階ごとの匹数"""
+        return self.stages.get(stage, 0)
+
+    def get_recent_deaths(self, days=7, today=None):
+        """直近 days 日（今日を含む）に亡くなった匹数"""
+        if today is None:
+            today = datetime.now().date()
+        return sum(self.days.get((today - timedelta(days=offset)).strftime("%Y-%m-%d"), 0)
+                   for offset in range(days))
+
+    def to_dict(self):
+        """保存用の辞書"""
+        return {
+            "version": self.VERSION,
+            "count": self.count,
+            "breeds": self.breeds,
+            "stages": self.stages,
+            "days": self.days
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """保存した辞書から復元"""
+        stats = cls()
+        stats.count = data["count"]
+        stats.breeds = {breed: list(values) for breed, values in data["breeds"].items()}
+        stats.stages = dict(data["stages"])
+        stats.days = dict(data["days"])
+        return stats
+
+    @classmethod
+    def load(cls, path, expected_count):
+        """保存した統計を読み込む（無い場合や墓地のお墓の数と合わない場合はNone）"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != cls.VERSION or data.get("count") != expected_count:
+                logger.debug("Graveyard stats are stale: %s", path)
+                return None
+            return cls.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Ignoring graveyard stats %s: %s", path, e)
+            return None
+
+    def dumps(self):
+        """保存用のJSONの文字列（別スレッドで保存する時は先に作っておく）"""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    def save(self, path):
+        """統計を保存する"""
+        self.write(path, self.dumps())
+
+    @staticmethod
+    def write(path, text):
+        """dumps で作った統計を保存する（書き込み途中のファイルを読まないように一時ファイルから置き換える）"""
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
@@ -0,0 +1,232 @@
+"""犬舎（トレーナー、犬、墓地）をgzipで圧縮したJSON Linesのアーカイブに書き出し、読み込む
+
+使い方:
+  python kennel_archive.py export kennel.jsonl.gz [--trainer ID | --save-dir DIR]
+  python kennel_archive.py import kennel.jsonl.gz [--trainer ID | --save-dir DIR] [--overwrite]
+
+記録は1件ずつ読み書きするので、犬舎の大きさによらず使うメモリは一定
+アーカイブの1行が1件の記録で、先頭がheader、最後がfooter（件数の確認用）
+"""
+import os
+import gzip
+import json
+import time
+import shutil
+import argparse
+from utils import SaveManager
+from graveyard_stats import GraveyardStats
+
+# アーカイブの形式のバージョン
+ARCHIVE_VERSION = 1
+
+# まとめて書き込む記録の数
+CHUNK_SIZE = 1000
+
+def iter_kennel_records(save_manager, counts):
+    """犬舎の記録を1件ずつ作る（header、trainer、dog、grave、footerの順、種類ごとの件数を counts に数える）"""
+    yield {"type": "header", "version": ARCHIVE_VERSION, "created": time.strftime("%Y-%m-%d %H:%M:%S")}
+
+    counts.update(trainer=0, dog=0, grave=0)
+    if os.path.exists(save_manager.trainer_file):
+        yield {"type": "trainer", "data": save_manager.load_trainer_data()}
+        counts["trainer"] += 1
+
+    for dog_data in save_manager.iter_dogs():
+        yield {"type": "dog", "data": dog_data}
+        counts["dog"] += 1
+
+    for grave in save_manager.iter_graveyard():
+        yield {"type": "grave", "data": grave}
+        counts["grave"] += 1
+
+    yield {"type": "footer", "counts": counts}
+
+def iter_chunks(records, chunk_size=CHUNK_SIZE):
+    """記録をJSON Linesにして chunk_size 件ずつまとめる"""
+    lines = []
+    for record in records:
+        lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        if len(lines) >= chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+def iter_archive(path):
+    """アーカイブの記録を1件ずつ読み込む"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: {e}") from None
+
+def export_kennel(save_dir, path):
+    """犬舎をアーカイブに書き出して統計情報を返す"""
+    if not SaveManager.has_save_data(save_dir):
+        raise FileNotFoundError(f"no save data in {save_dir}")
+    save_manager = SaveManager(save_dir, load=False)
+
+    start = time.perf_counter()
+    counts = {}
+
+    # 書き込み途中のファイルを残さないように一時ファイルから置き換える
+    temp_path = path + ".tmp"
+    with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+        for chunk in iter_chunks(iter_kennel_records(save_manager, counts)):
+            f.write(chunk)
+    os.replace(temp_path, path)
+
+    # headerとfooterも1件ずつ数える
+    return make_stats(sum(counts.values()) + 2, counts, path, start)
+
+def import_kennel(path, save_dir, overwrite=False):
+    """アーカイブから犬舎を読み込んで統計情報を返す
+
+    読み込み先に既にセーブデータがある場合は overwrite=True の時だけ置き換える
+    （アーカイブにトレーナーの記録がない場合、トレーナーデータは初期状態に戻す）
+    すべて一時的な場所に書き込み、アーカイブを最後まで読めた時だけ置き換える
+    """
+    save_manager = SaveManager(save_dir, load=False)
+    if not overwrite and has_kennel_data(save_manager):
+        raise FileExistsError(f"save data already exists in {save_dir} (use overwrite to replace it)")
+
+    staging_dogs_dir = save_manager.dogs_dir + ".importing"
+    staging_graveyard_file = save_manager.graveyard_file + ".importing"
+    staging_trainer_file = save_manager.trainer_file + ".importing"
+    staging_stats_file = save_manager.graveyard_stats_file + ".importing"
+    # 置き換える前の犬のディレクトリ（置き換えに失敗したら戻す）
+    replaced_dogs_dir = save_manager.dogs_dir + ".replaced"
+    shutil.rmtree(staging_dogs_dir, ignore_errors=True)
+    os.makedirs(staging_dogs_dir)
+
+    start = time.perf_counter()
+    records = 0
+    counts = {"trainer": 0, "dog": 0, "grave": 0}
+    trainer_data = None
+    footer = None
+    # 墓地の統計情報も読み込みながら作る
+    graveyard_stats = GraveyardStats()
+
+    try:
+        with open(staging_graveyard_file, "w", encoding="utf-8") as graveyard:
+            # 墓地は1件ずつJSONの配列として書き込む
+            graveyard.write("[")
+            for record in iter_archive(path):
+                records += 1
+                record_type = record.get("type")
+                if records == 1:
+                    if record_type != "header" or record.get("version") != ARCHIVE_VERSION:
+                        raise ValueError(f"not a kennel archive (version {ARCHIVE_VERSION}): {path}")
+                    continue
+                if footer is not None:
+                    raise ValueError(f"records after the footer: {path}")
+
+                if record_type == "trainer":
+                    trainer_data = record["data"]
+                elif record_type == "dog":
+                    dog_data = dict(record["data"])
+                    dog_id = str(dog_data.pop("id"))
+                    # IDはファイル名になるので、ディレクトリを含むものは受け付けない
+                    if not dog_id or os.path.basename(dog_id) != dog_id or dog_id.startswith("."):
+                        raise ValueError(f"invalid dog id: {dog_id!r}")
+                    save_manager.write_dog_file(dog_id, dog_data, staging_dogs_dir)
+                elif record_type == "grave":
+                    if counts["grave"]:
+                        graveyard.write(",")
+                    graveyard.write("\n  " + json.dumps(record["data"], ensure_ascii=False))
+                    graveyard_stats.add(record["data"])
+                elif record_type == "footer":
+                    footer = record
+                    continue
+                else:
+                    raise ValueError(f"unknown record type: {record_type!r}")
+                counts[record_type] += 1
+            graveyard.write("\n]\n")
+
+        # 途中で切れたアーカイブを読み込まないように件数を確かめる
+        if footer is None or footer.get("counts") != counts:
+            raise ValueError(f"archive is truncated or corrupt: {path}")
+
+        # 前のトレーナーデータを残さないように、記録がない場合は初期状態で書き込む
+        if trainer_data is None:
+            trainer_data = SaveManager.default_trainer_data()
+        save_manager.write_text_file(staging_trainer_file, json.dumps(trainer_data, ensure_ascii=False, indent=2))
+        GraveyardStats.write(staging_stats_file, graveyard_stats.dumps())
+
+        # 先に犬のディレクトリを入れ替え（失敗したら元に戻す）、その後でファイルを置き換える
+        shutil.rmtree(replaced_dogs_dir, ignore_errors=True)
+        os.replace(save_manager.dogs_dir, replaced_dogs_dir)
+        try:
+            os.replace(staging_dogs_dir, save_manager.dogs_dir)
+        except OSError:
+            os.replace(replaced_dogs_dir, save_manager.dogs_dir)
+            raise
+        os.replace(staging_trainer_file, save_manager.trainer_file)
+        os.replace(staging_graveyard_file, save_manager.graveyard_file)
+        os.replace(staging_stats_file, save_manager.graveyard_stats_file)
+        shutil.rmtree(replaced_dogs_dir)
+    finally:
+        shutil.rmtree(staging_dogs_dir, ignore_errors=True)
+        for staging_file in (staging_graveyard_file, staging_trainer_file, staging_stats_file):
+            if os.path.exists(staging_file):
+                os.remove(staging_file)
+
+    return make_stats(records, counts, path, start)
+
+def has_kennel_data(save_manager):
+    """トレーナー、墓地、犬のどれかのデータがあるかどうか"""
+    if os.path.exists(save_manager.trainer_file) or os.path.exists(save_manager.graveyard_file):
+        return True
+    return next(save_manager.iter_dogs(), None) is not None
+
+def make_stats(records, counts, path, start):
+    """エクスポートとインポートの統計情報"""
+    elapsed = time.perf_counter() - start
+    return {
+        "records": records,
+        "counts": counts,
+        "bytes": os.path.getsize(path),
+        "seconds": elapsed,
+        "records_per_second": records / elapsed if elapsed > 0 else 0.0
+    }
+
+def format_stats(name, stats):
+    """統計情報を1行の文字列にする"""
+    counts = stats["counts"]
+    return (f"{name}: {stats['records']} records ({counts.get('dog', 0)} dogs, {counts.get('grave', 0)} graves) "
+            f"in {stats['seconds']:.2f}s, {stats['records_per_second']:.0f} records/s, "
+            f"{stats['bytes'] / 1024:.1f} KiB compressed")
+
+def main():
+    parser = argparse.ArgumentParser(description="犬舎のエクスポートとインポート")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("archive", help="アーカイブのファイル（.jsonl.gz）")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--trainer", help="トレーナーID（saves/trainers/<ID>/ を使う）")
+    target.add_argument("--save-dir", help="セーブデータのディレクトリ（省略時は saves/）")
+    parser.add_argument("--overwrite", action="store_true", help="インポート先のセーブデータを置き換える")
+    args = parser.parse_args()
+
+    if args.trainer is not None:
+        if not SaveManager.is_valid_trainer_id(args.trainer):
+            parser.error("trainer id may only contain letters, digits, '_' and '-'")
+        save_dir = SaveManager.get_trainer_save_dir(args.trainer)
+    else:
+        save_dir = os.path.abspath(args.save_dir) if args.save_dir else SaveManager.SAVES_DIR
+
+    try:
+        if args.command == "export":
+            stats = export_kennel(save_dir, args.archive)
+        else:
+            stats = import_kennel(args.archive, save_dir, args.overwrite)
+    except (OSError, ValueError, KeyError) as e:
+        parser.exit(1, f"{args.command} failed: {e}\n")
+
+    print(format_stats(args.command, stats))
+
+if __name__ == "__main__":
+    main()
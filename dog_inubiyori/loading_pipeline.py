@@ -0,0 +1,78 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class LoadingPipeline:
+    def __init__(self, max_workers=4):
+        """ローディング処理のパイプラインの初期化"""
+        self.max_workers = max_workers
+
+        # 登録されたタスク（名前, 関数, 重み）
+        self.tasks = []
+
+        # 実行中のタスク
+        self.futures = {}
+        self.executor = None
+
+        # 完了したタスクの重みと所要時間
+        self.completed_weight = 0.0
+        self.task_times = {}
+        self.lock = threading.Lock()
+
+        self.start_time = None
+        self.end_time = None
+
+    def add_task(self, name, func, weight=1.0):
+        """タスクを追加"""
+        self.tasks.append((name, func, weight))
+
+    def start(self):
+        """すべてのタスクをワーカースレッドで開始"""
+        self.start_time = time.perf_counter()
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="loading")
+
+        for name, func, weight in self.tasks:
+            self.futures[name] = self.executor.submit(self.run_task, name, func, weight)
+
+    def run_task(self, name, func, weight):
+        """タスクを実行して進捗を記録"""
+        task_start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            with self.lock:
+                self.completed_weight += weight
+                self.task_times[name] = time.perf_counter() - task_start
+
+    def get_progress(self):
+        """進捗を取得（0.0 ~ 1.0）"""
+        total_weight = sum(weight for _, _, weight in self.tasks)
+        if total_weight <= 0:
+            return 1.0
+
+        with self.lock:
+            return min(1.0, self.completed_weight / total_weight)
+
+    def is_done(self):
+        """すべてのタスクが完了したかどうか"""
+        done = all(future.done() for future in self.futures.values())
+        if done and self.end_time is None:
+            self.end_time = time.perf_counter()
+            self.executor.shutdown(wait=False)
+        return done
+
+    def get_result(self, name):
+        """タスクの結果を取得（タスクで発生した例外はここで送出される）"""
+        return self.futures[name].result()
+
+    def get_failures(self):
+        """失敗したタスクの名前と例外の一覧（すべてのタスクが完了してから呼ぶ）"""
+        return [(name, future.exception()) for name, future in self.futures.items()
+                if future.exception() is not None]
+
+    def get_elapsed(self):
+        """ローディングにかかった時間（秒）"""
+        if self.start_time is None:
+            return 0.0
+        end_time = self.end_time if self.end_time is not None else time.perf_counter()
+        return end_time - self.start_time
@@ -0,0 +1,200 @@
+import pygame
+
+class Localization:
+    # 固定の文字列（日本語 -> 英語）
+    STRINGS = {
+        # 画面のタイトルとラベル
+        "あなたの犬を選んでください": "Choose your dog",
+        "ロード中...": "Loading...",
+        "新しい犬を選ぶ": "Choose a new dog",
+        "戻る": "Back",
+        "犬の墓地": "Dog Graveyard",
+        "まだ墓地はありません": "No graves yet",
+        "条件に合うお墓はありません": "No graves match the filters",
+        "すべて": "All",
+        "今日": "Today",
+        "トレーナー": "Trainer Info",
+        "トレーナーボーナス": "Trainer Bonuses",
+        "音量:": "Volume:",
+        "飼っている犬": "Your Dogs",
+        "まだ犬を飼っていません": "You don't have any dogs yet",
+        "新しい犬を追加": "Add New Dog",
+        "犬の名前を入力してください": "Enter dog name",
+        "Enterキーで確定 (最大10文字)": "Press Enter to confirm (max 10 chars)",
+        "墓地を見る": "Graveyard",
+
+        # ステータス
+        "満腹度": "Hunger",
+        "幸福度": "Happiness",
+        "しつけ度": "Discipline",
+        "清潔度": "Cleanliness",
+        "元気度": "Energy",
+        "健康度": "Health",
+
+        # お世話アクション
+        "ご飯をあげる": "Feed",
+        "散歩にいく": "Walk",
+        "しつけをする": "Train",
+        "トイレを片付ける": "Clean",
+        "おもちゃで遊ぶ": "Play",
+
+        # 成長段階
+        "子犬": "Puppy",
+        "成犬": "Adult",
+        "老犬": "Senior",
+
+        # 気分
+        "とても幸せ": "Very Happy",
+        "幸せ": "Happy",
+        "普通": "Normal",
+        "不満": "Unsatisfied",
+        "不機嫌": "Grumpy",
+        "病気": "Sick",
+        "死亡": "Dead",
+
+        # トレーナーボーナス
+        "ご飯効果": "Feed Effect",
+        "幸福度効果": "Happiness Effect",
+        "しつけ効果": "Discipline Effect",
+        "清潔度効果": "Cleanliness Effect",
+        "元気度効果": "Energy Effect"
+    }
+
+    # 犬種の表示名（日本語は短い名前, 英語）
+    DOG_TYPE_NAMES = {
+        "コーギー": ("コーギー", "Corgi"),
+        "ミニチュアダックスフンド": ("ダックス", "Dachshund"),
+        "柴犬": ("柴犬", "Shiba")
+    }
+
+    # トレーナーボーナスの表示名
+    BONUS_NAMES = {
+        "feed_bonus": "ご飯効果",
+        "happiness_bonus": "幸福度効果",
+        "discipline_bonus": "しつけ効果",
+        "cleanliness_bonus": "清潔度効果",
+        "energy_bonus": "元気度効果"
+    }
+
+    # 値を埋め込む文字列（日本語, 英語）
+    TEMPLATES = {
+        "dog_title": ("{name} ({dog_type})", "{name} ({dog_type})"),
+        "dog_type_label": ("犬種: {dog_type}", "Dog type: {dog_type}"),
+        "growth_stage": ("成長段階: {stage}", "Growth: {stage}"),
+        "growth": ("成長: {stage}", "Growth: {stage}"),
+        "lifespan_days": ("生存日数: {days}日", "Days: {days}"),
+        "days": ("{days}日", "{days} days"),
+        "grave_info": ("{dog_type} ({stage})", "{dog_type} ({stage})"),
+        "filter_breed": ("犬種: {value}", "Breed: {value}"),
+        "filter_stage": ("成長: {value}", "Growth: {value}"),
+        "filter_period": ("期間: {value}", "Period: {value}"),
+        "filter_name": ("名前: {value}", "Name: {value}"),
+        "recent_days": ("直近{days}日", "Last {days} days"),
+        "result_count": ("{count}件", "{count} graves"),
+        "trainer_level": ("トレーナーレベル: {level}", "Trainer Level: {level}"),
+        "exp": ("経験値: {exp} / {max_exp}", "EXP: {exp} / {max_exp}"),
+        "total_dogs": ("育てた犬の総数: {count}", "Total Dogs Raised: {count}"),
+        "dogs_raised": ("{dog_type}: {count}匹", "{dog_type}: {count}"),
+        "dogs_raised_lifespan": ("{dog_type}: {count}匹（平均寿命 {mean:.1f}日 ±{std:.1f}）",
+                                 "{dog_type}: {count} (avg life {mean:.1f} ±{std:.1f} days)"),
+        "total_deaths": ("死亡回数: {count}", "Total Deaths: {count}"),
+        "total_deaths_stages": ("死亡回数: {count}（{puppy} {puppy_count} / {adult} {adult_count} / {senior} {senior_count}）",
+                                "Total Deaths: {count} ({puppy} {puppy_count} / {adult} {adult_count} / {senior} {senior_count})"),
+        "max_growth": ("最大成長段階: {stage}", "Max Growth Stage: {stage}"),
+        "max_growth_recent": ("最大成長段階: {stage}　直近7日: {recent}匹", "Max Growth Stage: {stage}  Last 7 days: {recent}"),
+        "bonus": ("{name}: x{value:.2f}", "{name}: x{value:.2f}")
+    }
+
+    # ゲームメッセージの英語変換（部分一致で置き換える）
+    MESSAGE_MAP = {
+        "犬を選んでください": "Please select a dog",
+        "もういない": "is gone",
+        "永遠の眠りについた": "has passed away",
+        "ご飯を美味しそうに食べた": "ate the food happily",
+        "楽しく散歩した": "enjoyed the walk",
+        "しつけを頑張った": "trained well",
+        "トイレをきれいに片付けた": "toilet is clean now",
+        "おもちゃで楽しく遊んだ": "played with toys happily",
+        "疲れていて散歩に行きたがらない": "is too tired to walk",
+        "疲れていてしつけに集中できない": "is too tired to train",
+        "疲れていて遊びたがらない": "is too tired to play",
+        "とても幸せ": "very happy",
+        "幸せ": "happy",
+        "普通": "normal",
+        "不満": "unsatisfied",
+        "不機嫌": "grumpy",
+        "病気": "sick"
+    }
+
+    # 翻訳済みメッセージのキャッシュの最大数
+    MESSAGE_CACHE_SIZE = 64
+
+    def __init__(self, use_japanese):
+        """表示言語を決めて文字列表を解決する"""
+        self.use_japanese = use_japanese
+        language = 0 if use_japanese else 1
+
+        # 表示する文字列を一度だけ解決しておく
+        if use_japanese:
+            self.strings = {text: text for text in self.STRINGS}
+        else:
+            self.strings = dict(self.STRINGS)
+        self.dog_type_names = {dog_type: names[language] for dog_type, names in self.DOG_TYPE_NAMES.items()}
+        self.templates = {key: texts[language] for key, texts in self.TEMPLATES.items()}
+        self.bonus_names = {key: self.strings[name] for key, name in self.BONUS_NAMES.items()}
+
+        # 翻訳済みのゲームメッセージ
+        self.message_cache = {}
+
+    @staticmethod
+    def can_render_japanese(font, sample="犬"):
+        """フォントで日本語を表示できるかどうかを調べる"""
+        if font is None:
+            return False
+
+        try:
+            # グリフがない文字は「豆腐」になるので、存在しない文字の描画結果と比べる
+            glyph = font.render(sample, True, (0, 0, 0))
+            missing = font.render("￿", True, (0, 0, 0))
+        except pygame.error:
+            return False
+
+        if glyph.get_size() != missing.get_size():
+            return True
+        return pygame.image.tobytes(glyph, "RGBA") != pygame.image.tobytes(missing, "RGBA")
+
+    def text(self, text):
+        """固定の文字列を表示言語に変換"""
+        return self.strings.get(text, text)
+
+    def dog_type(self, dog_type, short=True):
+        """犬種の表示名を取得"""
+        if short or not self.use_japanese:
+            return self.dog_type_names.get(dog_type, dog_type)
+        return dog_type
+
+    def bonus(self, bonus_name):
+        """トレーナーボーナスの表示名を取得"""
+        return self.bonus_names.get(bonus_name, bonus_name)
+
+    def format(self, key, **values):
+        """値を埋め込んだ文字列を取得"""
+        return self.templates[key].format(**values)
+
+    def message(self, message):
+        """ゲームメッセージを表示言語に変換"""
+        if self.use_japanese:
+            return message
+
+        translated = self.message_cache.get(message)
+        if translated is None:
+            translated = message
+            for jp, eng in self.MESSAGE_MAP.items():
+                if jp in translated:
+                    translated = translated.replace(jp, eng)
+
+            if len(self.message_cache) >= self.MESSAGE_CACHE_SIZE:
+                self.message_cache.clear()
+            self.message_cache[message] = translated
+
+        return translated
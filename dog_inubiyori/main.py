@@ -1,44 +1,108 @@
 import pygame
 import sys
 import os
-import platform
 import time
+import asyncio
+import logging
+import argparse
+from datetime import datetime, timedelta
+import game_logging
 from game_state import GameState
 from dog import Dog
 from ui import UI
 from utils import Utils, SaveManager
 from music_manager import MusicManager
+from frame_scheduler import FrameScheduler
+from loading_pipeline import LoadingPipeline
+from screen_state_machine import ScreenStateMachine
+from async_runner import AsyncRunner
+from timer_wheel import TimerWheel
+from animation import Animation
+
+logger = logging.getLogger(__name__)
 
 class DogTamagotchi:
-    def __init__(self):
-        pygame.init()
+    # 犬の名前の最大文字数
+    MAX_NAME_LENGTH = 10
+    
+    # 墓地の絞り込みで切り替える成長段階と期間（直近の日数）
+    GROWTH_STAGES = ("子犬", "成犬", "老犬")
+    GRAVEYARD_PERIODS = (1, 7, 30)
+    
+    # 定期処理の間隔（ミリ秒）
+    MESSAGE_CHECK_INTERVAL = 100   # メッセージの表示時間の確認
+    MUSIC_CHECK_INTERVAL = 250     # 犬の状態に合わせた音楽の確認
+    CURSOR_BLINK_INTERVAL = 500    # 名前入力のカーソルの点滅
+    
+    # お世話アクションの効果音
+    ACTION_SOUNDS = {
+        "ご飯をあげる": "feed",
+        "散歩にいく": "walk",
+        "しつけをする": "train",
+        "トイレを片付ける": "clean",
+        "おもちゃで遊ぶ": "play"
+    }
+    
+    def __init__(self, trainer_id=None):
+        # ログの出力先（F12で直近のログをファイルに書き出せる）
+        game_logging.setup_logging()
+        
+        # セーブデータの場所（トレーナーIDを指定した場合はトレーナーごとのディレクトリ）
+        self.save_dir = SaveManager.get_trainer_save_dir(trainer_id) if trainer_id else None
+        if self.save_dir is None and not os.environ.get("INUBIYORI_SAVE_DIR"):
+            # 以前のバージョンの場所にあるセーブデータを移す（一度だけ）
+            try:
+                SaveManager.migrate_legacy_saves()
+            except OSError:
+                logger.exception("Failed to migrate legacy save data")
+        
+        # 使うモジュールだけを初期化する（ミキサーはローディング中に別スレッドで初期化する）
+        pygame.display.init()
+        pygame.font.init()
+        # pygame.init()を使わない場合はタイマーが初期化されないので、待ち時間0で初期化する（get_ticks用）
+        pygame.time.wait(0)
         self.width, self.height = 800, 600
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("犬びより")
         
-        # 音楽マネージャーの初期化
-        self.music_manager = MusicManager()
+        # 文字入力は名前入力画面でだけ受け付ける
+        pygame.key.stop_text_input()
+        
+        # 音楽マネージャーの初期化（環境変数でバッファサイズの設定を選べる）
+        self.music_manager = MusicManager(
+            audio_profile=os.environ.get("INUBIYORI_AUDIO_PROFILE", MusicManager.DEFAULT_AUDIO_PROFILE))
         
         # UI管理（ローディング画面用）
         self.ui = UI(self.screen, self.width, self.height)
         
-        # ローディング画面を表示
-        self.show_loading_screen()
-        
-        # 日本語フォントの初期化
-        self.setup_japanese_font()
-        
         self.clock = pygame.time.Clock()
         self.fps = 60
         
-        # ゲームの状態管理
-        self.game_state = GameState()
+        # フレームレートの調整（アイドル時は低レート、最小化時は描画停止）
+        self.frame_scheduler = FrameScheduler(active_fps=self.fps)
+        
+        # ローディング画面を表示しながらアセットとセーブデータを読み込む
+        # ゲームの状態管理もローディング中に作成される
+        self.show_loading_screen()
         
         # 犬の種類
         self.dog_types = ["コーギー", "ミニチュアダックスフンド", "柴犬"]
         
         # ゲームの状態
-        self.state = self.game_state.state  # "dog_management", "select_dog", "main_game", "graveyard", "trainer_info"
+        self.state = self.game_state.state  # "dog_management", "select_dog", "name_entry", "main_game", "graveyard", "trainer_info"
+        
+        # 名前入力中の文字列とIMEで変換中の文字列
+        self.name_input = ""
+        self.name_composition = ""
+        self.name_cursor_visible = True
+        
+        # 墓地の絞り込みの条件（Noneは絞り込まない、periodは直近の日数）と、その結果
+        self.graveyard_filter = {"dog_type": None, "stage": None, "period": None, "name_prefix": ""}
+        self.graveyard_results = None
+        self.graveyard_results_key = None
+        
+        # メインゲームで流している音楽が生きている犬用かどうか
+        self.music_dog_alive = None
         
         # 最後の更新時間
         self.last_update_time = time.time()
@@ -46,119 +110,311 @@ class DogTamagotchi:
         # 更新間隔（秒）
         self.update_interval = 1.0  # 1秒ごとに更新
         
-        # オープニング音楽を再生
-        try:
-            self.music_manager.play_music("opening")
-        except Exception as e:
-            print(f"音楽の再生に失敗しました: {e}")
+        # 定期処理のタイマー
+        self.timers = self.create_timers()
+        
+        # 画面の切り替え（最初の画面に入る時に音楽も再生される）
+        self.screens = self.create_screens()
+        self.screens.start(self.state)
+    
+    def create_timers(self):
+        """定期処理をタイマーホイールに登録（毎フレーム期限が来たものだけ実行される）"""
+        timers = TimerWheel(pygame.time.get_ticks())
+        timers.every("simulation", self.update_interval * 1000, self.on_simulation_timer)
+        timers.every("message", self.MESSAGE_CHECK_INTERVAL, self.on_message_timer)
+        timers.every("animation", Animation.ANIMATION_SPEED, self.on_animation_timer)
+        timers.every("music", self.MUSIC_CHECK_INTERVAL, self.on_music_timer)
+        timers.every("cursor", self.CURSOR_BLINK_INTERVAL, self.on_cursor_timer)
+        return timers
+    
+    def on_simulation_timer(self):
+        """犬のステータスを更新"""
+        self.update()
+        self.last_update_time = time.time()
+        # ステータスが変わるので再描画
+        self.frame_scheduler.request_redraw()
+    
+    def on_message_timer(self):
+        """表示時間が過ぎたメッセージを戻す"""
+        if self.game_state.expire_message():
+            self.frame_scheduler.request_redraw()
+    
+    def on_animation_timer(self):
+        """犬のアニメーションを次のフレームに進める"""
+        dog = self.game_state.dog
+        if self.state == "main_game" and dog and dog.is_alive:
+            self.ui.advance_animation(dog)
+            self.frame_scheduler.request_redraw()
+    
+    def on_music_timer(self):
+        """犬が死んだ時だけ音楽を切り替える"""
+        if self.state == "main_game":
+            self.update_main_game_music()
+    
+    def on_cursor_timer(self):
+        """名前入力のカーソルを点滅させる"""
+        if self.state == "name_entry":
+            self.name_cursor_visible = not self.name_cursor_visible
+            self.frame_scheduler.request_redraw()
+    
+    def create_screens(self):
+        """画面ごとの入退場時の処理と、次に表示されそうな画面を登録"""
+        screens = ScreenStateMachine()
+        screens.add_state("select_dog",
+                          on_enter=lambda previous: self.play_music("opening"),
+                          next_states=("name_entry",),
+                          prefetch=self.prefetch_select_dog)
+        screens.add_state("name_entry",
+                          on_enter=self.enter_name_entry,
+                          on_exit=self.exit_name_entry,
+                          next_states=("main_game",),
+                          prefetch=self.prefetch_name_entry)
+        screens.add_state("main_game",
+                          on_enter=self.enter_main_game,
+                          next_states=("dog_management", "graveyard"),
+                          prefetch=self.prefetch_main_game)
+        screens.add_state("dog_management",
+                          on_enter=lambda previous: self.play_music("opening"),
+                          next_states=("main_game", "select_dog", "graveyard"),
+                          prefetch=self.prefetch_dog_management)
+        screens.add_state("graveyard",
+                          on_enter=self.enter_graveyard,
+                          on_exit=self.exit_graveyard,
+                          prefetch=self.prefetch_graveyard)
+        screens.add_state("trainer_info")
+        return screens
+    
+    def prefetch_select_dog(self):
+        """犬選択画面の犬の画像"""
+        return [self.ui.prefetch_dog_image(dog_type, (150, 150)) for dog_type in self.dog_types]
+    
+    def prefetch_name_entry(self):
+        """名前入力画面の犬の画像"""
+        return [self.ui.prefetch_dog_image(dog_type, (200, 200)) for dog_type in self.dog_types]
+    
+    def prefetch_main_game(self):
+        """メインゲームで表示されそうな犬のアニメーションと画像"""
+        targets = {(dog.dog_type, dog.growth_stage) for dog in self.game_state.dogs if dog.is_alive}
+        if self.game_state.pending_dog_type:
+            # 名前入力中の犬は子犬から始まる
+            targets.add((self.game_state.pending_dog_type, "子犬"))
+        
+        jobs = []
+        for dog_type, growth_stage in targets:
+            jobs.append(self.ui.prefetch_animation(dog_type, growth_stage))
+            jobs.append(self.ui.prefetch_dog_image(dog_type, (180, 180)))
+        return jobs
+    
+    def prefetch_dog_management(self):
+        """犬管理画面のカード用の犬の画像"""
+        dog_types = {dog.dog_type for dog in self.game_state.dogs}
+        return [self.ui.prefetch_dog_image(dog_type, (80, 80)) for dog_type in dog_types]
+    
+    def prefetch_graveyard(self):
+        """墓地の絞り込み用のインデックス（お墓が多いと作るのに時間がかかる）"""
+        return self.game_state.save_manager.prefetch_graveyard_index()
+    
+    def enter_name_entry(self, previous):
+        """名前入力画面に入る"""
+        self.play_music("opening")
+        
+        # IMEの変換候補を入力欄の近くに表示して文字入力を受け付ける
+        pygame.key.set_text_input_rect(self.ui.get_name_input_rect())
+        pygame.key.start_text_input()
+        
+        # カーソルは表示した状態から点滅を始める
+        self.name_cursor_visible = True
+        self.timers.every("cursor", self.CURSOR_BLINK_INTERVAL, self.on_cursor_timer)
+    
+    def exit_name_entry(self, next_state):
+        """名前入力画面を出る"""
+        pygame.key.stop_text_input()
+        self.name_composition = ""
+    
+    def enter_graveyard(self, previous):
+        """墓地画面に入る（名前で絞り込むために文字入力を受け付ける）"""
+        pygame.key.start_text_input()
+    
+    def exit_graveyard(self, next_state):
+        """墓地画面を出る"""
+        pygame.key.stop_text_input()
+        self.ui.release_graveyard_cache()
+        self.graveyard_results = None
+        self.graveyard_results_key = None
+    
+    def enter_main_game(self, previous):
+        """メインゲームに入る（犬の状態に合わせた音楽を流す）"""
+        self.music_dog_alive = None
+        self.update_main_game_music()
     
     def show_loading_screen(self):
         """ローディング画面を表示"""
-        # ローディングの進捗
-        progress = 0.0
+        # 読み込み処理をワーカースレッドで実行する
+        pipeline = LoadingPipeline()
+        # 日本語フォントを探すのはこのタスクだけ（SDL_ttfはスレッドセーフではないので、
+        # ローディング中のメインスレッドは事前に描画した文字列しか使わない）
+        pipeline.add_task("fonts", self.setup_japanese_font)
+        # アニメーションのフレームをアトラスに焼き込む（初回表示時のカクつき防止）
+        # 前回の起動で保存したアトラスがあればそれを使う
+        pipeline.add_task("sprite_atlas", self.ui.load_sprite_atlas, weight=2.0)
+        pipeline.add_task("dog_images", self.ui.load_dog_images)
+        pipeline.add_task("saves", lambda: GameState(self.save_dir), weight=2.0)
+        pipeline.add_task("music", self.music_manager.preload_tracks, weight=2.0)
+        pipeline.add_task("sfx", self.music_manager.preload_sfx)
+        pipeline.start()
         
-        while progress < 1.0:
-            # ローディング画面を描画
-            self.ui.draw_loading_screen(progress)
-            
-            # 進捗を更新
-            progress += 0.01
-            
-            # 少し待機
-            pygame.time.delay(20)
-            
+        while not pipeline.is_done():
             # イベント処理（ウィンドウを閉じる操作など）
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
+            
+            # 実際の進捗でローディング画面を描画
+            self.ui.draw_loading_screen(pipeline.get_progress())
+            self.clock.tick(self.fps)
         
         # 最終的なローディング画面を表示
         self.ui.draw_loading_screen(1.0)
-        pygame.time.delay(500)  # 0.5秒待機
+        
+        # 失敗したタスクをここで記録する（セーブデータ以外は無くても続けられる）
+        for name, error in pipeline.get_failures():
+            logger.error("Loading task failed: %s", name, exc_info=error)
+        
+        # 見つけた日本語フォントでフォントを作り直す
+        self.ui.setup_japanese_fonts()
+        
+        # ゲームの状態管理（セーブデータの読み込み結果）
+        self.game_state = pipeline.get_result("saves")
+        
+        # 作成したサーフェスを次回の起動のために保存
+        self.ui.save_warm_start()
+        
+        logger.info("Loading finished in %.2fs", pipeline.get_elapsed())
     
     def setup_japanese_font(self):
-        """日本語フォントの初期化"""
-        system = platform.system()
-        
-        if system == "Windows":
-            # Windowsの場合
-            font_paths = [
-                "C:\\Windows\\Fonts\\msgothic.ttc",
-                "C:\\Windows\\Fonts\\meiryo.ttc",
-                "C:\\Windows\\Fonts\\YuGothM.ttc"
-            ]
-            
-            for path in font_paths:
-                if os.path.exists(path):
-                    pygame.font.Font(path, 24)  # フォントを事前に読み込む
-                    break
-                    
-        elif system == "Darwin":  # macOS
-            # macOSの場合
-            font_paths = [
-                "/System/Library/Fonts/Hiragino Sans GB.ttc",
-                "/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc",
-                "/System/Library/Fonts/AppleGothic.ttf",
-                "/Library/Fonts/Osaka.ttf"
-            ]
-            
-            for path in font_paths:
-                if os.path.exists(path):
-                    pygame.font.Font(path, 24)  # フォントを事前に読み込む
-                    break
+        """日本語フォントを探してファイルを事前に読み込む"""
+        path = Utils.find_japanese_font()
+        if path is not None:
+            # フォントファイルを読んでOSのキャッシュに載せる
+            # （ゲームで使うフォントオブジェクトの作成はローディングの後にメインスレッドで行う）
+            with open(path, "rb") as f:
+                while f.read(1024 * 1024):
+                    pass
         
     def run(self):
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.quit_game()
-                
-                # --- キーボードイベントのハンドリング ---
-                if self.state == "main_game" and self.game_state.dog:
-                    self.ui.handle_key_event(event, self.game_state.dog)
-                
-                if self.state == "dog_management":
-                    self.handle_dog_management(event)
-                elif self.state == "select_dog":
-                    self.handle_dog_selection(event)
-                elif self.state == "main_game":
-                    self.handle_main_game(event)
-                elif self.state == "graveyard":
-                    self.handle_graveyard(event)
-                elif self.state == "trainer_info":
-                    self.handle_trainer_info(event)
+                self.handle_event(event)
             
-            # ゲーム状態の同期
-            self.state = self.game_state.state
+            self.update_screen()
             
-            # 音楽の更新
-            self.update_music()
+            # 期限が来た定期処理だけを実行
+            now = pygame.time.get_ticks()
+            self.timers.advance(now)
             
-            # 定期的に更新
-            current_time = time.time()
-            if current_time - self.last_update_time >= self.update_interval:
-                self.update()
-                self.last_update_time = current_time
+            self.render_frame()
             
-            self.render()
-            pygame.display.flip()  # 毎フレーム画面を更新
-            self.clock.tick(self.fps)
+            # 次のタイマーの期限までの時間を上限に待機
+            self.frame_scheduler.wait(self.clock, self.timers.time_until_next(pygame.time.get_ticks()))
+    
+    def run_async(self):
+        """asyncioのイベントループでゲームを実行する（定期処理をそれぞれタスクとして動かす）"""
+        asyncio.run(AsyncRunner(self).run())
     
-    def update_music(self):
-        """状態に応じて音楽を更新"""
-        if self.state == "select_dog" or self.state == "dog_management":
-            # タイトル画面や犬管理画面では opening 音楽
-            self.music_manager.play_music("opening")
+    def handle_event(self, event):
+        """イベントを処理（QUIT以外）"""
+        # ウィンドウ状態と入力の活動を記録
+        self.frame_scheduler.handle_event(event)
+        
+        # F12で直近のログをファイルに書き出す
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
+            logger.info("Log written to %s", game_logging.dump_log())
+            return
+        
+        # ホバー状態はマウスが動いた時だけ更新し、変化があったボタンの範囲だけを再描画
+        if event.type == pygame.MOUSEMOTION:
+            rects = self.ui.handle_mouse_motion(event.pos)
+            if rects:
+                self.frame_scheduler.request_redraw_rects(rects)
+        
+        # --- キーボードイベントのハンドリング ---
+        if self.state == "main_game" and self.game_state.dog:
+            self.ui.handle_key_event(event, self.game_state.dog)
+        
+        if self.state == "dog_management":
+            self.handle_dog_management(event)
+        elif self.state == "select_dog":
+            self.handle_dog_selection(event)
+        elif self.state == "name_entry":
+            self.handle_name_entry(event)
         elif self.state == "main_game":
-            if self.game_state.dog and not self.game_state.dog.is_alive:
-                # 犬が死亡している場合は funeral 音楽
-                self.music_manager.play_music("funeral")
+            self.handle_main_game(event)
+        elif self.state == "graveyard":
+            self.handle_graveyard(event)
+        elif self.state == "trainer_info":
+            self.handle_trainer_info(event)
+    
+    def update_screen(self):
+        """画面の切り替えと、画面ごとの表示の更新"""
+        # 画面が変わった時だけ切り替え処理を行う
+        if self.game_state.state != self.state:
+            self.state = self.game_state.state
+            self.screens.transition(self.state)
+            self.frame_scheduler.request_redraw()
+        
+        # 事前読み込みが終わったアセットを反映
+        self.screens.poll()
+    
+    def render_frame(self):
+        """必要な場合だけ画面を描画（アニメーションはタイマーが再描画を要求する）"""
+        rendered = self.frame_scheduler.should_render()
+        if rendered:
+            rects = self.frame_scheduler.take_redraw_rects()
+            if rects is None:
+                self.render()
+                pygame.display.flip()
             else:
-                # 通常のゲーム画面では game 音楽
-                self.music_manager.play_music("game")
+                # 変わった範囲の外は描かずに、その範囲だけを画面に反映する
+                self.screen.set_clip(rects[0].unionall(rects[1:]))
+                self.render()
+                self.screen.set_clip(None)
+                pygame.display.update(rects)
+        self.frame_scheduler.frame_done(rendered)
+    
+    def play_music(self, music_type):
+        """音楽を再生"""
+        try:
+            self.music_manager.play_music(music_type)
+        except Exception as e:
+            logger.warning("音楽の再生に失敗しました: %s", e)
+    
+    def update_main_game_music(self):
+        """メインゲームの音楽を犬の状態に合わせる（状態が変わった時だけ再生する）"""
+        dog_alive = not (self.game_state.dog and not self.game_state.dog.is_alive)
+        if dog_alive == self.music_dog_alive:
+            return
+        
+        self.music_dog_alive = dog_alive
+        if dog_alive:
+            # 通常のゲーム画面では game 音楽
+            self.play_music("game")
+        else:
+            # 犬が死亡している場合は funeral 音楽
+            self.play_music("funeral")
     
     def handle_dog_management(self, event):
+        if event.type == pygame.MOUSEWHEEL:
+            # 犬のリストをスクロール
+            self.ui.scroll_dog_list(-event.y * 40)
+            return
+        
+        # ホイール操作で発生するボタンイベントは無視
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5):
+            return
+        
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = pygame.mouse.get_pos()
             
@@ -196,13 +452,7 @@ class DogTamagotchi:
             
             if selected_dog is not None:
                 # 犬を選択した場合、名前入力を促す
-                dog_name = self.get_dog_name(selected_dog)
-                
-                # 犬を作成して名前を設定
-                dog = Dog(selected_dog, name=dog_name)
-                
-                # 犬を追加
-                self.game_state.start_game(dog)
+                self.begin_name_entry(selected_dog)
                 return  # 他の処理を行わずに関数を抜ける
             
             # メニューボタンのチェック
@@ -223,135 +473,43 @@ class DogTamagotchi:
                 new_volume = self.ui.update_volume(-0.1)
                 self.music_manager.set_volume(new_volume)
     
-    def get_dog_name(self, dog_type):
-        """犬の名前を入力するダイアログを表示"""
-        # デフォルト名は犬種
-        default_name = dog_type
-        
-        # 入力用の変数
-        input_name = ""
-        input_active = True
-        
-        # 入力ループ
-        while input_active:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.quit_game()
-                
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        # Enterキーで確定
-                        input_active = False
-                    elif event.key == pygame.K_BACKSPACE:
-                        # バックスペースで1文字削除
-                        input_name = input_name[:-1]
-                    else:
-                        # 文字入力（10文字まで）
-                        if len(input_name) < 10:
-                            # 入力された文字を追加
-                            char = event.unicode
-                            if char:  # 空でない場合のみ追加
-                                input_name += char
-            
-            # 画面を描画
-            self.screen.fill(self.ui.BACKGROUND_COLOR)
-            
-            # タイトル背景
-            pygame.draw.rect(self.screen, (240, 240, 255), (0, 0, self.width, 80))
-            pygame.draw.line(self.screen, (220, 220, 240), (0, 80), (self.width, 80), 2)
-            
-            # タイトル
-            try:
-                title = self.ui.title_font.render("犬の名前を入力してください", True, self.ui.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                title = self.ui.default_title_font.render("Enter dog name", True, self.ui.BLACK)
-            
-            self.screen.blit(title, (self.width // 2 - title.get_width() // 2, 20))
-            
-            # 犬の種類表示
-            try:
-                dog_type_text = self.ui.normal_font.render(f"犬種: {dog_type}", True, self.ui.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                dog_names = {"コーギー": "Corgi", "ミニチュアダックスフンド": "Dachshund", "柴犬": "Shiba"}
-                dog_type_text = self.ui.default_normal_font.render(f"Dog type: {dog_names.get(dog_type, dog_type)}", True, self.ui.BLACK)
-            
-            self.screen.blit(dog_type_text, (self.width // 2 - dog_type_text.get_width() // 2, 100))
-            
-            # 入力フィールドの背景
-            input_bg_width = 300
-            input_bg_height = 50
-            input_bg_x = self.width // 2 - input_bg_width // 2
-            input_bg_y = 150
-            
-            pygame.draw.rect(self.screen, self.ui.WHITE, 
-                            (input_bg_x, input_bg_y, input_bg_width, input_bg_height), 
-                            border_radius=8)
-            pygame.draw.rect(self.screen, self.ui.BLACK, 
-                            (input_bg_x, input_bg_y, input_bg_width, input_bg_height), 
-                            2, border_radius=8)
-            
-            # 入力テキスト
-            if input_name:
-                try:
-                    name_text = self.ui.normal_font.render(input_name, True, self.ui.BLACK)
-                except:
-                    name_text = self.ui.default_normal_font.render(input_name, True, self.ui.BLACK)
-            else:
-                # プレースホルダー
-                try:
-                    name_text = self.ui.normal_font.render(default_name, True, (150, 150, 150))
-                except:
-                    name_text = self.ui.default_normal_font.render(default_name, True, (150, 150, 150))
-            
-            self.screen.blit(name_text, (input_bg_x + 10, input_bg_y + input_bg_height // 2 - name_text.get_height() // 2))
-            
-            # カーソル表示（点滅）
-            if pygame.time.get_ticks() % 1000 < 500:  # 0.5秒ごとに点滅
-                cursor_x = input_bg_x + 10 + name_text.get_width()
-                cursor_y = input_bg_y + 10
-                pygame.draw.line(self.screen, self.ui.BLACK, 
-                                (cursor_x, cursor_y), 
-                                (cursor_x, cursor_y + input_bg_height - 20), 
-                                2)
-            
-            # 説明テキスト
-            try:
-                info_text = self.ui.small_font.render("Enterキーで確定 (最大10文字)", True, self.ui.BLACK)
-            except:
-                info_text = self.ui.default_small_font.render("Press Enter to confirm (max 10 chars)", True, self.ui.BLACK)
-            
-            self.screen.blit(info_text, (self.width // 2 - info_text.get_width() // 2, input_bg_y + input_bg_height + 10))
-            
-            # 犬の画像表示
-            try:
-                if dog_type == "コーギー":
-                    dog_img = pygame.image.load("./dog_inubiyori/assets/dogs/corgi.png")
-                elif dog_type == "ミニチュアダックスフンド":
-                    dog_img = pygame.image.load("./dog_inubiyori/assets/dogs/dachsuhund.png")
-                elif dog_type == "柴犬":
-                    dog_img = pygame.image.load("./dog_inubiyori/assets/dogs/shiba.png")
-                else:
-                    # 未知の犬種の場合はプレースホルダーを使用
-                    dog_img = self.ui.placeholder_images[dog_type]["large"]
-                
-                # 画像サイズを調整
-                dog_img = pygame.transform.scale(dog_img, (200, 200))
-                self.screen.blit(dog_img, (self.width // 2 - dog_img.get_width() // 2, 220))
-            except Exception as e:
-                print(f"画像読み込みエラー: {e}")
-                # エラーが発生した場合はプレースホルダーを使用
-                self.screen.blit(self.ui.placeholder_images[dog_type]["large"], (self.width // 2 - 100, 220))
+    def begin_name_entry(self, dog_type):
+        """名前入力画面に移行（入力中もシミュレーションは続く）"""
+        self.name_input = ""
+        self.name_composition = ""
+        self.game_state.begin_name_entry(dog_type)
+    
+    def end_name_entry(self, confirm):
+        """名前入力を終了（文字入力の停止は画面を出る時に行う）"""
+        if confirm:
+            self.game_state.finish_name_entry(self.name_input)
+        else:
+            self.game_state.cancel_name_entry()
+    
+    def handle_name_entry(self, event):
+        if event.type == pygame.TEXTEDITING:
+            # IMEで変換中の文字列（確定するまで名前には追加しない）
+            self.name_composition = event.text
+        elif event.type == pygame.TEXTINPUT:
+            # 確定した文字を追加（10文字まで）
+            self.name_composition = ""
+            remaining = self.MAX_NAME_LENGTH - len(self.name_input)
+            if remaining > 0:
+                self.name_input += event.text[:remaining]
+        elif event.type == pygame.KEYDOWN:
+            # 変換中のキー操作はIMEに任せる
+            if self.name_composition:
+                return
             
-            pygame.display.flip()
-            self.clock.tick(self.fps)
-        
-        # 入力が空の場合はデフォルト名を使用
-        if not input_name:
-            input_name = default_name
-        
-        return input_name
+            if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                # Enterキーで確定
+                self.end_name_entry(True)
+            elif event.key == pygame.K_ESCAPE:
+                # Escキーで犬選択に戻る
+                self.end_name_entry(False)
+            elif event.key == pygame.K_BACKSPACE:
+                # バックスペースで1文字削除
+                self.name_input = self.name_input[:-1]
     
     def handle_main_game(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -376,7 +534,9 @@ class DogTamagotchi:
                     new_volume = self.ui.update_volume(-0.1)
                     self.music_manager.set_volume(new_volume)
                 else:
-                    self.game_state.perform_action(action)
+                    # お世話をした場合だけ効果音を鳴らす（疲れていて断られた場合は鳴らさない）
+                    if self.game_state.perform_action(action):
+                        self.music_manager.play_sfx(self.ACTION_SOUNDS.get(action))
             
             # メニューボタンのチェック
             menu_item = self.ui.check_menu_selection(mouse_pos)
@@ -386,6 +546,35 @@ class DogTamagotchi:
                 self.game_state.show_trainer_info()
     
     def handle_graveyard(self, event):
+        if event.type == pygame.MOUSEWHEEL:
+            # 墓地をスクロール
+            self.ui.scroll_graveyard(-event.y * 60)
+            return
+        
+        if event.type == pygame.TEXTINPUT:
+            # 確定した文字で名前を絞り込む（10文字まで）
+            name_prefix = self.graveyard_filter["name_prefix"]
+            self.set_graveyard_filter("name_prefix", (name_prefix + event.text)[:self.MAX_NAME_LENGTH])
+            return
+        
+        if event.type == pygame.KEYDOWN:
+            # ページ単位でスクロール
+            if event.key == pygame.K_PAGEDOWN:
+                self.ui.scroll_graveyard_page(1)
+            elif event.key == pygame.K_PAGEUP:
+                self.ui.scroll_graveyard_page(-1)
+            elif event.key == pygame.K_BACKSPACE:
+                # バックスペースで名前の1文字を削除
+                self.set_graveyard_filter("name_prefix", self.graveyard_filter["name_prefix"][:-1])
+            elif event.key == pygame.K_ESCAPE:
+                # Escキーで名前の絞り込みを解除
+                self.set_graveyard_filter("name_prefix", "")
+            return
+        
+        # ホイール操作で発生するボタンイベントは無視
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5):
+            return
+        
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = pygame.mouse.get_pos()
             action = self.ui.check_action_selection(mouse_pos)
@@ -394,6 +583,14 @@ class DogTamagotchi:
                 self.game_state.back_to_main()
             elif action == "trainer_info":
                 self.game_state.show_trainer_info()
+            elif action == "filter_breed":
+                self.cycle_graveyard_filter("dog_type", self.dog_types)
+            elif action == "filter_stage":
+                self.cycle_graveyard_filter("stage", self.GROWTH_STAGES)
+            elif action == "filter_period":
+                self.cycle_graveyard_filter("period", self.GRAVEYARD_PERIODS)
+            elif action == "filter_name":
+                self.set_graveyard_filter("name_prefix", "")
             elif action == "volume_up":
                 # 音量を上げる
                 new_volume = self.ui.update_volume(0.1)
@@ -403,6 +600,46 @@ class DogTamagotchi:
                 new_volume = self.ui.update_volume(-0.1)
                 self.music_manager.set_volume(new_volume)
     
+    def cycle_graveyard_filter(self, key, choices):
+        """絞り込みの条件を「すべて」から順に切り替える"""
+        options = [None] + list(choices)
+        index = options.index(self.graveyard_filter[key])
+        self.set_graveyard_filter(key, options[(index + 1) % len(options)])
+    
+    def set_graveyard_filter(self, key, value):
+        """絞り込みの条件を変えて先頭から表示する"""
+        if self.graveyard_filter[key] == value:
+            return
+        self.graveyard_filter[key] = value
+        self.ui.scroll_graveyard_to_top()
+        self.frame_scheduler.request_redraw()
+    
+    def get_graveyard_results(self):
+        """絞り込みの条件に合うお墓の墓地での位置（条件とお墓の数が変わらない間は前回の結果を使う）"""
+        save_manager = self.game_state.save_manager
+        graveyard_filter = self.graveyard_filter
+        key = (tuple(graveyard_filter.values()), len(save_manager.graveyard))
+        if key == self.graveyard_results_key:
+            return self.graveyard_results
+        
+        period = graveyard_filter["period"]
+        if (graveyard_filter["dog_type"] is None and graveyard_filter["stage"] is None
+                and period is None and not graveyard_filter["name_prefix"]):
+            # 絞り込まない場合はインデックスを作らない
+            results = range(len(save_manager.graveyard))
+        else:
+            # 期間は今日を含む直近 period 日（その日の0時から）
+            start = None
+            if period is not None:
+                today = datetime.combine(datetime.now().date(), datetime.min.time())
+                start = today - timedelta(days=period - 1)
+            results = save_manager.query_graveyard(graveyard_filter["dog_type"], graveyard_filter["stage"],
+                                                   start, None, graveyard_filter["name_prefix"])
+        
+        self.graveyard_results = results
+        self.graveyard_results_key = key
+        return results
+    
     def handle_trainer_info(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = pygame.mouse.get_pos()
@@ -429,30 +666,54 @@ class DogTamagotchi:
             self.ui.draw_dog_management(self.game_state.dogs)
         elif self.state == "select_dog":
             self.ui.draw_dog_selection(self.dog_types)
+        elif self.state == "name_entry":
+            self.ui.draw_name_entry(self.game_state.pending_dog_type, self.name_input,
+                                    self.name_composition, self.name_cursor_visible)
         elif self.state == "main_game":
             self.ui.draw_main_game(self.game_state.dog, self.game_state)
         elif self.state == "graveyard":
-            self.ui.draw_graveyard(self.game_state.save_manager.graveyard)
+            self.ui.draw_graveyard(self.game_state.save_manager.graveyard, self.get_graveyard_results(),
+                                   self.graveyard_filter)
         elif self.state == "trainer_info":
-            self.ui.draw_trainer_info(self.game_state.save_manager.trainer_data)
+            save_manager = self.game_state.save_manager
+            self.ui.draw_trainer_info(save_manager.trainer_data, save_manager.graveyard_stats)
     
     def quit_game(self):
         # ゲームデータを保存
-        for dog in self.game_state.dogs:
-            if dog.is_alive:
-                self.game_state.save_manager.save_dog(dog.to_dict())
+        self.game_state.save()
         
-        # 音楽を停止
-        self.music_manager.stop_music()
+        # 音楽を停止（asyncioで実行する場合はランナーがワーカースレッドで停止する）
+        self.music_manager.shutdown()
         
-        pygame.quit()
+        self.shutdown()
         sys.exit()
+    
+    def shutdown(self):
+        """事前読み込みを停止してpygameを終了（保存と音楽の停止は呼び出し側で済ませておく）"""
+        # 事前読み込みを停止
+        self.screens.shutdown()
+        
+        # フレームレート調整、画面切り替え、曲の切り替えの効果を表示
+        logger.info(self.frame_scheduler.report())
+        logger.info(self.screens.report())
+        logger.info(self.music_manager.report())
+        logger.info(self.timers.report())
+        
+        pygame.quit()
 
 if __name__ == "__main__":
-    # セーブディレクトリの作成
-    save_dir = "saves"
-    if not os.path.exists(save_dir):
-        os.makedirs(save_dir)
+    parser = argparse.ArgumentParser(description="犬びより")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="asyncioのイベントループで実行する")
+    parser.add_argument("--trainer", help="トレーナーID（指定するとトレーナーごとのセーブデータを使う）")
+    args = parser.parse_args()
+    if args.trainer is not None and not SaveManager.is_valid_trainer_id(args.trainer):
+        parser.error("trainer id may only contain letters, digits, '_' and '-'")
     
-    game = DogTamagotchi()
-    game.run()
+    # セーブディレクトリは GameState の読み込み時に作成される
+    game = DogTamagotchi(args.trainer)
+    if args.use_async:
+        # asyncioのイベントループで実行
+        game.run_async()
+    else:
+        game.run()
@@ -1,27 +1,65 @@
 import pygame
 import os
+import json
+import math
+import time
+import queue
+import logging
 import pathlib
+import threading
+from array import array
+from utils import Utils
+
+logger = logging.getLogger(__name__)
 
 class MusicManager:
-    def __init__(self):
+    # クロスフェードの時間と音量を変える間隔（秒）
+    FADE_TIME = 1.0
+    FADE_STEP = 0.02
+    
+    # 音楽用に予約するチャンネル数（クロスフェード中は2曲同時に鳴る）
+    MUSIC_CHANNELS = 2
+    
+    # オーディオのバッファサイズ（サンプル数）の設定
+    # バッファが小さいほど音が鳴るまでの遅れは短いが、処理が間に合わないと音が途切れやすい
+    AUDIO_PROFILES = {
+        "low_latency": 512,
+        "balanced": 1024,
+        "safe": 2048
+    }
+    DEFAULT_AUDIO_PROFILE = "balanced"
+    
+    # 効果音用のチャンネル数（同時に鳴らせる効果音の数）
+    SFX_CHANNELS = 4
+    
+    # 効果音（名前 -> (優先度, ファイルが無い場合に作る音の周波数Hz, 長さ秒)）
+    # 優先度が高い効果音は、チャンネルが足りない時に優先度が同じか低い効果音を止めて鳴らす
+    SFX = {
+        "feed": (1, 660, 0.12),
+        "walk": (1, 523, 0.15),
+        "train": (2, 784, 0.10),
+        "clean": (1, 440, 0.18),
+        "play": (1, 880, 0.12)
+    }
+    
+    # 同じ効果音を続けて鳴らす最小間隔（秒）と、効果音全体で1秒間に鳴らせる数
+    SFX_MIN_INTERVAL = 0.08
+    SFX_RATE = 8.0
+    SFX_BURST = 4
+    
+    def __init__(self, manifest_path=None, audio_profile=DEFAULT_AUDIO_PROFILE):
         """音楽マネージャーの初期化"""
-        # 音楽の初期化 - 明示的なパラメータを使用
+        # オーディオの初期化はinit_audioで行う（ローディング中にワーカースレッドで実行）
         self.audio_initialized = False
-        try:
-            # 一般的なサンプルレート、ビット深度、チャンネル数を明示的に指定
-            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
-            # 初期化が成功したかどうか確認
-            if pygame.mixer.get_init() is not None:
-                self.audio_initialized = True
-                print("Pygame audio system successfully initialized")
-                print(f"Pygame version: {pygame.version.ver}")
-                print(f"SDL version: {pygame.version.SDL}")
-                print(f"Audio driver: {pygame.mixer.get_init()}")
-                print(f"Available audio drivers: {pygame.mixer.get_sdl_mixer_version()}")
-            else:
-                print("WARNING: Pygame audio system failed to initialize")
-        except Exception as e:
-            print(f"ERROR: Failed to initialize audio system: {e}")
+        self.audio_init_done = False
+        self.audio_init_lock = threading.Lock()
+        self.audio_init_time = 0.0
+        
+        # バッファサイズの設定
+        if audio_profile not in self.AUDIO_PROFILES:
+            logger.warning("Unknown audio profile: %s (using %s)", audio_profile, self.DEFAULT_AUDIO_PROFILE)
+            audio_profile = self.DEFAULT_AUDIO_PROFILE
+        self.audio_profile = audio_profile
         
         # 音楽ファイルのパス
         # スクリプトの場所を基準に絶対パスを設定
@@ -29,18 +67,15 @@ class MusicManager:
         script_dir = pathlib.Path(__file__).parent.absolute()
         self.music_dir = os.path.join(script_dir, "assets", "music")
         
-        # ディレクトリの存在チェック
-        if os.path.exists(self.music_dir):
-            print(f"Music directory found: {self.music_dir}")
-            
-            # ディレクトリアクセス権限チェック
-            if os.access(self.music_dir, os.R_OK):
-                print(f"Music directory is readable")
-            else:
-                print(f"WARNING: No read permission for music directory {self.music_dir}")
-        else:
-            print(f"ERROR: Music directory does not exist: {self.music_dir}")
-            print(f"Current working directory: {os.getcwd()}")
+        # 音楽の種類 -> 再生するファイルのパス（build_manifestで一度だけ作る）
+        self.manifest = None
+        # マニフェストの保存先（キャッシュ用のディレクトリ。作成できない場合は保存しない）
+        if manifest_path is None:
+            try:
+                manifest_path = os.path.join(Utils.get_cache_dir(), "music_manifest.json")
+            except OSError:
+                manifest_path = None
+        self.manifest_path = manifest_path
         
         # 音楽ファイル名（MP3とWAVの両方をサポート、WAVを優先）
         self.music_files = {
@@ -49,115 +84,447 @@ class MusicManager:
             "funeral": ["funeral.wav", "funeral.mp3"]
         }
         
-        # デバッグ情報を表示：音楽ディレクトリパスの確認
-        print(f"Music directory path: {self.music_dir}")
-        for music_type, filenames in self.music_files.items():
-            for filename in filenames:
-                full_path = os.path.join(self.music_dir, filename)
-                exists = os.path.exists(full_path)
-                readable = os.access(full_path, os.R_OK) if exists else False
-                size = os.path.getsize(full_path) if exists else 0
-                print(f"Checking {music_type} file: {full_path}")
-                print(f"  - Exists: {exists}")
-                print(f"  - Readable: {readable}")
-                print(f"  - Size: {size} bytes")
-        
-        # 現在再生中の音楽
+        # 現在再生中の音楽（再生を依頼した音楽）
         self.current_music = None
         
         # 音量設定
         self.volume = 0.5  # 0.0 ~ 1.0
-        if self.audio_initialized:
-            pygame.mixer.music.set_volume(self.volume)
+        
+        # デコード済みの音楽（音楽の種類 -> Sound）
+        self.sounds = {}
+        self.sounds_lock = threading.Lock()
+        
+        # 音楽用のチャンネル（効果音などの自動割り当てには使われない）
+        self.channels = []
+        self.active_channel = None
+        
+        # 効果音（名前 -> Sound）とチャンネルごとの (優先度, 鳴らし始めた時刻)
+        self.sfx_dir = os.path.join(script_dir, "assets", "sfx")
+        self.sfx_sounds = {}
+        self.sfx_channels = []
+        self.sfx_playing = []
+        
+        # 効果音の頻度制限（名前ごとの最後に鳴らした時刻と、全体のトークンバケット）
+        self.sfx_last_played = {}
+        self.sfx_tokens = float(self.SFX_BURST)
+        self.sfx_tokens_time = time.perf_counter()
+        
+        # 曲の切り替えはクロスフェード用のスレッドで行う（描画スレッドを止めない）
+        self.requests = queue.Queue()
+        self.crossfader = None
+        
+        # 統計情報
+        self.transitions = 0
+        self.transition_latency = 0.0      # 依頼してから次の曲が鳴り始めるまで
+        self.max_transition_latency = 0.0
+        self.max_request_time = 0.0        # play_musicでメインスレッドが使った時間
+        self.sfx_played = 0
+        self.sfx_stolen = 0                # 他の効果音を止めて鳴らした数
+        self.sfx_dropped = 0               # 頻度制限やチャンネル不足で鳴らさなかった数
+    
+    def init_audio(self):
+        """ミキサーを初期化（失敗した場合は音なしで続ける。何度呼んでも初期化は一度だけ）"""
+        with self.audio_init_lock:
+            if self.audio_init_done:
+                return self.audio_initialized
+            self.audio_init_done = True
+            
+            buffer = self.AUDIO_PROFILES[self.audio_profile]
+            start = time.perf_counter()
+            try:
+                # 一般的なサンプルレート、ビット深度、チャンネル数を明示的に指定
+                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=buffer)
+            except Exception as e:
+                logger.warning("Failed to initialize audio system, continuing without sound: %s", e)
+                return False
+            self.audio_init_time = time.perf_counter() - start
+            
+            # 初期化が成功したかどうか確認
+            if pygame.mixer.get_init() is None:
+                logger.warning("Pygame audio system failed to initialize, continuing without sound")
+                return False
+            
+            # 音楽用と効果音用のチャンネルを用意する
+            pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(),
+                                              self.MUSIC_CHANNELS + self.SFX_CHANNELS))
+            pygame.mixer.set_reserved(self.MUSIC_CHANNELS)
+            self.channels = [pygame.mixer.Channel(i) for i in range(self.MUSIC_CHANNELS)]
+            self.sfx_channels = [pygame.mixer.Channel(self.MUSIC_CHANNELS + i) for i in range(self.SFX_CHANNELS)]
+            self.sfx_playing = [(0, 0.0)] * self.SFX_CHANNELS
+            self.audio_initialized = True
+            
+            logger.debug("Pygame audio system initialized in %.1f ms (%s, %.1f ms buffer)",
+                         self.audio_init_time * 1000, self.audio_profile, self.get_output_latency() * 1000)
+            logger.debug("Pygame version: %s, SDL version: %s", pygame.version.ver, pygame.version.SDL)
+            logger.debug("Audio driver: %s, SDL_mixer version: %s",
+                         pygame.mixer.get_init(), pygame.mixer.get_sdl_mixer_version())
+            return True
+    
+    def get_output_latency(self):
+        """バッファ1つ分の再生時間（音を鳴らしてから出力されるまでの遅れの目安、秒）"""
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None:
+            return 0.0
+        return self.AUDIO_PROFILES[self.audio_profile] / mixer_format[0]
+    
+    def build_manifest(self):
+        """音楽の種類ごとに再生するファイルを一度だけ決める（ローディング中にワーカースレッドで実行）"""
+        dir_mtime = self.get_mtime(self.music_dir)
+        
+        # 保存されたマニフェストのファイルが変わっていなければそのまま使う
+        # （ファイルの追加や削除はディレクトリの更新時刻で分かる）
+        saved = self.load_manifest()
+        if saved is not None and saved.get("dir_mtime") == dir_mtime:
+            tracks = saved.get("tracks", {})
+            if all(self.is_track_unchanged(tracks.get(music_type)) for music_type in self.music_files):
+                self.manifest = {music_type: self.to_track_path(tracks.get(music_type))
+                                 for music_type in self.music_files}
+                logger.debug("Music manifest loaded from %s", self.manifest_path)
+                return self.manifest
+        
+        # 音楽ディレクトリのファイル一覧を一度だけ読む
+        entries = {}
+        if dir_mtime is not None:
+            try:
+                with os.scandir(self.music_dir) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            entries[entry.name] = (stat.st_mtime, stat.st_size)
+            except OSError as e:
+                logger.warning("Music directory is not readable: %s (%s)", self.music_dir, e)
+        else:
+            logger.debug("Music directory does not exist: %s", self.music_dir)
+        
+        # 候補の中で最初に存在するファイルを使う（WAVを優先）
+        tracks = {}
+        for music_type, filenames in self.music_files.items():
+            track = None
+            for filename in filenames:
+                if filename in entries:
+                    mtime, size = entries[filename]
+                    track = {"file": filename, "mtime": mtime, "size": size}
+                    break
+            tracks[music_type] = track
+            if track is None:
+                logger.debug("No music file found for %s", music_type)
+            else:
+                logger.debug("Music %s: %s (%d bytes)", music_type, track["file"], track["size"])
+        
+        self.manifest = {music_type: self.to_track_path(track) for music_type, track in tracks.items()}
+        self.save_manifest(dir_mtime, tracks)
+        return self.manifest
+    
+    @staticmethod
+    def get_mtime(path):
+        """ファイルやディレクトリの更新時刻を取得（存在しない場合はNone）"""
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+    
+    def to_track_path(self, track):
+        """マニフェストの項目から音楽ファイルのパスを取得"""
+        if track is None:
+            return None
+        return os.path.join(self.music_dir, track["file"])
+    
+    def is_track_unchanged(self, track):
+        """マニフェストの項目が現在のファイルと一致するかどうか"""
+        if track is None:
+            return True
+        try:
+            stat = os.stat(self.to_track_path(track))
+        except OSError:
+            return False
+        return stat.st_mtime == track["mtime"] and stat.st_size == track["size"]
+    
+    def load_manifest(self):
+        """保存されたマニフェストを読み込む"""
+        if self.manifest_path is None or not os.path.exists(self.manifest_path):
+            return None
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring music manifest %s: %s", self.manifest_path, e)
+            return None
+        
+        # 音楽ディレクトリや候補のファイル名が変わった場合は使わない
+        if saved.get("music_dir") != self.music_dir or saved.get("music_files") != self.music_files:
+            return None
+        return saved
+    
+    def save_manifest(self, dir_mtime, tracks):
+        """マニフェストを保存（ファイルの更新時刻とサイズも記録する）"""
+        if self.manifest_path is None:
+            return
+        data = {"music_dir": self.music_dir, "music_files": self.music_files,
+                "dir_mtime": dir_mtime, "tracks": tracks}
+        try:
+            with open(self.manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.debug("Failed to save music manifest %s: %s", self.manifest_path, e)
+    
+    def preload_tracks(self):
+        """すべての音楽をデコードしておく（ローディング中にワーカースレッドで実行）"""
+        if self.manifest is None:
+            self.build_manifest()
+        if not self.init_audio():
+            return
+        
+        for music_type in self.music_files:
+            self.get_sound(music_type)
+    
+    def preload_sfx(self):
+        """すべての効果音をデコードしておく（ローディング中にワーカースレッドで実行）"""
+        if not self.init_audio():
+            return
+        
+        for name, (priority, frequency, duration) in self.SFX.items():
+            sound = None
+            for extension in ("wav", "ogg"):
+                path = os.path.join(self.sfx_dir, f"{name}.{extension}")
+                if os.path.exists(path):
+                    try:
+                        sound = pygame.mixer.Sound(path)
+                        break
+                    except Exception as e:
+                        logger.warning("Error loading sound effect %s: %s", path, e)
+            
+            # ファイルが無い場合は短い音を作る
+            if sound is None:
+                sound = self.create_tone(frequency, duration)
+            if sound is not None:
+                self.sfx_sounds[name] = sound
+        
+        logger.debug("Sound effects ready: %s", ", ".join(self.sfx_sounds))
+    
+    @staticmethod
+    def create_tone(frequency, duration, amplitude=0.3):
+        """減衰するサイン波の効果音を作る"""
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None or mixer_format[1] != -16:
+            # 16bit以外のミキサーでは作らない
+            return None
+        
+        rate, _, channels = mixer_format
+        count = int(rate * duration)
+        samples = array("h")
+        for i in range(count):
+            envelope = 1.0 - i / count
+            value = int(32767 * amplitude * envelope * math.sin(2 * math.pi * frequency * i / rate))
+            samples.extend([value] * channels)
+        return pygame.mixer.Sound(buffer=samples.tobytes())
+    
+    def play_sfx(self, name):
+        """効果音を鳴らす（デコード済みの効果音をチャンネルに渡すだけ）"""
+        sound = self.sfx_sounds.get(name)
+        if sound is None:
+            return False
+        
+        now = time.perf_counter()
+        
+        # 同じ効果音の連打と、効果音全体の鳴らしすぎを制限する
+        if now - self.sfx_last_played.get(name, -1.0) < self.SFX_MIN_INTERVAL:
+            self.sfx_dropped += 1
+            return False
+        self.sfx_tokens = min(self.SFX_BURST, self.sfx_tokens + (now - self.sfx_tokens_time) * self.SFX_RATE)
+        self.sfx_tokens_time = now
+        if self.sfx_tokens < 1.0:
+            self.sfx_dropped += 1
+            return False
+        
+        priority = self.SFX[name][0]
+        index = self.find_sfx_channel(priority)
+        if index is None:
+            self.sfx_dropped += 1
+            return False
+        
+        self.sfx_tokens -= 1.0
+        self.sfx_last_played[name] = now
+        
+        channel = self.sfx_channels[index]
+        channel.set_volume(self.volume)
+        channel.play(sound)
+        self.sfx_playing[index] = (priority, now)
+        self.sfx_played += 1
+        return True
+    
+    def find_sfx_channel(self, priority):
+        """効果音を鳴らすチャンネルを探す（空きが無い場合は優先度が同じか低い一番古い効果音を止める）"""
+        victim = None
+        for index, channel in enumerate(self.sfx_channels):
+            if not channel.get_busy():
+                return index
+            
+            playing_priority, started = self.sfx_playing[index]
+            if playing_priority > priority:
+                continue
+            if victim is None or (playing_priority, started) < self.sfx_playing[victim]:
+                victim = index
+        
+        if victim is not None:
+            self.sfx_stolen += 1
+        return victim
+    
+    def get_sound(self, music_type):
+        """デコード済みの音楽を取得（まだの場合はここでデコードする）"""
+        with self.sounds_lock:
+            sound = self.sounds.get(music_type)
+            if sound is not None:
+                return sound
+            
+            music_path = self.manifest.get(music_type) if self.manifest else None
+            if music_path is None:
+                return None
+            
+            start = time.perf_counter()
+            try:
+                sound = pygame.mixer.Sound(music_path)
+            except Exception as e:
+                logger.warning("Error loading music %s: %s", music_path, e)
+                return None
+            
+            self.sounds[music_type] = sound
+            logger.debug("Decoded music %s in %.1f ms (%.1f s)", music_path,
+                         (time.perf_counter() - start) * 1000, sound.get_length())
+            return sound
     
     def play_music(self, music_type):
-        """指定された種類の音楽を再生"""
+        """指定された種類の音楽を再生（クロスフェード用のスレッドに依頼するだけですぐに戻る）"""
         # オーディオシステムが初期化されていない場合は何もしない
         if not self.audio_initialized:
-            print("Cannot play music: Audio system not initialized")
+            logger.debug("Cannot play music: Audio system not initialized")
             return False
             
         if music_type not in self.music_files:
-            print(f"Unknown music type: {music_type}")
+            logger.warning("Unknown music type: %s", music_type)
             return False
         
         # 同じ音楽が既に再生中なら何もしない
         if self.current_music == music_type:
             return True
         
-        # 音楽ファイルのパスを試す（MP3とWAVの両方）
-        music_loaded = False
+        # ローディングより前に呼ばれた場合だけここでマニフェストを作る
+        if self.manifest is None:
+            self.build_manifest()
         
-        # デバッグ情報: 音楽ディレクトリのファイル一覧を表示
-        if os.path.exists(self.music_dir):
-            print(f"Files in music directory {self.music_dir}:")
-            try:
-                for f in os.listdir(self.music_dir):
-                    file_path = os.path.join(self.music_dir, f)
-                    size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
-                    readable = os.access(file_path, os.R_OK)
-                    print(f"  - {f} (Size: {size} bytes, Readable: {readable})")
-            except Exception as e:
-                print(f"Error listing directory: {e}")
-        else:
-            print(f"Music directory does not exist: {self.music_dir}")
-            print(f"Attempting to create directory: {self.music_dir}")
-            try:
-                os.makedirs(self.music_dir, exist_ok=True)
-                print(f"Directory created: {self.music_dir}")
-            except Exception as e:
-                print(f"Failed to create directory: {e}")
-            
-        for file_name in self.music_files[music_type]:
-            music_path = os.path.join(self.music_dir, file_name)
+        if self.manifest.get(music_type) is None:
+            logger.debug("No valid music file found for %s", music_type)
+            return False
+        
+        start = time.perf_counter()
+        self.current_music = music_type
+        self.request_transition(music_type, start)
+        self.max_request_time = max(self.max_request_time, time.perf_counter() - start)
+        return True
+    
+    def request_transition(self, music_type, requested_at):
+        """クロスフェード用のスレッドに曲の切り替えを依頼する（music_typeがNoneの場合は停止）"""
+        if self.crossfader is None:
+            self.crossfader = threading.Thread(target=self.run_crossfader, name="crossfade", daemon=True)
+            self.crossfader.start()
+        self.requests.put((music_type, requested_at))
+    
+    def run_crossfader(self):
+        """クロスフェード用のスレッドの処理"""
+        while True:
+            request = self.requests.get()
             
-            # ファイルが存在するか確認
-            print(f"Trying to load music: {music_path}")
-            if os.path.exists(music_path):
+            # 溜まった依頼は最後のものだけ処理する
+            while request is not None:
                 try:
-                    # 現在の音楽を停止
-                    pygame.mixer.music.stop()
-                    
-                    # 新しい音楽をロード
-                    print(f"Loading music file: {music_path}")
-                    pygame.mixer.music.load(music_path)
-                    
-                    # 音楽を再生（ループ再生）
-                    pygame.mixer.music.play(-1)
-                    
-                    # 現在の音楽を更新
-                    self.current_music = music_type
-                    
-                    music_loaded = True
-                    print(f"Playing music: {music_path}")
+                    request = self.requests.get_nowait()
+                except queue.Empty:
                     break
-                except Exception as e:
-                    print(f"Error loading music {music_path}: {e}")
-                    if os.path.exists(music_path):
-                        print(f"File size: {os.path.getsize(music_path)} bytes")
-                        print(f"File permissions: {oct(os.stat(music_path).st_mode)}")
-                        print(f"File readable: {os.access(music_path, os.R_OK)}")
-                    else:
-                        print(f"File does not exist: {music_path}")
-        
-        if not music_loaded:
-            print(f"No valid music file found for {music_type}")
-            return False
+            if request is None:
+                break
+            
+            try:
+                self.crossfade(*request)
+            except pygame.error as e:
+                # 終了処理でミキサーが先に止まった場合など
+                logger.debug("Crossfade stopped: %s", e)
+    
+    def crossfade(self, music_type, requested_at):
+        """今の曲をフェードアウトしながら次の曲をフェードインする"""
+        old_channel = self.channels[self.active_channel] if self.active_channel is not None else None
+        new_channel = None
         
-        return True
+        sound = self.get_sound(music_type) if music_type is not None else None
+        if sound is not None:
+            # 使っていない方のチャンネルで音量0から鳴らし始める
+            index = 0 if self.active_channel is None else 1 - self.active_channel
+            new_channel = self.channels[index]
+            new_channel.set_volume(0.0)
+            new_channel.play(sound, loops=-1)
+            self.active_channel = index
+            
+            latency = time.perf_counter() - requested_at
+            self.transitions += 1
+            self.transition_latency += latency
+            self.max_transition_latency = max(self.max_transition_latency, latency)
+            logger.debug("Music %s started %.1f ms after the request", music_type, latency * 1000)
+        else:
+            self.active_channel = None
+        
+        # 音量の合計が一定に聞こえるように sin/cos のカーブで音量を変える
+        steps = max(1, int(self.FADE_TIME / self.FADE_STEP))
+        for step in range(1, steps + 1):
+            angle = step / steps * math.pi / 2
+            if new_channel is not None:
+                new_channel.set_volume(self.volume * math.sin(angle))
+            if old_channel is not None:
+                old_channel.set_volume(self.volume * math.cos(angle))
+            
+            # 次の依頼が来たらフェードを切り上げる
+            if not self.requests.empty():
+                break
+            time.sleep(self.FADE_STEP)
+        
+        if old_channel is not None:
+            old_channel.stop()
+        if new_channel is not None:
+            new_channel.set_volume(self.volume)
     
     def stop_music(self):
-        """音楽を停止"""
-        if self.audio_initialized:
-            pygame.mixer.music.stop()
+        """音楽を停止（フェードアウトする）"""
+        if self.audio_initialized and self.current_music is not None:
+            self.request_transition(None, time.perf_counter())
+        self.current_music = None
+    
+    def shutdown(self):
+        """クロスフェード用のスレッドを止めて音楽をすぐに停止"""
+        if self.crossfader is not None:
+            self.requests.put(None)
+            self.crossfader.join(timeout=self.FADE_TIME * 2)
+            self.crossfader = None
+        for channel in self.channels + self.sfx_channels:
+            channel.stop()
+        self.active_channel = None
         self.current_music = None
     
     def set_volume(self, volume):
-        """音量を設定（0.0 ~ 1.0）"""
+        """音量を設定（0.0 ~ 1.0、フェード中はクロスフェード用のスレッドが反映する）"""
         self.volume = max(0.0, min(1.0, volume))
-        if self.audio_initialized:
-            pygame.mixer.music.set_volume(self.volume)
+        active_channel = self.active_channel
+        if active_channel is not None:
+            self.channels[active_channel].set_volume(self.volume)
     
     def get_volume(self):
         """現在の音量を取得"""
         return self.volume
+    
+    def report(self):
+        """曲の切り替えのレポートを文字列で取得"""
+        average = self.transition_latency / self.transitions if self.transitions else 0.0
+        if not self.audio_initialized:
+            return "Audio: disabled"
+        return (f"Audio: {self.audio_profile} profile initialized in {self.audio_init_time * 1000:.1f} ms "
+                f"({self.get_output_latency() * 1000:.1f} ms buffer); "
+                f"music transitions: {self.transitions} "
+                f"(avg latency {average * 1000:.1f} ms, max {self.max_transition_latency * 1000:.1f} ms), "
+                f"max {self.max_request_time * 1000:.2f} ms on the main thread; "
+                f"sound effects: {self.sfx_played} played, {self.sfx_stolen} stolen, {self.sfx_dropped} dropped")
@@ -0,0 +1,124 @@
+import pygame
+from collections import OrderedDict
+
+class PanelCache:
+    # 角の外側の透明部分に使う色（パネルの色としては使わない）
+    COLOR_KEY = (255, 0, 255)
+
+    def __init__(self, max_size=256):
+        """角丸の枠付きパネル（ボタンや背景）のキャッシュの初期化"""
+        self.max_size = max_size
+
+        # スタイル -> 9分割の元画像（角と辺と中央）
+        self.slices = {}
+
+        # (サイズ, スタイル) -> 組み立て済みのパネル
+        self.panels = OrderedDict()
+
+        # 統計情報
+        self.draw_calls = 0  # パネルを作るために使ったpygame.drawの呼び出し回数
+        self.blits = 0       # パネルを画面に描画した回数
+
+    def get_slice(self, style):
+        """スタイルごとの9分割の元画像を取得（スタイルごとに一度だけ描画する）"""
+        surface = self.slices.get(style)
+        if surface is None:
+            fill, border_color, border_width, radius = style
+            corner = max(radius, border_width)
+            size = corner * 2 + 1
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            self.draw_rounded_rect(surface, (0, 0, size, size), style)
+            self.slices[style] = surface
+        return surface
+
+    def draw_rounded_rect(self, surface, rect, style):
+        """角丸の矩形と枠線を直接描画"""
+        fill, border_color, border_width, radius = style
+        if fill is not None:
+            pygame.draw.rect(surface, fill, rect, border_radius=radius)
+            self.draw_calls += 1
+        if border_color is not None and border_width > 0:
+            pygame.draw.rect(surface, border_color, rect, border_width, border_radius=radius)
+            self.draw_calls += 1
+
+    def build_panel(self, size, style):
+        """9分割の元画像を引き伸ばしてパネルを組み立てる"""
+        width, height = size
+        fill, border_color, border_width, radius = style
+        corner = max(radius, border_width)
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+
+        if width < corner * 2 + 1 or height < corner * 2 + 1:
+            # 角が収まらない小さなパネルは直接描画する
+            self.draw_rounded_rect(panel, (0, 0, width, height), style)
+            return panel
+
+        source = self.get_slice(style)
+        middle_width = width - corner * 2
+        middle_height = height - corner * 2
+        right = width - corner
+        bottom = height - corner
+
+        # 四隅
+        panel.blit(source, (0, 0), (0, 0, corner, corner))
+        panel.blit(source, (right, 0), (corner + 1, 0, corner, corner))
+        panel.blit(source, (0, bottom), (0, corner + 1, corner, corner))
+        panel.blit(source, (right, bottom), (corner + 1, corner + 1, corner, corner))
+
+        # 上下左右の辺と中央（1ピクセル幅の帯を引き伸ばす）
+        if corner > 0:
+            edges = [
+                ((corner, 0, 1, corner), (middle_width, corner), (corner, 0)),
+                ((corner, corner + 1, 1, corner), (middle_width, corner), (corner, bottom)),
+                ((0, corner, corner, 1), (corner, middle_height), (0, corner)),
+                ((corner + 1, corner, corner, 1), (corner, middle_height), (right, corner))
+            ]
+            for area, stretched_size, position in edges:
+                strip = source.subsurface(area)
+                panel.blit(pygame.transform.scale(strip, stretched_size), position)
+
+        center = source.subsurface((corner, corner, 1, 1))
+        panel.blit(pygame.transform.scale(center, (middle_width, middle_height)), (corner, corner))
+        return panel
+
+    def to_color_key(self, panel):
+        """透明部分をカラーキーにしたサーフェスに変換する
+        （角丸は半透明のピクセルを持たないので、ピクセルごとのアルファより速く描画できる）"""
+        keyed = pygame.Surface(panel.get_size())
+        if pygame.display.get_surface() is not None:
+            keyed = keyed.convert()
+        keyed.fill(self.COLOR_KEY)
+        keyed.blit(panel, (0, 0))
+        keyed.set_colorkey(self.COLOR_KEY, pygame.RLEACCEL)
+        return keyed
+
+    def get_panel(self, size, fill, border_color=None, border_width=0, radius=0):
+        """パネルを取得（同じサイズとスタイルは組み立て済みのものを使う）"""
+        width, height = int(size[0]), int(size[1])
+        # pygameと同じく角の半径は短い辺の半分まで
+        radius = max(0, min(radius, min(width, height) // 2))
+        style = (fill, border_color, border_width, radius)
+        key = ((width, height), style)
+
+        panel = self.panels.get(key)
+        if panel is not None:
+            self.panels.move_to_end(key)
+            return panel
+
+        panel = self.to_color_key(self.build_panel((width, height), style))
+        self.panels[key] = panel
+
+        # 古いパネルを破棄
+        if len(self.panels) > self.max_size:
+            self.panels.popitem(last=False)
+
+        return panel
+
+    def draw(self, surface, rect, fill, border_color=None, border_width=0, radius=0):
+        """パネルを描画"""
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return
+
+        surface.blit(self.get_panel(rect.size, fill, border_color, border_width, radius), rect.topleft)
+        self.blits += 1
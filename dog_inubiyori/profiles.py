@@ -0,0 +1,219 @@
+import time
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from game_state import GameState
+from utils import SaveManager
+
+logger = logging.getLogger(__name__)
+
+class TrainerProfile:
+    def __init__(self, trainer_id, save_dir):
+        """1人のトレーナーのセーブデータとゲームの状態（使う時はlockを取る）"""
+        self.trainer_id = trainer_id
+        self.game_state = GameState(save_dir)
+        self.lock = threading.Lock()
+
+        # 最後に使った時刻（使われていないプロファイルを破棄するため）
+        self.last_used = time.monotonic()
+
+        # キャッシュから破棄された後はセーブデータを書き換えない
+        self.evicted = False
+
+    def find_dog(self, dog_id):
+        """IDで飼っている犬を探す"""
+        for dog in self.game_state.dogs:
+            if dog.id == dog_id:
+                return dog
+        return None
+
+    def flush(self):
+        """犬を保存する（トレーナーと墓地のデータは変更した時に保存済み）"""
+        self.game_state.save()
+
+    def to_dict(self):
+        """トレーナーと犬の状態"""
+        game_state = self.game_state
+        game_state.expire_message()
+        return {
+            "trainer_id": self.trainer_id,
+            "trainer": game_state.trainer_data,
+            "state": game_state.state,
+            "message": game_state.message,
+            "current_dog_id": game_state.dog.id if game_state.dog else None,
+            "dogs": [dict(dog.to_dict(), mood=dog.get_mood()) for dog in game_state.dogs],
+            "graveyard_size": len(game_state.save_manager.graveyard)
+        }
+
+class ProfileCache:
+    def __init__(self, root_dir=None, capacity=256, on_load=None, on_evict=None):
+        """最近使ったトレーナーだけを読み込んでおくキャッシュの初期化
+
+        capacity を超えたら最も長く使われていないトレーナーを保存してから破棄する
+        on_load / on_evict: プロファイルを読み込んだ時と破棄した時に呼ぶ関数（引数はプロファイル）
+        """
+        self.root_dir = root_dir or SaveManager.TRAINERS_DIR
+        self.capacity = capacity
+        self.on_load = on_load
+        self.on_evict = on_evict
+
+        # トレーナーID -> TrainerProfile（古い順）
+        self.profiles = OrderedDict()
+        self.lock = threading.Lock()
+
+        # 読み込み中か破棄して保存中のトレーナーID -> 終わったらセットするイベント
+        # ディスクの読み書きはロックの外で行い、その間に同じトレーナーを読み込まないように待たせる
+        self.pending = {}
+
+        # 統計情報
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.profiles)
+
+    def get_trainer_ids(self):
+        """読み込み済みのトレーナーIDの一覧"""
+        with self.lock:
+            return list(self.profiles)
+
+    def get_profiles(self):
+        """読み込み済みのプロファイルの一覧"""
+        with self.lock:
+            return list(self.profiles.values())
+
+    def get(self, trainer_id, create=False):
+        """トレーナーのプロファイルを取得（読み込んでいなければセーブデータから読み込む）
+
+        セーブデータが無い場合は create=True の時だけ作成し、それ以外はNoneを返す
+        """
+        save_dir = SaveManager.get_trainer_save_dir(trainer_id, self.root_dir)
+
+        while True:
+            with self.lock:
+                profile = self.profiles.get(trainer_id)
+                if profile is not None:
+                    self.profiles.move_to_end(trainer_id)
+                    profile.last_used = time.monotonic()
+                    self.hits += 1
+                    return profile
+
+                pending = self.pending.get(trainer_id)
+                if pending is None:
+                    done = self.pending[trainer_id] = threading.Event()
+                    break
+
+            # 他のスレッドが読み込みか保存をしている間は待ってからやり直す
+            pending.wait()
+
+        # 読み込みと破棄したトレーナーの保存はロックの外で行う
+        evicted = []
+        try:
+            profile = None
+            if create or SaveManager.has_save_data(save_dir):
+                profile = TrainerProfile(trainer_id, save_dir)
+
+            with self.lock:
+                if profile is not None:
+                    self.misses += 1
+                    self.profiles[trainer_id] = profile
+                    evicted = self.pop_oldest(lambda old_profile: len(self.profiles) > self.capacity)
+        finally:
+            self.finish_pending(trainer_id, done)
+
+        self.retire_all(evicted)
+        if profile is not None:
+            logger.debug("Trainer loaded: %s (%d dogs)", trainer_id, len(profile.game_state.dogs))
+            if self.on_load is not None:
+                self.on_load(profile)
+        return profile
+
+    def pop_oldest(self, should_evict):
+        """古い順に should_evict が真の間だけプロファイルを取り除く（ロックを取った状態で呼ぶ）
+
+        取り除いたトレーナーは保存が終わるまで読み込まないように pending に入れる
+        """
+        evicted = []
+        while self.profiles:
+            trainer_id, profile = next(iter(self.profiles.items()))
+            if not should_evict(profile):
+                break
+            del self.profiles[trainer_id]
+            self.pending[trainer_id] = threading.Event()
+            evicted.append(profile)
+        return evicted
+
+    def finish_pending(self, trainer_id, done):
+        """読み込みか保存が終わったことを待っているスレッドに知らせる"""
+        with self.lock:
+            del self.pending[trainer_id]
+        done.set()
+
+    @contextmanager
+    def use(self, trainer_id, create=False):
+        """プロファイルをロックした状態で使う（破棄された直後の場合は読み込み直す）"""
+        while True:
+            profile = self.get(trainer_id, create)
+            if profile is None:
+                yield None
+                return
+
+            with profile.lock:
+                if not profile.evicted:
+                    yield profile
+                    return
+
+    def retire(self, profile):
+        """破棄するプロファイルを保存する"""
+        with profile.lock:
+            try:
+                profile.flush()
+            finally:
+                profile.evicted = True
+
+    def retire_all(self, evicted):
+        """取り除いたプロファイルを保存して、同じトレーナーを読み込めるようにする（ロックの外で呼ぶ）
+
+        on_evict は同じトレーナーを読み込めるようにする前に呼ぶ
+        （読み込み直したプロファイルの on_load の後に古いプロファイルの on_evict が来ないように）
+        """
+        for profile in evicted:
+            try:
+                try:
+                    self.retire(profile)
+                except OSError:
+                    logger.exception("Failed to save trainer: %s", profile.trainer_id)
+                logger.debug("Trainer evicted: %s", profile.trainer_id)
+                if self.on_evict is not None:
+                    self.on_evict(profile)
+            finally:
+                with self.lock:
+                    self.evictions += 1
+                    done = self.pending.pop(profile.trainer_id)
+                done.set()
+
+    def evict_idle(self, max_idle):
+        """max_idle 秒以上使われていないプロファイルを保存して破棄する"""
+        deadline = time.monotonic() - max_idle
+        with self.lock:
+            # 古い順に並んでいるので、使われたものが出てきたら終わり
+            evicted = self.pop_oldest(lambda profile: profile.last_used <= deadline)
+
+        self.retire_all(evicted)
+        return len(evicted)
+
+    def flush_all(self):
+        """読み込み済みのすべてのプロファイルを保存する"""
+        for profile in self.get_profiles():
+            with profile.lock:
+                if not profile.evicted:
+                    profile.flush()
+
+    def report(self):
+        """キャッシュの効果のレポートを文字列で取得"""
+        total = self.hits + self.misses
+        hit_rate = self.hits / total * 100 if total else 0.0
+        return (f"Profiles: {len(self.profiles)}/{self.capacity} loaded, {hit_rate:.1f}% hits "
+                f"({self.misses} loads), {self.evictions} evicted")
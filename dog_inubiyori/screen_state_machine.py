@@ -0,0 +1,107 @@
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+class ScreenState:
+    def __init__(self, name, on_enter=None, on_exit=None, next_states=(), prefetch=None):
+        """画面の状態の初期化"""
+        self.name = name
+        self.on_enter = on_enter          # 画面に入った時の処理 on_enter(前の画面)
+        self.on_exit = on_exit            # 画面を出る時の処理 on_exit(次の画面)
+        self.next_states = next_states    # 次に表示されそうな画面
+        self.prefetch = prefetch          # 事前読み込みの作業一覧を返す関数
+
+class ScreenStateMachine:
+    def __init__(self, max_workers=1):
+        """画面の切り替えを管理するステートマシンの初期化"""
+        self.states = {}
+        self.current = None
+
+        # 次の画面のアセットを事前に用意するワーカースレッド
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        # (future, メインスレッドで結果を反映する関数)
+        self.pending = []
+
+        # 統計情報
+        self.transitions = 0
+        self.transition_time = 0.0
+        self.max_transition_time = 0.0
+        self.prefetch_jobs = 0
+
+    def add_state(self, name, on_enter=None, on_exit=None, next_states=(), prefetch=None):
+        """画面を登録"""
+        self.states[name] = ScreenState(name, on_enter, on_exit, next_states, prefetch)
+
+    def start(self, name):
+        """最初の画面に入る"""
+        self.current = None
+        self.transition(name)
+
+    def transition(self, name):
+        """画面を切り替える（切り替わった場合はTrueを返す）"""
+        if name == self.current:
+            return False
+
+        start = time.perf_counter()
+        previous = self.states.get(self.current)
+        state = self.states.get(name)
+
+        if previous is not None and previous.on_exit:
+            previous.on_exit(name)
+
+        previous_name = self.current
+        self.current = name
+
+        if state is not None:
+            if state.on_enter:
+                state.on_enter(previous_name)
+            self.prefetch_next(state)
+
+        elapsed = time.perf_counter() - start
+        self.transitions += 1
+        self.transition_time += elapsed
+        self.max_transition_time = max(self.max_transition_time, elapsed)
+        return True
+
+    def prefetch_next(self, state):
+        """次に表示されそうな画面のアセットをワーカースレッドで用意する"""
+        for next_name in state.next_states:
+            next_state = self.states.get(next_name)
+            if next_state is None or next_state.prefetch is None:
+                continue
+
+            # 作業一覧はメインスレッドで作る（ゲームの状態を読むため）
+            for compute, apply in next_state.prefetch():
+                self.pending.append((self.executor.submit(compute), apply))
+                self.prefetch_jobs += 1
+
+    def poll(self):
+        """終わった事前読み込みの結果をメインスレッドで反映する"""
+        if not self.pending:
+            return
+
+        remaining = []
+        for future, apply in self.pending:
+            if not future.done():
+                remaining.append((future, apply))
+                continue
+
+            try:
+                apply(future.result())
+            except Exception as e:
+                logger.warning("事前読み込みエラー: %s", e)
+        self.pending = remaining
+
+    def shutdown(self):
+        """ワーカースレッドを停止"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending = []
+
+    def report(self):
+        """画面切り替えのレポートを文字列で取得"""
+        average = self.transition_time / self.transitions if self.transitions else 0.0
+        return (f"Screen transitions: {self.transitions} "
+                f"(avg {average * 1000:.2f} ms, max {self.max_transition_time * 1000:.2f} ms), "
+                f"{self.prefetch_jobs} prefetch jobs")
@@ -0,0 +1,118 @@
+import pygame
+
+class ScrollView:
+    def __init__(self, x, y, width, height, item_width, item_height, columns, margin_x=0, margin_y=0,
+                 content_padding=0):
+        """グリッド状に並んだ項目のスクロール表示領域の初期化"""
+        # 表示領域（ビューポート）
+        self.rect = pygame.Rect(x, y, width, height)
+
+        # 項目のサイズと配置
+        self.item_width = item_width
+        self.item_height = item_height
+        self.columns = columns
+        self.margin_x = margin_x
+        self.margin_y = margin_y
+
+        # 項目の間隔
+        self.step_x = item_width + margin_x
+        self.step_y = item_height + margin_y
+
+        # 最後の行の下に確保する余白（項目が次の行にはみ出す場合など）
+        self.content_padding = content_padding
+
+        # 項目数とスクロール位置
+        self.item_count = 0
+        self.scroll_offset = 0
+
+    def set_item_count(self, item_count):
+        """項目数を設定（スクロール位置も範囲内に収める）"""
+        self.item_count = item_count
+        self.scroll_offset = max(0, min(self.scroll_offset, self.get_max_scroll()))
+
+    def get_row_count(self):
+        """行数を取得"""
+        return (self.item_count + self.columns - 1) // self.columns
+
+    def get_content_height(self):
+        """全項目を並べた時の高さ"""
+        rows = self.get_row_count()
+        if rows == 0:
+            return 0
+        return rows * self.step_y - self.margin_y + self.content_padding
+
+    def get_max_scroll(self):
+        """スクロールできる最大量"""
+        return max(0, self.get_content_height() - self.rect.height)
+
+    def scroll(self, delta):
+        """スクロール位置を変更（変化した場合はTrueを返す）"""
+        old_offset = self.scroll_offset
+        self.scroll_offset = max(0, min(self.scroll_offset + delta, self.get_max_scroll()))
+        return self.scroll_offset != old_offset
+
+    def scroll_to_top(self):
+        """先頭までスクロール"""
+        self.scroll_offset = 0
+
+    def get_visible_range(self):
+        """表示領域に入っている項目の範囲（開始, 終了）を取得"""
+        if self.item_count == 0:
+            return 0, 0
+
+        first_row = self.scroll_offset // self.step_y
+        last_row = (self.scroll_offset + self.rect.height) // self.step_y + 1
+
+        start = min(self.item_count, first_row * self.columns)
+        end = min(self.item_count, last_row * self.columns)
+        return start, end
+
+    def get_item_position(self, index):
+        """項目の画面上の位置を取得"""
+        row = index // self.columns
+        col = index % self.columns
+        x = self.rect.x + col * self.step_x
+        y = self.rect.y + row * self.step_y - self.scroll_offset
+        return x, y
+
+    def get_item_rect(self, index):
+        """項目の画面上の矩形を取得（表示領域の外にはみ出した部分は除く）"""
+        x, y = self.get_item_position(index)
+        return pygame.Rect(x, y, self.item_width, self.item_height).clip(self.rect)
+
+    def get_index_at(self, pos):
+        """画面上の位置にある項目の番号を取得（O(1)、項目がない場合はNone）"""
+        if not self.rect.collidepoint(pos):
+            return None
+
+        local_x = pos[0] - self.rect.x
+        local_y = pos[1] - self.rect.y + self.scroll_offset
+
+        col = local_x // self.step_x
+        row = local_y // self.step_y
+        if col >= self.columns:
+            return None
+
+        # 項目の間の余白はヒットしない
+        if local_x - col * self.step_x > self.item_width or local_y - row * self.step_y > self.item_height:
+            return None
+
+        index = row * self.columns + col
+        if index >= self.item_count:
+            return None
+
+        return index
+
+    def draw_scrollbar(self, screen, color, thumb_color):
+        """スクロールバーを描画（スクロールが不要な場合は描画しない）"""
+        content_height = self.get_content_height()
+        if content_height <= self.rect.height:
+            return
+
+        bar_x = self.rect.right - 8
+        pygame.draw.rect(screen, color, (bar_x, self.rect.y, 6, self.rect.height), border_radius=3)
+
+        # つまみのサイズと位置
+        thumb_height = max(20, self.rect.height * self.rect.height // content_height)
+        thumb_y = self.rect.y + (self.rect.height - thumb_height) * self.scroll_offset // self.get_max_scroll()
+        pygame.draw.rect(screen, thumb_color, (bar_x, thumb_y, 6, thumb_height), border_radius=3)
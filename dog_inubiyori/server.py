@@ -0,0 +1,365 @@
+"""ウィンドウを開かずに複数のトレーナーの犬舎をシミュレーションするサーバー
+
+使い方: python server.py [--port 8080] [--root セーブデータのディレクトリ] [--capacity 256]
+
+localhostだけで待ち受けるJSONのAPI:
+  GET  /trainers                     読み込み済み（メモリ上）のトレーナーの一覧
+  GET  /trainers/<id>                トレーナーと犬の状態
+  POST /trainers/<id>                トレーナーを作成（既にあれば読み込む）
+  POST /trainers/<id>/dogs           犬を迎える {"dog_type": "柴犬", "name": "ポチ"}
+  POST /trainers/<id>/select         犬を選ぶ {"dog_id": "dog_..."}
+  POST /trainers/<id>/actions        お世話をする {"action": "feed", "dog_id": "dog_..."}
+  GET  /stats                        サーバーの統計情報
+"""
+import json
+import zlib
+import time
+import logging
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from timer_wheel import TimerWheel
+from profiles import ProfileCache
+from utils import SaveManager
+from game_logging import setup_logging
+
+logger = logging.getLogger(__name__)
+
+class KennelServer:
+    # 犬舎のステータスを更新する間隔（ミリ秒、ゲームと同じ1秒）
+    SIMULATION_INTERVAL = 1000
+
+    # 犬を保存する間隔（ミリ秒）
+    AUTOSAVE_INTERVAL = 5000
+
+    # 使われていないトレーナーを確認する間隔と、メモリから破棄するまでの時間（ミリ秒）
+    IDLE_CHECK_INTERVAL = 60 * 1000
+    IDLE_TIMEOUT = 10 * 60 * 1000
+
+    # 迎えられる犬種
+    DOG_TYPES = ["コーギー", "ミニチュアダックスフンド", "柴犬"]
+
+    # APIで使える英語のアクション名
+    ACTIONS = {
+        "feed": "ご飯をあげる",
+        "walk": "散歩にいく",
+        "train": "しつけをする",
+        "clean": "トイレを片付ける",
+        "play": "おもちゃで遊ぶ"
+    }
+
+    def __init__(self, root_dir=None, capacity=256):
+        """複数のトレーナーの犬舎をまとめて更新するサーバーの初期化
+
+        最近使った capacity 人までのトレーナーをメモリに置き、それ以外は保存して破棄する
+        """
+        # 読み込み中のトレーナー（破棄されたら更新を止める）
+        self.profiles = ProfileCache(root_dir, capacity, on_load=self.schedule_profile,
+                                     on_evict=self.unschedule_profile)
+
+        # すべてのトレーナーの更新と保存を1つのタイマーホイールで管理
+        self.start_time = time.monotonic()
+        self.timers = TimerWheel(self.now_ms())
+        self.timers_lock = threading.Lock()
+        # 期限が来た処理（タイマーからは積むだけにして、timers_lock を放してから実行する）
+        self.due_jobs = []
+        self.timers.every("evict_idle", self.IDLE_CHECK_INTERVAL, self.defer(self.evict_idle))
+
+        # 停止した時と、眠っている間に新しいタイマーが登録された時に更新用のスレッドを起こす
+        self.stopping = False
+        self.wake_event = threading.Event()
+        self.tick_thread = None
+
+        # 統計情報
+        self.requests = 0
+        self.errors = 0
+        self.simulations = 0
+        self.simulation_time = 0.0
+        self.saves = 0
+        self.stats_lock = threading.Lock()
+
+    def now_ms(self):
+        """サーバーを起動してからのミリ秒"""
+        return int((time.monotonic() - self.start_time) * 1000)
+
+    def defer(self, job):
+        """タイマーに登録する関数（期限が来たら job を実行待ちに積む）"""
+        return lambda: self.due_jobs.append(job)
+
+    def schedule_profile(self, profile):
+        """トレーナーの更新と保存をタイマーに登録（一斉に動かないように開始をずらす）"""
+        offset = zlib.crc32(profile.trainer_id.encode("utf-8")) % self.SIMULATION_INTERVAL
+        trainer_id = profile.trainer_id
+        with self.timers_lock:
+            self.timers.schedule(f"simulate:{trainer_id}", offset,
+                                 self.defer(lambda: self.simulate(profile)), self.SIMULATION_INTERVAL)
+            self.timers.schedule(f"save:{trainer_id}", self.AUTOSAVE_INTERVAL + offset,
+                                 self.defer(lambda: self.save(profile)), self.AUTOSAVE_INTERVAL)
+        self.wake_event.set()
+
+    def unschedule_profile(self, profile):
+        """メモリから破棄したトレーナーの更新と保存を止める"""
+        with self.timers_lock:
+            self.timers.cancel(f"simulate:{profile.trainer_id}")
+            self.timers.cancel(f"save:{profile.trainer_id}")
+
+    def evict_idle(self):
+        """しばらく使われていないトレーナーを保存してメモリから破棄する"""
+        evicted = self.profiles.evict_idle(self.IDLE_TIMEOUT / 1000)
+        if evicted:
+            logger.info("Evicted %d idle trainers", evicted)
+
+    def simulate(self, profile):
+        """1人のトレーナーの犬のステータスを更新"""
+        start = time.perf_counter()
+        with profile.lock:
+            if profile.evicted:
+                return
+            profile.game_state.simulate()
+            profile.game_state.expire_message()
+        elapsed = time.perf_counter() - start
+
+        with self.stats_lock:
+            self.simulations += 1
+            self.simulation_time += elapsed
+
+    def save(self, profile):
+        """1人のトレーナーの犬を保存"""
+        with profile.lock:
+            if profile.evicted:
+                return
+            profile.flush()
+
+        with self.stats_lock:
+            self.saves += 1
+
+    def run_ticks(self):
+        """期限が来たトレーナーだけを更新し、次の期限まで眠る"""
+        while not self.stopping:
+            with self.timers_lock:
+                self.timers.advance(self.now_ms())
+                jobs, self.due_jobs = self.due_jobs, []
+
+            # 処理の中でトレーナーを破棄するとタイマーを取り消すので、ロックの外で実行する
+            for job in jobs:
+                job()
+
+            with self.timers_lock:
+                wait_ms = self.timers.time_until_next(self.now_ms())
+            self.wake_event.wait(wait_ms / 1000)
+            self.wake_event.clear()
+
+    def start(self):
+        """更新用のスレッドを開始"""
+        self.tick_thread = threading.Thread(target=self.run_ticks, name="kennel-ticks", daemon=True)
+        self.tick_thread.start()
+
+    def shutdown(self):
+        """更新を止めてすべてのトレーナーの犬を保存"""
+        self.stopping = True
+        self.wake_event.set()
+        if self.tick_thread is not None:
+            self.tick_thread.join()
+
+        self.profiles.flush_all()
+        logger.info(self.report())
+        logger.info(self.profiles.report())
+
+    def handle(self, method, path, body):
+        """APIのリクエストを処理して (ステータスコード, JSONにするデータ) を返す"""
+        parts = [part for part in path.split("?")[0].split("/") if part]
+
+        if method == "GET" and parts == ["stats"]:
+            return 200, self.get_stats()
+
+        if not parts or parts[0] != "trainers":
+            return 404, {"error": "not found"}
+
+        if len(parts) == 1:
+            if method != "GET":
+                return 405, {"error": "method not allowed"}
+            return 200, {"trainers": sorted(self.profiles.get_trainer_ids())}
+
+        trainer_id = parts[1]
+        if not SaveManager.is_valid_trainer_id(trainer_id):
+            return 400, {"error": "invalid trainer id"}
+
+        command = parts[2] if len(parts) > 2 else None
+        if len(parts) > 3 or command not in (None, "dogs", "select", "actions"):
+            return 404, {"error": "not found"}
+
+        if method == "GET" and command is not None:
+            return 405, {"error": "method not allowed"}
+
+        with self.profiles.use(trainer_id, create=(method == "POST")) as profile:
+            if profile is None:
+                return 404, {"error": "unknown trainer"}
+            if command is None:
+                return 200, profile.to_dict()
+            if command == "dogs":
+                return self.adopt_dog(profile, body)
+            if command == "select":
+                return self.select_dog(profile, body)
+            return self.perform_action(profile, body)
+
+    def adopt_dog(self, profile, body):
+        """新しい犬を迎える（プロファイルはロック済み）"""
+        dog_type = body.get("dog_type")
+        if dog_type not in self.DOG_TYPES:
+            return 400, {"error": f"dog_type must be one of {self.DOG_TYPES}"}
+
+        game_state = profile.game_state
+        game_state.begin_name_entry(dog_type)
+        game_state.finish_name_entry(str(body.get("name", ""))[:10])
+        return 201, profile.to_dict()
+
+    def select_dog(self, profile, body):
+        """お世話をする犬を選ぶ（プロファイルはロック済み）"""
+        if profile.find_dog(body.get("dog_id")) is None:
+            return 404, {"error": "unknown dog"}
+        profile.game_state.select_dog(body["dog_id"])
+        return 200, profile.to_dict()
+
+    def perform_action(self, profile, body):
+        """選んでいる犬（dog_idがあればその犬）のお世話をする（プロファイルはロック済み）"""
+        action = body.get("action")
+        game_state = profile.game_state
+        if isinstance(action, str):
+            action = self.ACTIONS.get(action, action)
+        if not isinstance(action, str) or action not in game_state.actions:
+            return 400, {"error": f"action must be one of {list(self.ACTIONS)}"}
+
+        dog_id = body.get("dog_id")
+        if dog_id is not None and (game_state.dog is None or game_state.dog.id != dog_id):
+            if profile.find_dog(dog_id) is None:
+                return 404, {"error": "unknown dog"}
+            game_state.select_dog(dog_id)
+
+        if game_state.dog is None or not game_state.dog.is_alive:
+            return 409, {"error": "no dog selected"}
+
+        game_state.perform_action(action)
+        return 200, profile.to_dict()
+
+    def record_request(self, status):
+        """リクエストの件数を記録"""
+        with self.stats_lock:
+            self.requests += 1
+            if status >= 500:
+                self.errors += 1
+
+    def get_stats(self):
+        """サーバーの統計情報を取得"""
+        profiles = self.profiles.get_profiles()
+        trainers = len(profiles)
+        dogs = sum(len(profile.game_state.dogs) for profile in profiles)
+        with self.stats_lock:
+            return {
+                "uptime": self.now_ms() / 1000,
+                "trainers": trainers,
+                "dogs": dogs,
+                "requests": self.requests,
+                "errors": self.errors,
+                "simulations": self.simulations,
+                "average_simulation_ms": self.simulation_time * 1000 / self.simulations if self.simulations else 0.0,
+                "saves": self.saves,
+                "timer_ticks": self.timers.ticks_processed
+            }
+
+    def report(self):
+        """サーバーの実行状況のレポートを文字列で取得"""
+        stats = self.get_stats()
+        return (f"Kennel server: {stats['trainers']} trainers, {stats['dogs']} dogs, "
+                f"{stats['requests']} requests ({stats['errors']} errors) in {stats['uptime']:.1f}s, "
+                f"{stats['simulations']} simulations (avg {stats['average_simulation_ms']:.2f} ms), "
+                f"{stats['saves']} saves")
+
+class KennelRequestHandler(BaseHTTPRequestHandler):
+    # 同じ接続で続けてリクエストを受けられるようにする
+    protocol_version = "HTTP/1.1"
+
+    # ヘッダーとボディを別々に送るので、Nagleのアルゴリズムで応答が遅れないようにする
+    disable_nagle_algorithm = True
+
+    # ボディの最大サイズ（バイト）
+    MAX_BODY = 64 * 1024
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def dispatch(self, method):
+        kennel = self.server.kennel
+        try:
+            body = self.read_body() if method == "POST" else {}
+            status, data = kennel.handle(method, self.path, body)
+        except ValueError as e:
+            status, data = 400, {"error": str(e)}
+        except Exception:
+            logger.exception("Request failed: %s %s", method, self.path)
+            status, data = 500, {"error": "internal error"}
+
+        kennel.record_request(status)
+        self.send_json(status, data)
+
+    def read_body(self):
+        """リクエストのJSONを読み込む"""
+        length = int(self.headers.get("Content-Length") or 0)
+        if length < 0:
+            # 負の長さで読むと接続が切れるまで待ってしまう
+            raise ValueError("invalid Content-Length")
+        if length > self.MAX_BODY:
+            raise ValueError("request body too large")
+        if length == 0:
+            return {}
+        body = json.loads(self.rfile.read(length).decode("utf-8"))
+        if not isinstance(body, dict):
+            raise ValueError("request body must be a JSON object")
+        return body
+
+    def send_json(self, status, data):
+        """JSONのレスポンスを送る"""
+        payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # アクセスログは画面に出さずにリングバッファにだけ残す
+        logger.debug("%s - " + format, self.address_string(), *args)
+
+def create_server(kennel, port=8080, host="127.0.0.1"):
+    """犬舎のAPIのHTTPサーバーを作成（port=0の場合は空いているポートを使う）"""
+    httpd = ThreadingHTTPServer((host, port), KennelRequestHandler)
+    httpd.daemon_threads = True
+    httpd.kennel = kennel
+    return httpd
+
+def main():
+    parser = argparse.ArgumentParser(description="犬びよりのヘッドレスサーバー")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--root", default=SaveManager.TRAINERS_DIR, help="トレーナーごとのセーブデータを置くディレクトリ")
+    parser.add_argument("--capacity", type=int, default=256, help="メモリに置いておくトレーナーの最大数")
+    args = parser.parse_args()
+
+    setup_logging()
+    kennel = KennelServer(args.root, args.capacity)
+    kennel.start()
+    httpd = create_server(kennel, args.port)
+    logger.info("Kennel server listening on http://127.0.0.1:%d (saves: %s)", httpd.server_address[1],
+                kennel.profiles.root_dir)
+
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        kennel.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import pygame
+import threading
+from animation import Animation
+
+class SpriteAtlas:
+    # 全画面・全UIインスタンスで共有するアトラス
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        """スプライトアトラスの初期化"""
+        # 1枚のサーフェスに全フレームをまとめる
+        self.surface = None
+
+        # (犬種, 成長段階) -> {アニメーション名: [サブサーフェス]}
+        self.frames = {}
+
+        # (犬種, 成長段階, アニメーション名, フレーム番号) -> アトラス上の矩形
+        self.regions = {}
+
+        # セルのサイズ（最大のフレームサイズ）
+        self.cell_width = max(size[0] for size in Animation.GROWTH_SIZES.values())
+        self.cell_height = max(size[1] for size in Animation.GROWTH_SIZES.values())
+
+        self.baked = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        """共有のスプライトアトラスを取得"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = SpriteAtlas()
+        return cls._shared
+
+    def get_keys(self):
+        """アトラスに含める (犬種, 成長段階) の一覧"""
+        return [(dog_type, growth_stage)
+                for dog_type in Animation.DOG_COLORS
+                for growth_stage in Animation.GROWTH_SIZES]
+
+    def bake(self):
+        """すべての犬種×成長段階×アニメーションのフレームをアトラスに焼き込む"""
+        with self.lock:
+            if self.baked:
+                return
+
+            keys = self.get_keys()
+            columns = len(Animation.ANIMATION_NAMES) * Animation.FRAMES_PER_ANIMATION
+            atlas = pygame.Surface((self.cell_width * columns, self.cell_height * len(keys)), pygame.SRCALPHA)
+
+            regions = {}
+            for row, (dog_type, growth_stage) in enumerate(keys):
+                animations = Animation.create_placeholder_frames(dog_type, growth_stage)
+
+                column = 0
+                for animation_name in Animation.ANIMATION_NAMES:
+                    for frame_index, frame in enumerate(animations[animation_name]):
+                        x = column * self.cell_width
+                        y = row * self.cell_height
+                        atlas.blit(frame, (x, y))
+                        regions[(dog_type, growth_stage, animation_name, frame_index)] = pygame.Rect(
+                            x, y, frame.get_width(), frame.get_height()
+                        )
+                        column += 1
+
+            self.load_from_surface(atlas, regions)
+
+    def load_from_surface(self, atlas, regions):
+        """焼き込み済みのアトラスと矩形からサブサーフェスを作成"""
+        frames = {}
+        for (dog_type, growth_stage, animation_name, frame_index), rect in sorted(
+                regions.items(), key=lambda item: item[0][3]):
+            animations = frames.setdefault((dog_type, growth_stage), {})
+            animations.setdefault(animation_name, []).append(atlas.subsurface(rect))
+
+        self.surface = atlas
+        self.regions = regions
+        self.frames = frames
+        self.baked = True
+
+    def restore(self, atlas, regions):
+        """保存しておいたアトラスを使う（焼き込みの代わり）"""
+        with self.lock:
+            if not self.baked:
+                self.load_from_surface(atlas, regions)
+
+    def get_region_list(self):
+        """矩形をファイルに保存できる形式で取得 [犬種, 成長段階, アニメーション名, フレーム番号, x, y, 幅, 高さ]"""
+        return [[*key, *rect] for key, rect in self.regions.items()]
+
+    @staticmethod
+    def regions_from_list(items):
+        """get_region_listの形式から矩形を復元"""
+        return {tuple(item[:4]): pygame.Rect(item[4:]) for item in items}
+
+    def get_frames(self, dog_type, growth_stage):
+        """指定した犬種と成長段階のアニメーションフレームを取得"""
+        if not self.baked:
+            self.bake()
+
+        key = (dog_type, growth_stage)
+        if key not in self.frames:
+            # アトラスにない組み合わせは個別に描画
+            self.frames[key] = Animation.create_placeholder_frames(dog_type, growth_stage)
+
+        return self.frames[key]
@@ -0,0 +1,105 @@
+import pygame
+
+class StatusPanel:
+    # 犬のステータスの属性名（表示順）
+    STATUS_ATTRIBUTES = ["hunger", "happiness", "discipline", "cleanliness", "energy", "health"]
+
+    # 犬のリストに表示する小さいバーのサイズ
+    MINI_BAR_WIDTH = 28
+    MINI_BAR_HEIGHT = 6
+    MINI_BAR_MARGIN = 4
+
+    def __init__(self, panel_cache, value_font, bar_width=100, bar_height=20,
+                 background_color=(255, 245, 180), border_color=(40, 40, 40), text_color=(40, 40, 40)):
+        """ステータスバーの描画部品の初期化"""
+        self.panel_cache = panel_cache
+        self.bar_width = bar_width
+        self.bar_height = bar_height
+        self.background_color = background_color
+        self.border_color = border_color
+
+        # 0〜100の値のテキストを事前に描画しておく
+        self.value_glyphs = [value_font.render(str(value), True, text_color) for value in range(101)]
+
+        # バーの位置ごとの描画済みのバー（キー -> (値, 色, サーフェス)）
+        self.bars = {}
+
+        # 小さいバーのキャッシュ（(色, 値) -> サーフェス）
+        self.mini_bars = {}
+
+        # 統計情報
+        self.bar_redraws = 0
+
+    @staticmethod
+    def to_int(value):
+        """ステータスの値を0〜100の整数にする"""
+        return max(0, min(100, int(value)))
+
+    def get_value_glyph(self, value):
+        """描画済みの値のテキストを取得"""
+        return self.value_glyphs[self.to_int(value)]
+
+    def get_bar(self, key, value, color):
+        """バーを取得（整数の値か色が変わった場合だけ描画し直す）"""
+        value = self.to_int(value)
+        cached = self.bars.get(key)
+        if cached is not None and cached[0] == value and cached[1] == color:
+            return cached[2]
+
+        bar = cached[2] if cached is not None else pygame.Surface((self.bar_width, self.bar_height), pygame.SRCALPHA)
+        bar.fill((0, 0, 0, 0))
+
+        # 背景、値に応じた幅の塗りつぶし、枠の順に描画
+        self.panel_cache.draw(bar, (0, 0, self.bar_width, self.bar_height), self.background_color, radius=5)
+        value_width = value * self.bar_width // 100
+        if value_width > 0:
+            pygame.draw.rect(bar, color, (0, 0, value_width, self.bar_height), border_radius=5)
+        self.panel_cache.draw(bar, (0, 0, self.bar_width, self.bar_height), None, self.border_color, 1, 5)
+
+        self.bars[key] = (value, color, bar)
+        self.bar_redraws += 1
+        return bar
+
+    def draw_bars(self, surface, bars, value_offset=5):
+        """複数のバーと値をまとめて描画
+
+        bars: (キー, 値, 色, (x, y)) のリスト
+        """
+        blits = []
+        for key, value, color, (x, y) in bars:
+            blits.append((self.get_bar(key, value, color), (x, y)))
+            blits.append((self.get_value_glyph(value), (x + self.bar_width + value_offset, y)))
+        surface.blits(blits, doreturn=False)
+
+    def get_mini_bar(self, value, color):
+        """犬のリスト用の小さいバーを取得（色と値ごとに一度だけ描画する）"""
+        value = self.to_int(value)
+        key = (color, value)
+        bar = self.mini_bars.get(key)
+        if bar is None:
+            bar = pygame.Surface((self.MINI_BAR_WIDTH, self.MINI_BAR_HEIGHT))
+            bar.fill(self.background_color)
+            value_width = value * self.MINI_BAR_WIDTH // 100
+            if value_width > 0:
+                bar.fill(color, (0, 0, value_width, self.MINI_BAR_HEIGHT))
+            pygame.draw.rect(bar, self.border_color, (0, 0, self.MINI_BAR_WIDTH, self.MINI_BAR_HEIGHT), 1)
+            self.mini_bars[key] = bar
+        return bar
+
+    def draw_mini_bars(self, surface, dogs, colors):
+        """複数の犬のステータスを小さいバーでまとめて描画
+
+        dogs: (犬, (x, y)) のリスト
+        colors: STATUS_ATTRIBUTESと同じ順のバーの色
+        """
+        step = self.MINI_BAR_WIDTH + self.MINI_BAR_MARGIN
+        blits = []
+        for dog, (x, y) in dogs:
+            for i, attribute in enumerate(self.STATUS_ATTRIBUTES):
+                blits.append((self.get_mini_bar(getattr(dog, attribute), colors[i]), (x + i * step, y)))
+        surface.blits(blits, doreturn=False)
+
+    def get_mini_bars_width(self):
+        """小さいバーを並べた時の幅"""
+        count = len(self.STATUS_ATTRIBUTES)
+        return count * self.MINI_BAR_WIDTH + (count - 1) * self.MINI_BAR_MARGIN
@@ -0,0 +1,50 @@
+import os
+import sys
+import json
+import shutil
+import platform
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from utils import Utils
+
+class FontCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="inubiyori_font_test_")
+        self.font_dirs = [os.path.join(self.temp_dir, name) for name in ("a", "b")]
+        for font_dir in self.font_dirs:
+            os.makedirs(font_dir)
+        self.cache_file = os.path.join(self.temp_dir, "fonts.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_cache(self, font_dirs):
+        data = {
+            "version": Utils.FONT_CACHE_VERSION,
+            "system": platform.system(),
+            "sample": Utils.FONT_COVERAGE_SAMPLE,
+            "path": None,
+            "coverage": 0,
+            "dir_mtimes": {font_dir: Utils.get_mtime(font_dir) for font_dir in font_dirs}
+        }
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_cache_with_all_dirs_is_used(self):
+        self.write_cache(self.font_dirs)
+        with mock.patch.object(Utils, "get_font_dirs", return_value=self.font_dirs):
+            self.assertIsNotNone(Utils.load_font_cache(self.cache_file))
+
+    def test_cache_missing_a_dir_is_ignored(self):
+        # キャッシュにないフォントのディレクトリがあれば探し直す
+        # （キャッシュにだけある存在しないディレクトリがあっても見逃さない）
+        self.write_cache(self.font_dirs[:1] + [os.path.join(self.temp_dir, "removed")])
+        with mock.patch.object(Utils, "get_font_dirs", return_value=self.font_dirs):
+            self.assertIsNone(Utils.load_font_cache(self.cache_file))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import sys
+import logging
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from game_logging import RateLimitFilter
+
+class RateLimitFilterTest(unittest.TestCase):
+    def make_record(self, msg):
+        return logging.LogRecord("test", logging.WARNING, __file__, 1, msg, None, None)
+
+    def test_burst_per_interval(self):
+        rate_limit = RateLimitFilter(burst=3, interval=60.0)
+        results = [rate_limit.filter(self.make_record("same")) for _ in range(5)]
+        self.assertEqual(results, [True, True, True, False, False])
+        self.assertEqual(rate_limit.suppressed, 2)
+
+    def test_many_threads(self):
+        # 上限を超える数のメッセージを複数のスレッドから同時に判定しても壊れない
+        rate_limit = RateLimitFilter(burst=1, interval=60.0, max_keys=16)
+        errors = []
+        passed = []
+
+        def worker(index):
+            try:
+                for i in range(2000):
+                    if rate_limit.filter(self.make_record(f"message {(index + i) % 64}")):
+                        passed.append(1)
+            except Exception as e:
+                errors.append(e)
+
+        # スレッドが頻繁に切り替わるようにする
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker, args=(index,)) for index in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(rate_limit.windows), 16)
+        self.assertEqual(len(passed) + rate_limit.suppressed, 8 * 2000)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from game_state import GameState
+
+class PerformActionTest(unittest.TestCase):
+    def setUp(self):
+        self.save_dir = tempfile.mkdtemp(prefix="inubiyori_game_state_test_")
+        self.game_state = GameState(self.save_dir)
+        self.game_state.begin_name_entry("柴犬")
+        self.game_state.finish_name_entry("ポチ")
+        self.dog = self.game_state.dog
+
+    def tearDown(self):
+        shutil.rmtree(self.save_dir, ignore_errors=True)
+
+    def test_applied_action_returns_true(self):
+        self.assertTrue(self.game_state.perform_action("散歩にいく"))
+
+    def test_refused_action_returns_false(self):
+        # 疲れている犬は散歩に行かず、ステータスも変わらない
+        self.dog.energy = 10
+        happiness = self.dog.happiness
+        self.assertFalse(self.game_state.perform_action("散歩にいく"))
+        self.assertEqual(self.dog.happiness, happiness)
+        self.assertTrue(self.game_state.perform_action("ご飯をあげる"))
+
+if __name__ == "__main__":
+    unittest.main()
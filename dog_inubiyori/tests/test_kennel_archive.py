@@ -0,0 +1,70 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import kennel_archive
+from utils import SaveManager
+
+class ImportOverwriteTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="inubiyori_archive_test_")
+        self.source_dir = os.path.join(self.temp_dir, "source")
+        self.target_dir = os.path.join(self.temp_dir, "target")
+        self.archive = os.path.join(self.temp_dir, "kennel.jsonl.gz")
+
+        # インポート先には前のトレーナーと犬がいる
+        target = SaveManager(self.target_dir)
+        target.trainer_data["trainer_level"] = 7
+        target.save_trainer_data()
+        target.write_dog_file("old", {"name": "ポチ"}, target.dogs_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def export_source(self, with_trainer):
+        source = SaveManager(self.source_dir)
+        source.write_dog_file("new", {"name": "ハチ"}, source.dogs_dir)
+        if with_trainer:
+            source.trainer_data["trainer_level"] = 3
+            source.save_trainer_data()
+        kennel_archive.export_kennel(self.source_dir, self.archive)
+
+    def load_trainer_level(self):
+        with open(os.path.join(self.target_dir, "trainer_data.json"), encoding="utf-8") as f:
+            return json.load(f)["trainer_level"]
+
+    def test_archive_without_trainer_resets_trainer_data(self):
+        self.export_source(with_trainer=False)
+        kennel_archive.import_kennel(self.archive, self.target_dir, overwrite=True)
+
+        self.assertEqual(self.load_trainer_level(), 1)
+        self.assertEqual(os.listdir(os.path.join(self.target_dir, "dogs")), ["new.json"])
+
+    def test_failed_dogs_swap_keeps_old_kennel(self):
+        self.export_source(with_trainer=True)
+        dogs_dir = os.path.join(self.target_dir, "dogs")
+        real_replace = os.replace
+        files_before = sorted(os.listdir(self.target_dir))
+
+        def failing_replace(src, dst):
+            if src.endswith(".importing") and dst == dogs_dir:
+                raise OSError("disk full")
+            return real_replace(src, dst)
+
+        with mock.patch.object(kennel_archive.os, "replace", failing_replace):
+            with self.assertRaises(OSError):
+                kennel_archive.import_kennel(self.archive, self.target_dir, overwrite=True)
+
+        self.assertEqual(os.listdir(dogs_dir), ["old.json"])
+        self.assertEqual(self.load_trainer_level(), 7)
+        # 一時的なファイルやディレクトリも残らない
+        self.assertEqual(sorted(os.listdir(self.target_dir)), files_before)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import profiles
+from profiles import ProfileCache, TrainerProfile
+
+class ProfileCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp(prefix="inubiyori_profiles_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.root_dir, ignore_errors=True)
+
+    def test_slow_load_does_not_block_other_trainers(self):
+        cache = ProfileCache(self.root_dir, capacity=4)
+        cache.get("fast", create=True)
+
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_profile(trainer_id, save_dir):
+            loading.set()
+            release.wait(5)
+            return TrainerProfile(trainer_id, save_dir)
+
+        with mock.patch.object(profiles, "TrainerProfile", side_effect=slow_profile) as load:
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(cache.get("slow", create=True)))
+                       for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            self.assertTrue(loading.wait(5))
+
+            # 読み込み中でも他のトレーナーはすぐに取得できる
+            self.assertIsNotNone(cache.get("fast"))
+
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        # 同じトレーナーは1回だけ読み込まれる
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(profile is results[0] for profile in results))
+
+    def test_evicted_trainer_is_saved_before_reload(self):
+        cache = ProfileCache(self.root_dir, capacity=1)
+        with cache.use("first", create=True) as profile:
+            profile.game_state.begin_name_entry("柴犬")
+            profile.game_state.finish_name_entry("ポチ")
+
+        # 2人目を読み込むと1人目は保存して破棄される
+        cache.get("second", create=True)
+        self.assertTrue(profile.evicted)
+        self.assertEqual(cache.get_trainer_ids(), ["second"])
+
+        reloaded = cache.get("first")
+        self.assertIsNot(reloaded, profile)
+        self.assertEqual([dog.name for dog in reloaded.game_state.dogs], ["ポチ"])
+
+    def test_reload_waits_for_on_evict(self):
+        # 破棄の通知より前に読み込み直されると、新しいプロファイルのタイマーが止められてしまう
+        events = []
+        reloads = []
+
+        def on_evict(profile):
+            thread = threading.Thread(target=lambda: reloads.append(cache.get(profile.trainer_id)))
+            thread.start()
+            # 読み込み直しは on_evict が終わるまで待たされる
+            thread.join(0.5)
+            events.append(("evict", profile))
+
+        cache = ProfileCache(self.root_dir, capacity=4,
+                             on_load=lambda profile: events.append(("load", profile)),
+                             on_evict=on_evict)
+        first = cache.get("first", create=True)
+        self.assertEqual(cache.evict_idle(0), 1)
+        for _ in range(50):
+            if reloads:
+                break
+            threading.Event().wait(0.1)
+
+        reloaded = reloads[0]
+        self.assertIsNot(reloaded, first)
+        names = [(name, profile.trainer_id) for name, profile in events]
+        self.assertLess(events.index(("evict", first)), events.index(("load", reloaded)), names)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from game_state import GameState
+from utils import SaveManager
+
+class DiskWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.save_dir = tempfile.mkdtemp(prefix="inubiyori_save_test_")
+        self.game_state = GameState(self.save_dir)
+        self.save_manager = self.game_state.save_manager
+
+        # asyncioのランナーと同じく1スレッドのワーカーに書き込みを任せる
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.save_manager.disk_writer = self.executor.submit
+
+    def tearDown(self):
+        self.executor.shutdown()
+        shutil.rmtree(self.save_dir, ignore_errors=True)
+
+    def test_dog_that_died_after_autosave_stays_dead(self):
+        self.game_state.begin_name_entry("柴犬")
+        self.game_state.finish_name_entry("ポチ")
+        dog = self.game_state.dog
+
+        # 自動保存の書き込みが終わる前に犬が死んでも、削除の後に書き戻されない
+        self.game_state.save()
+        dog.demo_kill()
+        self.game_state.handle_dog_death(dog)
+        self.executor.submit(lambda: None).result()
+
+        self.assertEqual(os.listdir(self.save_manager.dogs_dir), [])
+        self.assertEqual(self.save_manager.current_dogs, [])
+
+        reloaded = GameState(self.save_dir)
+        self.assertEqual(reloaded.dogs, [])
+        self.assertEqual([grave["name"] for grave in reloaded.save_manager.graveyard], ["ポチ"])
+        self.assertEqual(reloaded.save_manager.trainer_data["total_deaths"], 1)
+
+class GraveyardIndexPrefetchTest(unittest.TestCase):
+    def setUp(self):
+        self.save_dir = tempfile.mkdtemp(prefix="inubiyori_save_test_")
+        self.save_manager = GameState(self.save_dir).save_manager
+
+    def tearDown(self):
+        shutil.rmtree(self.save_dir, ignore_errors=True)
+
+    def add_grave(self, name):
+        self.save_manager.graveyard.append({"name": name, "dog_type": "柴犬", "growth_stage": "子犬",
+                                            "death_date": "2026-01-01 00:00:00", "lifespan": 1})
+
+    def test_index_is_built_once(self):
+        self.add_grave("ポチ")
+        jobs = self.save_manager.prefetch_graveyard_index()
+        self.assertEqual(len(jobs), 1)
+
+        # 作っている間に画面を行き来しても、もう一度は頼まない
+        self.assertEqual(self.save_manager.prefetch_graveyard_index(), [])
+
+        compute, apply = jobs[0]
+        index = compute()
+        self.add_grave("ハチ")
+        apply(index)
+
+        self.assertEqual(self.save_manager.prefetch_graveyard_index(), [])
+        self.assertEqual(self.save_manager.query_graveyard(name_prefix="ハ"), [1])
+
+class LegacySavesMigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="inubiyori_save_test_")
+        self.saves_dir = os.path.join(self.temp_dir, "new_saves")
+        self.legacy_dir = os.path.join(self.temp_dir, "saves")
+
+        # 以前の場所には犬が1匹いる
+        legacy = SaveManager(self.legacy_dir)
+        legacy.trainer_data["trainer_level"] = 5
+        legacy.save_trainer_data()
+        legacy.write_dog_file("dog_1", {"name": "ポチ"})
+
+        patcher = mock.patch.multiple(SaveManager, SAVES_DIR=self.saves_dir,
+                                      LEGACY_SAVES_DIRS=[self.legacy_dir, self.saves_dir])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_legacy_dogs_are_copied_once(self):
+        SaveManager.migrate_legacy_saves()
+        save_manager = SaveManager(self.saves_dir)
+        self.assertEqual(save_manager.trainer_data["trainer_level"], 5)
+        self.assertEqual([dog["name"] for dog in save_manager.load_all_dogs()], ["ポチ"])
+
+        # 移した後で犬がいなくなっても、もう一度は移さない
+        save_manager.delete_dog("dog_1")
+        SaveManager.migrate_legacy_saves()
+        self.assertEqual(os.listdir(save_manager.dogs_dir), [])
+        # 以前のデータは残す
+        self.assertEqual(os.listdir(os.path.join(self.legacy_dir, "dogs")), ["dog_1.json"])
+
+    def test_existing_dogs_are_not_overwritten(self):
+        SaveManager(self.saves_dir).write_dog_file("dog_2", {"name": "ハチ"})
+        with self.assertLogs("utils", "WARNING") as logs:
+            SaveManager.migrate_legacy_saves()
+        self.assertIn(self.legacy_dir, logs.output[0])
+        self.assertEqual(os.listdir(os.path.join(self.saves_dir, "dogs")), ["dog_2.json"])
+
+class TrainerIdTest(unittest.TestCase):
+    def test_trainer_id_must_match_whole_string(self):
+        self.assertTrue(SaveManager.is_valid_trainer_id("alice_01"))
+        # 末尾の改行もディレクトリ名に入ってしまうので受け付けない
+        self.assertFalse(SaveManager.is_valid_trainer_id("alice\n"))
+        self.assertFalse(SaveManager.is_valid_trainer_id("../alice"))
+        self.assertFalse(SaveManager.is_valid_trainer_id("a" * 65))
+
+if __name__ == "__main__":
+    unittest.main()
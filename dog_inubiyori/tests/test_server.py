@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from server import KennelServer, create_server
+
+class QuickKennelServer(KennelServer):
+    # すぐに破棄されるように間隔を短くする（ミリ秒）
+    SIMULATION_INTERVAL = 50
+    IDLE_CHECK_INTERVAL = 50
+    IDLE_TIMEOUT = 100
+
+def wait_until(condition, timeout=5.0):
+    """条件を満たすまで待つ（満たしたらTrue）"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+class KennelServerTest(unittest.TestCase):
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp(prefix="inubiyori_server_test_")
+        self.kennel = QuickKennelServer(self.root_dir)
+        self.kennel.start()
+
+    def tearDown(self):
+        # 更新用のスレッドが止まっていてもテストが終わるように、先に時間を区切って止める
+        self.kennel.stopping = True
+        self.kennel.wake_event.set()
+        self.kennel.tick_thread.join(5)
+        self.assertFalse(self.kennel.tick_thread.is_alive(), "tick thread is stuck")
+        self.kennel.shutdown()
+        shutil.rmtree(self.root_dir, ignore_errors=True)
+
+    def adopt(self, trainer_id):
+        status, _ = self.kennel.handle("POST", f"/trainers/{trainer_id}/dogs", {"dog_type": "柴犬", "name": "ポチ"})
+        self.assertEqual(status, 201)
+
+    def test_ticks_continue_after_idle_eviction(self):
+        self.adopt("first")
+        self.assertTrue(wait_until(lambda: self.kennel.simulations > 0))
+
+        # 使われていないトレーナーが破棄されても更新用のスレッドは止まらない
+        self.assertTrue(wait_until(lambda: len(self.kennel.profiles) == 0))
+        self.assertEqual(self.kennel.profiles.evictions, 1)
+
+        # 新しいトレーナーのタイマーも登録できる（止まっている場合にテストが終わらないように別スレッドで）
+        thread = threading.Thread(target=self.adopt, args=("second",), daemon=True)
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive(), "scheduling a new trainer is blocked")
+        self.assertEqual(len(self.kennel.profiles), 1)
+        simulations = self.kennel.simulations
+        self.assertTrue(wait_until(lambda: self.kennel.simulations > simulations))
+
+    def test_action_must_be_a_string(self):
+        self.adopt("first")
+        status, _ = self.kennel.handle("POST", "/trainers/first/actions", {"action": ["feed"]})
+        self.assertEqual(status, 400)
+
+    def test_negative_content_length_is_rejected(self):
+        httpd = create_server(self.kennel, port=0)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with socket.create_connection(httpd.server_address, timeout=5) as sock:
+                sock.sendall(b"POST /trainers/first/dogs HTTP/1.1\r\nHost: localhost\r\n"
+                             b"Content-Length: -1\r\n\r\n")
+                # ボディを待たずにすぐに400を返す（待つとタイムアウトする）
+                response = sock.recv(1024)
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+        self.assertTrue(response.startswith(b"HTTP/1.1 400"), response)
+
+if __name__ == "__main__":
+    unittest.main()
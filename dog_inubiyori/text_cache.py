@@ -0,0 +1,35 @@
+from collections import OrderedDict
+
+class TextCache:
+    def __init__(self, max_size=1024):
+        """描画済みテキストのキャッシュの初期化"""
+        self.max_size = max_size
+        # (フォント, 文字列, 色) -> サーフェス
+        self.surfaces = OrderedDict()
+
+        # 統計情報
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """テキストを描画（同じ内容は描画済みのサーフェスを使う）"""
+        key = (id(font), text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+
+        # 古いテキストを破棄
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self):
+        """キャッシュを空にする"""
+        self.surfaces.clear()
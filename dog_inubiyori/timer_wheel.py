@@ -0,0 +1,172 @@
+import time
+
+class Timer:
+    def __init__(self, name, callback, due_tick, interval_ticks=None):
+        """タイマーの初期化"""
+        self.name = name
+        self.callback = callback
+        self.due_tick = due_tick              # 実行するティック
+        self.interval_ticks = interval_ticks  # 繰り返す間隔（Noneは1回だけ）
+        self.cancelled = False
+
+        # 統計情報
+        self.runs = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.max_lateness_ms = 0
+        self.skipped = 0  # 処理が遅れて実行しなかった回数（繰り返しのタイマー）
+
+class TimerWheel:
+    def __init__(self, now_ms=0, tick_ms=10, slots=(256, 64, 64)):
+        """階層型のタイマーホイールの初期化
+
+        1段目は tick_ms ごとのスロット、2段目以降は1つ下の段の1周分ごとのスロットになる
+        （既定では 10ms×256 = 2.56秒、2.56秒×64 = 約2.7分、約2.7分×64 = 約2.9時間）
+        それより先のタイマーは最上段に入れておき、順番が来たら入れ直す
+        """
+        self.tick_ms = tick_ms
+        self.levels = [[[] for _ in range(count)] for count in slots]
+
+        # 段ごとの1スロットあたりのティック数
+        self.spans = []
+        span = 1
+        for count in slots:
+            self.spans.append(span)
+            span *= count
+
+        self.current_tick = now_ms // tick_ms
+
+        # 名前 -> タイマー
+        self.timers = {}
+
+        # 統計情報
+        self.ticks_processed = 0
+
+    def to_ticks(self, ms):
+        """ミリ秒をティック数に変換（切り上げ、最低1ティック）"""
+        return max(1, -(-int(ms) // self.tick_ms))
+
+    def schedule(self, name, delay_ms, callback, interval_ms=None):
+        """タイマーを登録（同じ名前のタイマーは置き換える）"""
+        self.cancel(name)
+        interval_ticks = self.to_ticks(interval_ms) if interval_ms is not None else None
+        timer = Timer(name, callback, self.current_tick + self.to_ticks(delay_ms), interval_ticks)
+        self.timers[name] = timer
+        self.insert(timer)
+        return timer
+
+    def every(self, name, interval_ms, callback):
+        """一定間隔で繰り返すタイマーを登録"""
+        return self.schedule(name, interval_ms, callback, interval_ms)
+
+    def cancel(self, name):
+        """タイマーを取り消す（スロットからは実行時に取り除く）"""
+        timer = self.timers.pop(name, None)
+        if timer is not None:
+            timer.cancelled = True
+
+    def insert(self, timer):
+        """期限までの長さに応じた段のスロットにタイマーを入れる"""
+        delta = timer.due_tick - self.current_tick
+        last_level = len(self.levels) - 1
+        for level, slots in enumerate(self.levels):
+            if level == last_level or delta < self.spans[level] * len(slots):
+                slots[(timer.due_tick // self.spans[level]) % len(slots)].append(timer)
+                return
+
+    def cascade(self):
+        """上の段のスロットの順番が来たら、そのタイマーを下の段に入れ直す"""
+        for level in range(1, len(self.levels)):
+            # 1つ下の段が1周した時だけ
+            if self.current_tick % self.spans[level] != 0:
+                break
+
+            slots = self.levels[level]
+            index = (self.current_tick // self.spans[level]) % len(slots)
+            timers = slots[index]
+            slots[index] = []
+            for timer in timers:
+                if not timer.cancelled:
+                    self.insert(timer)
+
+    def advance(self, now_ms):
+        """現在時刻まで進めて期限が来たタイマーだけを実行する"""
+        target = now_ms // self.tick_ms
+        slots = self.levels[0]
+
+        while self.current_tick < target:
+            self.current_tick += 1
+            self.ticks_processed += 1
+            self.cascade()
+
+            index = self.current_tick % len(slots)
+            due = slots[index]
+            if not due:
+                continue
+            slots[index] = []
+
+            for timer in due:
+                if timer.cancelled:
+                    continue
+                if timer.due_tick > self.current_tick:
+                    # 最上段より先のタイマーが回ってきた場合
+                    self.insert(timer)
+                    continue
+                self.run(timer, now_ms, target)
+
+    def run(self, timer, now_ms, target):
+        """タイマーを実行して統計を記録し、繰り返しの場合は次の期限で入れ直す"""
+        start = time.perf_counter()
+        timer.callback()
+        elapsed = time.perf_counter() - start
+
+        timer.runs += 1
+        timer.total_time += elapsed
+        timer.max_time = max(timer.max_time, elapsed)
+        timer.max_lateness_ms = max(timer.max_lateness_ms, now_ms - timer.due_tick * self.tick_ms)
+
+        # コールバックの中で取り消されたり置き換えられたりした場合
+        if timer.cancelled or self.timers.get(timer.name) is not timer:
+            return
+
+        if timer.interval_ticks is None:
+            del self.timers[timer.name]
+            return
+
+        # 遅れた分はまとめて実行せずに飛ばす
+        timer.due_tick += timer.interval_ticks
+        if timer.due_tick <= target:
+            missed = (target - timer.due_tick) // timer.interval_ticks + 1
+            timer.skipped += missed
+            timer.due_tick += missed * timer.interval_ticks
+        self.insert(timer)
+
+    def time_until_next(self, now_ms):
+        """次のタイマーの期限までのミリ秒（1段目の1周先までに無い場合は1周先まで）"""
+        slots = self.levels[0]
+        for offset in range(1, len(slots) + 1):
+            tick = self.current_tick + offset
+            for timer in slots[tick % len(slots)]:
+                if not timer.cancelled and timer.due_tick == tick:
+                    return max(0, tick * self.tick_ms - now_ms)
+        return max(0, (self.current_tick + len(slots)) * self.tick_ms - now_ms)
+
+    def get_stats(self):
+        """タイマーごとの統計情報を取得"""
+        return {
+            name: {
+                "runs": timer.runs,
+                "average_ms": timer.total_time * 1000 / timer.runs if timer.runs else 0.0,
+                "max_ms": timer.max_time * 1000,
+                "max_lateness_ms": timer.max_lateness_ms,
+                "skipped": timer.skipped
+            }
+            for name, timer in self.timers.items()
+        }
+
+    def report(self):
+        """タイマーの実行状況のレポートを文字列で取得"""
+        parts = [f"{name} {stats['runs']}x avg {stats['average_ms']:.2f} ms max {stats['max_ms']:.2f} ms "
+                 f"late {stats['max_lateness_ms']} ms skipped {stats['skipped']}"
+                 for name, stats in self.get_stats().items()]
+        return f"Timers ({self.ticks_processed} ticks): " + ", ".join(parts)
@@ -1,9 +1,75 @@
 import pygame
 import os
+import logging
+from collections import OrderedDict
 from utils import Utils
 from animation import Animation
+from scroll_view import ScrollView
+from widgets import WidgetLayer
+from localization import Localization
+from text_cache import TextCache
+from panel_cache import PanelCache
+from status_panel import StatusPanel
+from sprite_atlas import SpriteAtlas
+from warm_start import WarmStartCache
+
+logger = logging.getLogger(__name__)
 
 class UI:
+    # キャッシュする犬のカードの最大数
+    DOG_CARD_CACHE_SIZE = 64
+    
+    # キャッシュする墓石のカードの最大数とカードの高さ（文字が次の行に少しはみ出す）
+    GRAVE_CARD_CACHE_SIZE = 64
+    GRAVE_CARD_HEIGHT = 205
+    
+    # 犬種ごとの画像ファイル
+    DOG_IMAGE_FILES = {
+        "コーギー": "corgi.png",
+        "ミニチュアダックスフンド": "dachsuhund.png",
+        "柴犬": "shiba.png"
+    }
+    
+    # フォントの種類とサイズ
+    FONT_SIZES = {
+        "title": 48,
+        "normal": 32,
+        "small": 24,
+        "caption": 20,
+        "tiny": 18,
+        "label": 16,
+        "micro": 14
+    }
+    
+    # 事前に描画しておく固定の文字列（文字列, フォント）
+    STATIC_TEXTS = [
+        ("あなたの犬を選んでください", "title"),
+        ("犬の墓地", "title"),
+        ("トレーナー", "title"),
+        ("飼っている犬", "title"),
+        ("犬の名前を入力してください", "title"),
+        ("Enterキーで確定 (最大10文字)", "small"),
+        ("新しい犬を選ぶ", "normal"),
+        ("戻る", "normal"),
+        ("新しい犬を追加", "normal"),
+        ("トレーナーボーナス", "normal"),
+        ("ロード中...", "normal"),
+        ("音量:", "small"),
+        ("墓地を見る", "tiny"),
+        ("トレーナー", "tiny"),
+        ("満腹度", "label"),
+        ("幸福度", "label"),
+        ("しつけ度", "label"),
+        ("清潔度", "label"),
+        ("元気度", "label"),
+        ("健康度", "label"),
+        ("ご飯をあげる", "small"),
+        ("散歩にいく", "small"),
+        ("しつけをする", "small"),
+        ("トイレを片付ける", "small"),
+        ("おもちゃで遊ぶ", "small")
+    ]
+    
     def __init__(self, screen, width, height):
         self.screen = screen
         self.width = width
@@ -12,8 +78,19 @@ class UI:
         # フォント初期化
         pygame.font.init()
         
-        # フォントの作成
-        self.create_fonts()
+        # 描画済みのテキスト
+        self.text_cache = TextCache()
+        
+        # 描画済みの角丸パネル（ボタンや背景）
+        self.panel_cache = PanelCache()
+        
+        # 英数字用のフォント（日本語が表示できない場合のフォールバックも兼ねる）
+        self.latin_fonts = {
+            name: pygame.font.Font(None, size) for name, size in self.FONT_SIZES.items()
+        }
+        
+        # 日本語フォントはローディング中に探すので、それまでは英数字のフォントで表示する
+        self.create_fonts(japanese=False)
         
         # 色の定義（洗練されたパステル調に変更）
         self.BLACK = (40, 40, 40)
@@ -33,15 +110,49 @@ class UI:
         self.BUTTON_RADIUS = 10  # ボタンの角丸半径
         self.STATUS_BAR_HEIGHT = 20  # ステータスバーの高さ
         
+        # ステータスバー（StatusPanel.STATUS_ATTRIBUTESと同じ順の色）
+        self.STATUS_COLORS = [self.GREEN, self.YELLOW, self.LIGHT_BLUE, self.WHITE, self.RED, self.GREEN]
+        value_font = self.latin_fonts["small"]
+        if value_font.get_height() > 18:
+            value_font = self.latin_fonts["label"]
+        self.status_panel = StatusPanel(self.panel_cache, value_font, 100, self.STATUS_BAR_HEIGHT,
+                                        self.YELLOW, self.BLACK, self.BLACK)
+        
+        # 起動時に作成するサーフェスのキャッシュ（2回目以降の起動ではファイルから復元する）
+        self.warm_start = WarmStartCache()
+        self.warm_start.load()
+        
         # プレースホルダー画像の作成
-        self.placeholder_images = self.create_placeholder_images()
+        self.placeholder_images = self.restore_placeholder_images() or self.create_placeholder_images()
         
-        # 墓石画像の作成
-        self.tombstone_image = self.create_tombstone_image()
+        # 墓石画像（文字がフォントで変わるので日本語フォントを探した後に作成する）
+        self.tombstone_image = None
+        
+        # ローディング画面の文字列を事前に描画
+        # （ローディング中はワーカースレッドがフォントを開くので、メインスレッドでは描画しない）
+        self.prerender_loading_texts()
         
-        # ボタンの位置
-        self.action_buttons = []
-        self.menu_buttons = []
+        # 画面ごとのボタン（描画のたびに作り直さず保持する）
+        self.widget_layers = {}
+        self.current_layer = None
+        
+        # 最後に分かっているマウスの位置（MOUSEMOTIONの時だけ更新）
+        self.mouse_pos = (-1, -1)
+        
+        # 犬のリスト（カード 220x180 を3列に並べ、下部のボタン用にスペースを確保）
+        list_area_y = 100
+        self.dog_list_view = ScrollView(30, list_area_y, self.width - 30, self.height - list_area_y - 80,
+                                        220, 180, 3, margin_x=30, margin_y=20)
+        self.dog_list_dogs = []
+        self.dog_list_hover_index = None
+        # 描画済みの犬のカード
+        self.dog_card_cache = OrderedDict()
+        
+        # 墓地（墓石 200x180 を3列に並べる、上に絞り込みのボタンを置く）
+        self.graveyard_view = ScrollView(self.width // 4 - 100, 135, 620, self.height - 135, 200, 180, 3,
+                                         content_padding=self.GRAVE_CARD_HEIGHT - 180)
+        # 描画済みの墓石のカード
+        self.grave_card_cache = OrderedDict()
         
         # アニメーション
         self.animations = {}
@@ -55,40 +166,173 @@ class UI:
         # 音量設定
         self.volume = 0.5  # デフォルト音量
         
-        # ロゴ画像の読み込み
-        try:
-            self.logo_image = pygame.image.load("./dog_inubiyori/assets/logo.png")
-            # 画像のアスペクト比を維持したまま適切なサイズに調整
-            logo_width = 240  # サイズを少し大きく
-            aspect_ratio = self.logo_image.get_width() / self.logo_image.get_height()
-            logo_height = int(logo_width / aspect_ratio)
-            self.logo_image = pygame.transform.scale(self.logo_image, (logo_width, logo_height))
-        except:
-            self.logo_image = None
+        # 犬の画像（ローディング中に読み込む）
+        self.dog_images = {}
+        # サイズ調整済みの犬の画像のキャッシュ
+        self.scaled_dog_images = {}
+        
+        # ロゴ画像の読み込み（スクリプトの場所を基準にする）
+        self.logo_image = self.warm_start.get("logo")
+        if self.logo_image is None:
+            try:
+                logo_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "logo.png")
+                self.logo_image = pygame.image.load(logo_path)
+                # 画像のアスペクト比を維持したまま適切なサイズに調整
+                logo_width = 240  # サイズを少し大きく
+                aspect_ratio = self.logo_image.get_width() / self.logo_image.get_height()
+                logo_height = int(logo_width / aspect_ratio)
+                self.logo_image = pygame.transform.scale(self.logo_image, (logo_width, logo_height))
+            except:
+                self.logo_image = None
+    
+    def restore_placeholder_images(self):
+        """キャッシュからプレースホルダー画像を復元（無い場合はNone）"""
+        images = {}
+        for name, surface in self.warm_start.surfaces.items():
+            if name.startswith("placeholder:"):
+                _, dog_type, size = name.split(":")
+                images.setdefault(dog_type, {})[size] = surface
+        return images or None
+    
+    def load_sprite_atlas(self):
+        """スプライトアトラスを用意（ローディング中にワーカースレッドで実行）"""
+        atlas = SpriteAtlas.get_shared()
+        surface = self.warm_start.get("sprite_atlas")
+        regions = self.warm_start.meta.get("sprite_atlas")
+        if surface is not None and regions:
+            atlas.restore(surface, SpriteAtlas.regions_from_list(regions))
+        else:
+            # アニメーションのフレームをアトラスに焼き込む
+            atlas.bake()
+    
+    def save_warm_start(self):
+        """起動時に作成したサーフェスを次回の起動のために保存（キャッシュから復元した場合は何もしない）"""
+        if self.warm_start.loaded:
+            return
+        
+        for dog_type, images in self.placeholder_images.items():
+            for size, image in images.items():
+                self.warm_start.put(f"placeholder:{dog_type}:{size}", image)
+        if self.logo_image is not None:
+            self.warm_start.put("logo", self.logo_image)
+        
+        atlas = SpriteAtlas.get_shared()
+        if atlas.baked:
+            self.warm_start.put("sprite_atlas", atlas.surface)
+            self.warm_start.meta["sprite_atlas"] = atlas.get_region_list()
+        
+        self.warm_start.save()
+    
+    def load_dog_images(self):
+        """犬種ごとの画像を読み込む（ローディング中にワーカースレッドで実行）"""
+        images_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "dogs")
+        images = {}
+        
+        for dog_type, filename in self.DOG_IMAGE_FILES.items():
+            try:
+                images[dog_type] = pygame.image.load(os.path.join(images_dir, filename))
+            except Exception as e:
+                logger.warning("画像読み込みエラー: %s", e)
+        
+        self.dog_images = images
+        return images
+    
+    def get_dog_image(self, dog_type, size):
+        """サイズ調整済みの犬の画像を取得（画像がない場合はプレースホルダー）"""
+        key = (dog_type, size)
+        if key not in self.scaled_dog_images:
+            self.scaled_dog_images[key] = self.scale_dog_image(dog_type, size)
+        
+        return self.scaled_dog_images[key]
+    
+    def scale_dog_image(self, dog_type, size):
+        """犬の画像をサイズ調整（キャッシュには入れない）"""
+        if dog_type in self.dog_images:
+            return pygame.transform.scale(self.dog_images[dog_type], size)
+        
+        # 画像が読み込めない場合はプレースホルダーを使用
+        placeholder = self.placeholder_images[dog_type]["small" if size[0] <= 100 else "large"]
+        return pygame.transform.scale(placeholder, size)
     
-    def create_fonts(self):
-        """フォントを作成"""
-        # デフォルトフォント（フォールバック用）
-        self.default_title_font = pygame.font.Font(None, 48)
-        self.default_normal_font = pygame.font.Font(None, 32)
-        self.default_small_font = pygame.font.Font(None, 24)
-        self.default_tiny_font = pygame.font.Font(None, 18)  # 小さいテキスト用
-        
-        # 日本語フォント
-        self.title_font = Utils.get_japanese_font(48)
-        self.normal_font = Utils.get_japanese_font(32)
-        self.small_font = Utils.get_japanese_font(24)
-        self.tiny_font = Utils.get_japanese_font(18)  # 小さいテキスト用
-        
-        # フォントが正しく読み込めなかった場合はデフォルトフォントを使用
-        if not self.title_font:
-            self.title_font = self.default_title_font
-        if not self.normal_font:
-            self.normal_font = self.default_normal_font
-        if not self.small_font:
-            self.small_font = self.default_small_font
-        if not self.tiny_font:
-            self.tiny_font = self.default_tiny_font
+    def prefetch_dog_image(self, dog_type, size):
+        """犬の画像の事前読み込み作業（ワーカースレッドで計算する関数, 結果を反映する関数）"""
+        key = (dog_type, size)
+        
+        def compute():
+            if key in self.scaled_dog_images:
+                return None
+            return self.scale_dog_image(dog_type, size)
+        
+        def apply(image):
+            if image is not None:
+                self.scaled_dog_images.setdefault(key, image)
+        
+        return compute, apply
+    
+    def create_fonts(self, japanese=True):
+        """フォントを作成して表示言語を決める
+
+        japanese: 日本語フォントを使うかどうか（探し終える前はFalse）
+        """
+        # 日本語フォントで実際に日本語が表示できるかを確認
+        japanese_font = Utils.get_japanese_font(32) if japanese else None
+        self.localization = Localization(Localization.can_render_japanese(japanese_font))
+        
+        # 表示言語に合わせたフォント
+        if self.localization.use_japanese:
+            self.fonts = {
+                name: Utils.get_japanese_font(size) or self.latin_fonts[name]
+                for name, size in self.FONT_SIZES.items()
+            }
+        else:
+            self.fonts = dict(self.latin_fonts)
+        
+        self.title_font = self.fonts["title"]
+        self.normal_font = self.fonts["normal"]
+        self.small_font = self.fonts["small"]
+        self.tiny_font = self.fonts["tiny"]
+    
+    def setup_japanese_fonts(self):
+        """ローディング中に見つけた日本語フォントに切り替える（ローディングの後にメインスレッドで呼ぶ）"""
+        self.create_fonts()
+        
+        # 墓石画像の作成
+        self.tombstone_image = self.create_tombstone_image()
+        
+        # 固定の文字列を事前に描画
+        self.prerender_texts()
+    
+    def tr(self, text):
+        """固定の文字列を表示言語に変換"""
+        return self.localization.text(text)
+    
+    def render_text(self, text, font="normal", color=None, latin=False):
+        """テキストを描画（描画済みのテキストはキャッシュから取得）"""
+        fonts = self.latin_fonts if latin else self.fonts
+        return self.text_cache.render(fonts[font], text, self.BLACK if color is None else color)
+    
+    def render_text_fit(self, text, font, smaller_font, max_width):
+        """テキストを描画（幅に収まらない場合は小さいフォントで描画）"""
+        surface = self.render_text(text, font)
+        if surface.get_width() > max_width:
+            surface = self.render_text(text, smaller_font)
+        return surface
+    
+    def draw_panel(self, rect, fill, border_color=None, border_width=0, radius=0, surface=None):
+        """角丸の枠付きパネルを描画（スタイルごとに一度だけ描画したものを使う）"""
+        target = self.screen if surface is None else surface
+        self.panel_cache.draw(target, rect, fill, border_color, border_width, radius)
+    
+    def prerender_loading_texts(self):
+        """ローディング画面の文字列を事前に描画しておく"""
+        self.render_text(self.tr("ロード中..."))
+        for percent in range(101):
+            self.render_text(f"{percent}%", "small", latin=True)
+    
+    def prerender_texts(self):
+        """固定の文字列を事前に描画しておく"""
+        for text, font in self.STATIC_TEXTS:
+            self.render_text(self.tr(text), font)
     
     def create_placeholder_images(self):
         """プレースホルダー画像を作成"""
@@ -149,25 +393,109 @@ class UI:
         
         return tombstone
     
+    def begin_screen(self, name):
+        """画面の描画を開始（画面のボタンの集まりを切り替える）"""
+        if name not in self.widget_layers:
+            layer = WidgetLayer(name)
+            layer.mouse_pos = self.mouse_pos
+            self.widget_layers[name] = layer
+        
+        self.current_layer = self.widget_layers[name]
+        if self.current_layer.mouse_pos != self.mouse_pos:
+            # 他の画面にいる間にマウスが動いた場合
+            self.current_layer.update_hover(self.mouse_pos)
+        self.current_layer.begin_frame()
+    
+    def end_screen(self):
+        """画面の描画を終了（描画されなかったボタンを削除）"""
+        self.current_layer.end_frame()
+    
+    def add_widget(self, key, rect, kind, value, redraw_rect=None):
+        """現在の画面にボタンを登録（既にある場合はそのまま使う）
+        
+        redraw_rect: ホバー状態が変わった時に描き直す範囲（省略時はボタンの範囲）
+        """
+        return self.current_layer.ensure(key, rect, kind, value, redraw_rect)
+    
+    def handle_mouse_motion(self, pos):
+        """マウスの移動を処理（見た目が変わった範囲の一覧を返す）"""
+        self.mouse_pos = pos
+        if self.current_layer is None:
+            return []
+        
+        self.current_layer.update_hover(pos)
+        rects = [widget.redraw_rect for widget in self.current_layer.take_dirty()]
+        
+        # 犬のリストのホバー状態（前後のカードを描き直す）
+        if self.current_layer.name == "dog_management":
+            hover_index = self.dog_list_view.get_index_at(pos)
+            if hover_index != self.dog_list_hover_index:
+                for index in (self.dog_list_hover_index, hover_index):
+                    if index is not None:
+                        rects.append(self.dog_list_view.get_item_rect(index))
+                self.dog_list_hover_index = hover_index
+        
+        return rects
+    
+    def get_selection(self, mouse_pos, kind):
+        """現在の画面で位置にあるボタンの値を取得"""
+        if self.current_layer is None:
+            return None
+        
+        widget = self.current_layer.hit_test(mouse_pos, kind)
+        return widget.value if widget else None
+    
+    def advance_animation(self, dog):
+        """犬のアニメーションを次のフレームに進める"""
+        animation = self.get_animation(dog.dog_type, dog.growth_stage)
+        if animation is not None:
+            animation.advance()
+    
     def get_animation(self, dog_type, growth_stage):
-        """アニメーションを取得"""
+        """アニメーションを取得（アニメーションがない組み合わせはNone）"""
         key = f"{dog_type}_{growth_stage}"
         if key not in self.animations:
-            self.animations[key] = Animation(dog_type, growth_stage)
+            self.animations[key] = self.load_animation(dog_type, growth_stage)
         
         return self.animations[key]
     
+    @staticmethod
+    def load_animation(dog_type, growth_stage):
+        """アニメーションを作成（作れない場合は一度だけ警告してNone、静止画で表示する）"""
+        try:
+            return Animation(dog_type, growth_stage)
+        except KeyError:
+            logger.warning("アニメーションがありません: %s %s（静止画で表示します）", dog_type, growth_stage)
+            return None
+    
+    def prefetch_animation(self, dog_type, growth_stage):
+        """アニメーションの事前読み込み作業（ワーカースレッドで計算する関数, 結果を反映する関数）"""
+        key = f"{dog_type}_{growth_stage}"
+        
+        def compute():
+            if key in self.animations:
+                return False
+            return self.load_animation(dog_type, growth_stage)
+        
+        def apply(animation):
+            if animation is not False:
+                self.animations.setdefault(key, animation)
+        
+        return compute, apply
+    
+    def release_graveyard_cache(self):
+        """墓地の画面を出る時に墓石のカードを解放"""
+        self.grave_card_cache.clear()
+    
     def draw_dog_selection(self, dog_types):
         """犬の選択画面を描画"""
+        self.begin_screen("select_dog")
+        
         # 背景色を設定
         self.screen.fill(self.BACKGROUND_COLOR)
         
         # タイトル
-        try:
-            title = self.title_font.render("あなたの犬を選んでください", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            title = self.default_title_font.render("Choose your dog", True, self.BLACK)
+        title = self.render_text(self.tr("あなたの犬を選んでください"), "title")
         
         # タイトル背景
         title_bg_rect = pygame.Rect(0, 30, self.width, 60)
@@ -179,107 +507,114 @@ class UI:
         # 音量調整ボタンを右上に配置
         self.draw_volume_controls()
         
-        # 犬の選択肢
-        dog_names = {
-            "コーギー": "コーギー",
-            "ミニチュアダックスフンド": "ダックス",  # 表示名を短くする
-            "柴犬": "柴犬"
-        }
-        
-        # 犬の画像を読み込む
-        dog_images = {}
-        try:
-            # コーギーの画像
-            corgi_img = pygame.image.load("./dog_inubiyori/assets/dogs/corgi.png")
-            corgi_img = pygame.transform.scale(corgi_img, (150, 150))
-            dog_images["コーギー"] = corgi_img
-            
-            # ダックスフンドの画像
-            dachshund_img = pygame.image.load("./dog_inubiyori/assets/dogs/dachsuhund.png")
-            dachshund_img = pygame.transform.scale(dachshund_img, (150, 150))
-            dog_images["ミニチュアダックスフンド"] = dachshund_img
-            
-            # 柴犬の画像
-            shiba_img = pygame.image.load("./dog_inubiyori/assets/dogs/shiba.png")
-            shiba_img = pygame.transform.scale(shiba_img, (150, 150))
-            dog_images["柴犬"] = shiba_img
-        except Exception as e:
-            print(f"画像読み込みエラー: {e}")
-            # 画像が読み込めない場合はプレースホルダーを使用
-            for dog_type in dog_types:
-                dog_images[dog_type] = self.placeholder_images[dog_type]["large"]
-        
         # 犬の選択ボタンを描画
         button_width = 220
         button_height = 250
         margin = 40
         
-        # マウス位置を取得してホバー効果を適用
-        mouse_pos = pygame.mouse.get_pos()
-        
         for i, dog_type in enumerate(dog_types):
             x = (self.width - (button_width * len(dog_types) + margin * (len(dog_types) - 1))) // 2 + i * (button_width + margin)
             y = self.height // 2 - 100
             
-            # ホバー効果の判定
-            is_hover = x <= mouse_pos[0] <= x + button_width and y <= mouse_pos[1] <= y + button_height
+            # ボタンを登録してホバー状態を取得
+            is_hover = self.add_widget(f"dog_{dog_type}", (x, y, button_width, button_height), "dog_type", dog_type).hover
             
-            # ボタンの背景
+            # ボタンの背景と枠線 - ホバー時は色を変えて枠線を太く
             button_color = self.HOVER_COLOR if is_hover else self.BUTTON_COLOR
-            pygame.draw.rect(self.screen, button_color, (x, y, button_width, button_height), border_radius=15)
-            
-            # ボタンの枠線 - ホバー時は太く
             border_width = 3 if is_hover else 2
-            pygame.draw.rect(self.screen, self.BLACK, (x, y, button_width, button_height), border_width, border_radius=15)
+            self.draw_panel((x, y, button_width, button_height), button_color, self.BLACK, border_width, 15)
             
             # 犬の画像
-            if dog_type in dog_images:
-                dog_img = dog_images[dog_type]
-                self.screen.blit(dog_img, (x + button_width // 2 - dog_img.get_width() // 2, y + 30))
-            else:
-                # 画像がない場合はプレースホルダー
-                self.screen.blit(self.placeholder_images[dog_type]["large"], (x + button_width // 2 - 75, y + 30))
+            dog_img = self.get_dog_image(dog_type, (150, 150))
+            self.screen.blit(dog_img, (x + button_width // 2 - dog_img.get_width() // 2, y + 30))
             
             # 犬の名前
-            display_name = dog_names.get(dog_type, dog_type)
-            try:
-                name = self.normal_font.render(display_name, True, self.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                name = self.default_normal_font.render(dog_names.get(dog_type, dog_type), True, self.BLACK)
+            name = self.render_text(self.localization.dog_type(dog_type))
             
             # 名前の背景
             name_bg_rect = pygame.Rect(x + 10, y + button_height - 60, button_width - 20, 40)
-            pygame.draw.rect(self.screen, (255, 255, 255, 180), name_bg_rect, border_radius=8)
+            self.draw_panel(name_bg_rect, (255, 255, 255), radius=8)
             
             self.screen.blit(name, (x + button_width // 2 - name.get_width() // 2, y + button_height - 50))
         
         # メニューボタン（右上に配置）
         self.draw_menu_buttons(["墓地を見る", "トレーナー"])
+        
+        self.end_screen()
     
-    def check_dog_selection(self, mouse_pos, dog_types):
-        """犬の選択をチェック"""
-        button_width = 200
-        button_height = 220
-        margin = 50
+    def get_name_input_rect(self):
+        """名前の入力欄の位置"""
+        input_bg_width = 300
+        input_bg_height = 50
+        return pygame.Rect(self.width // 2 - input_bg_width // 2, 150, input_bg_width, input_bg_height)
+    
+    def draw_name_entry(self, dog_type, input_name, composition, cursor_visible):
+        """犬の名前の入力画面を描画"""
+        self.begin_screen("name_entry")
         
-        for i, dog_type in enumerate(dog_types):
-            x = (self.width - (button_width * len(dog_types) + margin * (len(dog_types) - 1))) // 2 + i * (button_width + margin)
-            y = self.height // 2 - 100
-            
-            # ボタンの範囲内かチェック
-            if x <= mouse_pos[0] <= x + button_width and y <= mouse_pos[1] <= y + button_height:
-                return dog_type
+        self.screen.fill(self.BACKGROUND_COLOR)
+        
+        # タイトル背景
+        pygame.draw.rect(self.screen, (240, 240, 255), (0, 0, self.width, 80))
+        pygame.draw.line(self.screen, (220, 220, 240), (0, 80), (self.width, 80), 2)
         
-        return None
+        # タイトル
+        title = self.render_text(self.tr("犬の名前を入力してください"), "title")
+        self.screen.blit(title, (self.width // 2 - title.get_width() // 2, 20))
+        
+        # 犬の種類表示
+        loc = self.localization
+        dog_type_text = self.render_text(loc.format("dog_type_label", dog_type=loc.dog_type(dog_type, short=False)))
+        self.screen.blit(dog_type_text, (self.width // 2 - dog_type_text.get_width() // 2, 100))
+        
+        # 入力フィールドの背景
+        input_rect = self.get_name_input_rect()
+        self.draw_panel(input_rect, self.WHITE, self.BLACK, 2, 8)
+        
+        text_x = input_rect.x + 10
+        if input_name or composition:
+            # 確定した文字列
+            if input_name:
+                name_text = self.render_text(input_name)
+                self.screen.blit(name_text, (text_x, input_rect.centery - name_text.get_height() // 2))
+                text_x += name_text.get_width()
+            
+            # IMEで変換中の文字列（下線付きで表示）
+            if composition:
+                composition_text = self.render_text(composition, color=(90, 90, 160))
+                composition_y = input_rect.centery - composition_text.get_height() // 2
+                self.screen.blit(composition_text, (text_x, composition_y))
+                underline_y = composition_y + composition_text.get_height()
+                pygame.draw.line(self.screen, (90, 90, 160), (text_x, underline_y),
+                                 (text_x + composition_text.get_width(), underline_y), 1)
+                text_x += composition_text.get_width()
+        else:
+            # プレースホルダー（入力が空の場合は犬種が名前になる）
+            placeholder = self.render_text(dog_type, color=(150, 150, 150))
+            self.screen.blit(placeholder, (text_x, input_rect.centery - placeholder.get_height() // 2))
+        
+        # カーソル表示（点滅）
+        if cursor_visible:
+            cursor_y = input_rect.y + 10
+            pygame.draw.line(self.screen, self.BLACK, (text_x, cursor_y), (text_x, cursor_y + input_rect.height - 20), 2)
+        
+        # 説明テキスト
+        info_text = self.render_text(self.tr("Enterキーで確定 (最大10文字)"), "small")
+        self.screen.blit(info_text, (self.width // 2 - info_text.get_width() // 2, input_rect.bottom + 10))
+        
+        # 犬の画像（サイズ調整済みの画像を使う）
+        dog_img = self.get_dog_image(dog_type, (200, 200))
+        self.screen.blit(dog_img, (self.width // 2 - dog_img.get_width() // 2, 220))
+        
+        self.end_screen()
+    
+    def check_dog_selection(self, mouse_pos, dog_types):
+        """犬の選択をチェック"""
+        dog_type = self.get_selection(mouse_pos, "dog_type")
+        return dog_type if dog_type in dog_types else None
     
     def draw_menu_buttons(self, menu_items):
         """メニューボタンを描画"""
-        self.menu_buttons = []
-        
-        # マウス位置を取得してホバー効果を適用
-        mouse_pos = pygame.mouse.get_pos()
-        
         icon_size = 40
         margin = 15
         # 右端からではなく、少し左に寄せる（例: +30px）
@@ -290,8 +625,19 @@ class UI:
         for i, item in enumerate(menu_items):
             x = start_x + i * (icon_size + margin)
             
-            # ホバー効果の判定
-            is_hover = x <= mouse_pos[0] <= x + icon_size and y <= mouse_pos[1] <= y + icon_size
+            # ツールチップ（ホバー時にボタンの上に表示する）
+            tooltip = self.render_text(self.tr(item), "tiny")
+            tooltip_padding = 5
+            tooltip_bg = pygame.Rect(
+                x + icon_size // 2 - tooltip.get_width() // 2 - tooltip_padding,
+                y - tooltip.get_height() - 10,
+                tooltip.get_width() + tooltip_padding * 2,
+                tooltip.get_height() + tooltip_padding * 2
+            )
+            
+            # ボタンを登録してホバー状態を取得（ホバーが変わった時はツールチップの範囲も描き直す）
+            button_rect = pygame.Rect(x, y, icon_size, icon_size)
+            is_hover = self.add_widget(f"menu_{item}", button_rect, "menu", item, button_rect.union(tooltip_bg)).hover
             
             # アイコンの背景（円形）
             button_color = self.HOVER_COLOR if is_hover else self.YELLOW
@@ -312,32 +658,6 @@ class UI:
                 # 人物アイコン
                 pygame.draw.circle(self.screen, (100, 100, 200), (x + icon_size // 2, y + 15), 8)  # 頭
                 pygame.draw.rect(self.screen, (100, 100, 200), (x + icon_size // 2 - 8, y + 23, 16, 12))  # 体
-                
-            # ツールチップ（ホバー時）
-            if is_hover:
-                try:
-                    tooltip = self.tiny_font.render(item, True, self.BLACK)
-                except:
-                    # フォールバック: 英語で表示
-                    menu_names = {"墓地を見る": "Graveyard", "トレーナー": "Trainer Info"}
-                    tooltip = self.default_tiny_font.render(menu_names.get(item, item), True, self.BLACK)
-                
-                # ツールチップの背景
-                tooltip_padding = 5
-                tooltip_bg = pygame.Rect(
-                    x + icon_size // 2 - tooltip.get_width() // 2 - tooltip_padding,
-                    y - tooltip.get_height() - 10,
-                    tooltip.get_width() + tooltip_padding * 2,
-                    tooltip.get_height() + tooltip_padding * 2
-                )
-                pygame.draw.rect(self.screen, (255, 255, 220), tooltip_bg, border_radius=5)
-                pygame.draw.rect(self.screen, self.BLACK, tooltip_bg, 1, border_radius=5)
-                
-                # ツールチップのテキスト
-                self.screen.blit(tooltip, (x + icon_size // 2 - tooltip.get_width() // 2, y - tooltip.get_height() - 5))
-            
-            # ボタンの位置を保存
-            self.menu_buttons.append((x, y, icon_size, icon_size, item))
             
             # アイコンの描画
             if item == "墓地を見る":
@@ -353,37 +673,16 @@ class UI:
                 
             # ツールチップ（ホバー時）
             if is_hover:
-                try:
-                    tooltip = self.tiny_font.render(item, True, self.BLACK)
-                except:
-                    # フォールバック: 英語で表示
-                    menu_names = {"墓地を見る": "Graveyard", "トレーナー": "Trainer Info"}
-                    tooltip = self.default_tiny_font.render(menu_names.get(item, item), True, self.BLACK)
-                
                 # ツールチップの背景
-                tooltip_padding = 5
-                tooltip_bg = pygame.Rect(
-                    x + icon_size // 2 - tooltip.get_width() // 2 - tooltip_padding,
-                    y - tooltip.get_height() - 10,
-                    tooltip.get_width() + tooltip_padding * 2,
-                    tooltip.get_height() + tooltip_padding * 2
-                )
-                pygame.draw.rect(self.screen, (255, 255, 220), tooltip_bg, border_radius=5)
-                pygame.draw.rect(self.screen, self.BLACK, tooltip_bg, 1, border_radius=5)
+                self.draw_panel(tooltip_bg, (255, 255, 220), self.BLACK, 1, 5)
                 
                 # ツールチップのテキスト
                 self.screen.blit(tooltip, (x + icon_size // 2 - tooltip.get_width() // 2, y - tooltip.get_height() - 5))
             
-            # ボタンの位置を保存
-            self.menu_buttons.append((x, y, icon_size, icon_size, item))
     
     def check_menu_selection(self, mouse_pos):
         """メニューの選択をチェック"""
-        for x, y, width, height, item in self.menu_buttons:
-            if x <= mouse_pos[0] <= x + width and y <= mouse_pos[1] <= y + height:
-                return item
-        
-        return None
+        return self.get_selection(mouse_pos, "menu")
     
     def draw_loading_screen(self, progress=0):
         """ローディング画面を描画"""
@@ -405,7 +704,7 @@ class UI:
         y = self.height // 2 + 50  # ロゴの下に配置
         
         # バーの背景
-        pygame.draw.rect(self.screen, self.YELLOW, (x, y, bar_width, bar_height), border_radius=8)
+        self.draw_panel((x, y, bar_width, bar_height), self.YELLOW, radius=8)
         
         # バーの進捗
         progress_width = int(bar_width * progress)
@@ -413,14 +712,10 @@ class UI:
             pygame.draw.rect(self.screen, self.GREEN, (x, y, progress_width, bar_height), border_radius=8)
         
         # バーの枠
-        pygame.draw.rect(self.screen, self.BLACK, (x, y, bar_width, bar_height), 2, border_radius=8)
+        self.draw_panel((x, y, bar_width, bar_height), None, self.BLACK, 2, 8)
         
         # ローディングテキスト
-        try:
-            loading_text = self.normal_font.render("ロード中...", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            loading_text = self.default_normal_font.render("Loading...", True, self.BLACK)
+        loading_text = self.render_text(self.tr("ロード中..."))
         
         self.screen.blit(loading_text, (self.width // 2 - loading_text.get_width() // 2, y + bar_height + 20))
         
@@ -451,7 +746,7 @@ class UI:
             pygame.draw.ellipse(self.screen, self.BROWN, (dog_x + 10, dog_y - 25, 15, 25))
         
         # 進捗率テキスト
-        progress_text = self.default_small_font.render(f"{int(progress * 100)}%", True, self.BLACK)
+        progress_text = self.render_text(f"{int(progress * 100)}%", "small", latin=True)
         self.screen.blit(progress_text, (x + bar_width + 10, y + bar_height // 2 - progress_text.get_height() // 2))
         
         # 画面を更新
@@ -459,6 +754,8 @@ class UI:
     
     def draw_main_game(self, dog, game_state):
         """メインゲーム画面を描画"""
+        self.begin_screen("main_game")
+        
         # 背景を塗りつぶす
         self.screen.fill(self.BACKGROUND_COLOR)
         
@@ -467,32 +764,18 @@ class UI:
         pygame.draw.line(self.screen, (220, 220, 240), (0, 120), (self.width, 120), 2)
         
         # 犬の名前と種類
-        display_name = "ダックス" if dog.dog_type == "ミニチュアダックスフンド" else dog.dog_type
-        try:
-            name_text = self.title_font.render(f"{dog.name} ({display_name})", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            dog_names = {"コーギー": "Corgi", "ミニチュアダックスフンド": "Dachshund", "柴犬": "Shiba"}
-            name_text = self.default_title_font.render(f"{dog.name} ({dog_names.get(dog.dog_type, dog.dog_type)})", True, self.BLACK)
+        loc = self.localization
+        name_text = self.render_text(loc.format("dog_title", name=dog.name, dog_type=loc.dog_type(dog.dog_type)), "title")
         
         self.screen.blit(name_text, (self.width // 2 - name_text.get_width() // 2, 20))
         
         # 成長段階
-        try:
-            growth_text = self.normal_font.render(f"成長段階: {dog.growth_stage}", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            growth_names = {"子犬": "Puppy", "成犬": "Adult", "老犬": "Senior"}
-            growth_text = self.default_normal_font.render(f"Growth: {growth_names.get(dog.growth_stage, dog.growth_stage)}", True, self.BLACK)
+        growth_text = self.render_text(loc.format("growth_stage", stage=loc.text(dog.growth_stage)))
         
         self.screen.blit(growth_text, (self.width // 2 - growth_text.get_width() // 2, 70))
         
         # 生存日数
-        try:
-            days_text = self.small_font.render(f"生存日数: {int(dog.lifespan_days)}日", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            days_text = self.default_small_font.render(f"Days: {int(dog.lifespan_days)}", True, self.BLACK)
+        days_text = self.render_text(loc.format("lifespan_days", days=int(dog.lifespan_days)), "small")
         
         self.screen.blit(days_text, (self.width // 2 - days_text.get_width() // 2, 100))
         
@@ -505,45 +788,20 @@ class UI:
         
         # 犬のアニメーション
         if dog.is_alive:
-            # 犬の画像を表示（アニメーションがない場合）
-            try:
-                if dog.dog_type == "コーギー":
-                    dog_img = pygame.image.load(os.path.join("dog_inubiyori", "assets", "dogs", "corgi.png"))
-                elif dog.dog_type == "ミニチュアダックスフンド":
-                    dog_img = pygame.image.load(os.path.join("dog_inubiyori", "assets", "dogs", "dachsuhund.png"))
-                elif dog.dog_type == "柴犬":
-                    dog_img = pygame.image.load(os.path.join("dog_inubiyori", "assets", "dogs", "shiba.png"))
-                else:
-                    # 未知の犬種の場合はプレースホルダーを使用
-                    dog_img = self.placeholder_images[dog.dog_type]["large"]
-                
-                # 画像サイズを調整
-                dog_img = pygame.transform.scale(dog_img, (180, 180))
-                
-                # アニメーションがある場合はそちらを優先
-                animation = self.get_animation(dog.dog_type, dog.growth_stage)
-                animation_state = dog.get_animation_state()
-                
+            animation = self.get_animation(dog.dog_type, dog.growth_stage)
+            if animation is not None:
                 # アニメーション状態を更新
+                animation_state = dog.get_animation_state()
                 if self.current_animation_state != animation_state:
                     animation.set_animation(animation_state)
                     self.current_animation_state = animation_state
                 
-                # アニメーションを更新
-                animation.update(pygame.time.get_ticks())
-                
-                # アニメーションフレームを取得
                 animation_frame = animation.get_current_frame()
-                
-                # アニメーションがある場合はそれを表示、なければ静止画を表示
-                if animation_frame:
-                    self.screen.blit(animation_frame, (self.width // 2 - animation_frame.get_width() // 2, 140))
-                else:
-                    self.screen.blit(dog_img, (self.width // 2 - dog_img.get_width() // 2, 140))
-            except Exception as e:
-                print(f"画像読み込みエラー: {e}")
-                # エラーが発生した場合はプレースホルダーを使用
-                self.screen.blit(self.placeholder_images[dog.dog_type]["large"], (self.width // 2 - 100, 140))
+                self.screen.blit(animation_frame, (self.width // 2 - animation_frame.get_width() // 2, 140))
+            else:
+                # アニメーションがない場合は犬の静止画を表示
+                dog_img = self.get_dog_image(dog.dog_type, (180, 180))
+                self.screen.blit(dog_img, (self.width // 2 - dog_img.get_width() // 2, 140))
         else:
             # 死亡時は墓石を表示
             self.screen.blit(self.tombstone_image, (self.width // 2 - 50, 170))
@@ -555,47 +813,14 @@ class UI:
         message_y = 480
         message_height = 60
         message_bg_rect = pygame.Rect(20, message_y - 10, self.width - 40, message_height)
-        pygame.draw.rect(self.screen, (240, 240, 255), message_bg_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (220, 220, 240), message_bg_rect, 2, border_radius=10)
+        self.draw_panel(message_bg_rect, (240, 240, 255), (220, 220, 240), 2, 10)
         
         # メッセージ
-        try:
-            message = self.normal_font.render(game_state.message, True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            message_map = {
-                "犬を選んでください": "Please select a dog",
-                "もういない": "is gone",
-                "永遠の眠りについた": "has passed away",
-                "ご飯を美味しそうに食べた": "ate the food happily",
-                "楽しく散歩した": "enjoyed the walk",
-                "しつけを頑張った": "trained well",
-                "トイレをきれいに片付けた": "toilet is clean now",
-                "おもちゃで楽しく遊んだ": "played with toys happily",
-                "疲れていて散歩に行きたがらない": "is too tired to walk",
-                "疲れていてしつけに集中できない": "is too tired to train",
-                "疲れていて遊びたがらない": "is too tired to play",
-                "とても幸せ": "very happy",
-                "幸せ": "happy",
-                "普通": "normal",
-                "不満": "unsatisfied",
-                "不機嫌": "grumpy",
-                "病気": "sick"
-            }
-            
-            # メッセージを英語に変換
-            eng_message = game_state.message
-            for jp, eng in message_map.items():
-                if jp in eng_message:
-                    eng_message = eng_message.replace(jp, eng)
-            
-            message = self.default_normal_font.render(eng_message, True, self.BLACK)
+        message_text = loc.message(game_state.message)
+        message = self.render_text(message_text)
         # メッセージが長すぎる場合は小さいフォントで表示
         if message.get_width() > message_bg_rect.width - 20:
-            try:
-                message = self.small_font.render(game_state.message, True, self.BLACK)
-            except:
-                message = self.default_small_font.render(eng_message, True, self.BLACK)
+            message = self.render_text(message_text, "small")
         
         # メッセージ表示位置を調整
         self.screen.blit(message, (self.width // 2 - message.get_width() // 2, message_y + 10))
@@ -611,32 +836,31 @@ class UI:
         # メニューボタン
         self.draw_menu_buttons(["墓地を見る", "トレーナー"])
         
+        self.end_screen()
+        
     def draw_status_bars(self, dog, start_y=80):
         """ステータスバーを描画"""
         status_items = [
-            ("満腹度", "Hunger", dog.hunger, self.GREEN, "ご飯をあげる"),
-            ("幸福度", "Happiness", dog.happiness, self.YELLOW, "おもちゃで遊ぶ"),
-            ("しつけ度", "Discipline", dog.discipline, self.LIGHT_BLUE, "しつけをする"),
-            ("清潔度", "Cleanliness", dog.cleanliness, self.WHITE, "トイレを片付ける"),
-            ("元気度", "Energy", dog.energy, self.RED, "散歩にいく"),
-            ("健康度", "Health", dog.health, self.GREEN, None)
+            ("hunger", "満腹度", dog.hunger, self.GREEN, "ご飯をあげる"),
+            ("happiness", "幸福度", dog.happiness, self.YELLOW, "おもちゃで遊ぶ"),
+            ("discipline", "しつけ度", dog.discipline, self.LIGHT_BLUE, "しつけをする"),
+            ("cleanliness", "清潔度", dog.cleanliness, self.WHITE, "トイレを片付ける"),
+            ("energy", "元気度", dog.energy, self.RED, "散歩にいく"),
+            ("health", "健康度", dog.health, self.GREEN, None)
         ]
         
         # ステータスバーの背景
         status_bg_height = len(status_items) * 30 + 20
-        pygame.draw.rect(self.screen, (245, 245, 255), (10, start_y - 10, self.width - 20, status_bg_height), border_radius=10)
-        pygame.draw.rect(self.screen, (220, 220, 240), (10, start_y - 10, self.width - 20, status_bg_height), 2, border_radius=10)
-        
-        self.action_buttons = []  # ボタンリストをクリア
-        
-        # マウス位置を取得してホバー効果を適用
-        mouse_pos = pygame.mouse.get_pos()
+        self.draw_panel((10, start_y - 10, self.width - 20, status_bg_height), (245, 245, 255), (220, 220, 240), 2, 10)
         
         # ステータスを2列に分けて表示
         items_per_column = 3
         column_width = 220
         
-        for i, (jp_name, en_name, value, color, action) in enumerate(status_items):
+        # バーと値はまとめて描画する（値が変わったバーだけ描画し直される）
+        bars = []
+        
+        for i, (key, status, value, color, action) in enumerate(status_items):
             # 列と行を計算
             column = i // items_per_column
             row = i % items_per_column
@@ -644,46 +868,15 @@ class UI:
             x = 30 + column * column_width
             y = start_y + row * 30
             
-            # ステータス名
-            try:
-                status_name = self.small_font.render(jp_name, True, self.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                status_name = self.default_small_font.render(en_name, True, self.BLACK)
-            
-            # ステータス名のフォントサイズを小さく
-            if status_name.get_height() > 18:
-                try:
-                    smaller_font = Utils.get_japanese_font(16)
-                    status_name = smaller_font.render(jp_name, True, self.BLACK)
-                except:
-                    smaller_font = pygame.font.Font(None, 16)
-                    status_name = smaller_font.render(en_name, True, self.BLACK)
+            # ステータス名（バーの横に収まるように小さいフォントで表示）
+            status_name = self.render_text(self.tr(status), "label")
             
             self.screen.blit(status_name, (x, y + 2))  # 垂直位置を微調整
             
-            # ステータスバーの背景
-            bar_width = 100
+            # ステータスバーの位置
             bar_x = x + 70
             bar_y = y + 2  # 垂直位置を微調整
-            
-            pygame.draw.rect(self.screen, self.YELLOW, (bar_x, bar_y, bar_width, self.STATUS_BAR_HEIGHT), border_radius=5)
-            
-            # ステータスバーの値
-            value_width = min(value * bar_width / 100, bar_width)  # 値に応じた幅
-            if value_width > 0:  # 値が0より大きい場合のみ描画
-                pygame.draw.rect(self.screen, color, (bar_x, bar_y, value_width, self.STATUS_BAR_HEIGHT), border_radius=5)
-            
-            # ステータスバーの枠
-            pygame.draw.rect(self.screen, self.BLACK, (bar_x, bar_y, bar_width, self.STATUS_BAR_HEIGHT), 1, border_radius=5)
-            
-            # ステータス値
-            value_text = self.default_small_font.render(f"{int(value)}", True, self.BLACK)
-            # ステータス値のフォントサイズを小さく
-            if value_text.get_height() > 18:
-                value_text = pygame.font.Font(None, 16).render(f"{int(value)}", True, self.BLACK)
-            
-            self.screen.blit(value_text, (bar_x + bar_width + 5, bar_y))
+            bars.append((key, value, color, (bar_x, bar_y)))
             
             # アクションボタン（対応するアクションがある場合）
             if action and dog.is_alive:
@@ -692,65 +885,32 @@ class UI:
                 button_x = self.width - button_width - 30
                 button_y = y
                 
-                # ホバー効果の判定
-                is_hover = button_x <= mouse_pos[0] <= button_x + button_width and button_y <= mouse_pos[1] <= button_y + button_height
+                # ボタンを登録してホバー状態を取得
+                is_hover = self.add_widget(f"action_{action}", (button_x, button_y, button_width, button_height),
+                                           "action", action).hover
                 
-                # ボタンの背景
+                # ボタンの背景と枠線 - ホバー時は色を変えて枠線を太く
                 button_color = self.HOVER_COLOR if is_hover else self.ACTION_BUTTON_COLOR
-                pygame.draw.rect(self.screen, button_color, (button_x, button_y, button_width, button_height), border_radius=7)
-                
-                # ボタンの枠線 - ホバー時は太く
                 border_width = 2 if is_hover else 1
-                pygame.draw.rect(self.screen, self.BLACK, (button_x, button_y, button_width, button_height), border_width, border_radius=7)
+                self.draw_panel((button_x, button_y, button_width, button_height), button_color, self.BLACK, border_width, 7)
                 
-                # ボタンのテキスト
-                try:
-                    action_text = self.small_font.render(action, True, self.BLACK)
-                except:
-                    action_name_map = {
-                        "ご飯をあげる": "Feed",
-                        "散歩にいく": "Walk",
-                        "しつけをする": "Train",
-                        "トイレを片付ける": "Clean",
-                        "おもちゃで遊ぶ": "Play"
-                    }
-                    action_text = self.default_small_font.render(action_name_map.get(action, action), True, self.BLACK)
-                
-                # テキストが長すぎる場合はさらに小さいフォントに
-                if action_text.get_width() > button_width - 10:
-                    try:
-                        smaller_font = Utils.get_japanese_font(14)
-                        action_text = smaller_font.render(action, True, self.BLACK)
-                    except:
-                        smaller_font = pygame.font.Font(None, 14)
-                        action_name_map = {
-                            "ご飯をあげる": "Feed",
-                            "散歩にいく": "Walk",
-                            "しつけをする": "Train",
-                            "トイレを片付ける": "Clean",
-                            "おもちゃで遊ぶ": "Play"
-                        }
-                        action_text = smaller_font.render(action_name_map.get(action, action), True, self.BLACK)
+                # ボタンのテキスト（長すぎる場合はさらに小さいフォントに）
+                action_text = self.render_text_fit(self.tr(action), "small", "micro", button_width - 10)
                 
                 # テキストを中央に配置
                 self.screen.blit(action_text, (button_x + button_width // 2 - action_text.get_width() // 2, 
                                             button_y + button_height // 2 - action_text.get_height() // 2))
-                
-                # ボタンの位置を保存
-                self.action_buttons.append((button_x, button_y, button_width, button_height, action))
+        
+        # ステータスバーと値
+        self.status_panel.draw_bars(self.screen, bars)
     
     def draw_action_buttons(self, actions):
         """アクションボタンを描画"""
-        self.action_buttons = []
-        
         # ボタンの配置を調整
         button_width = 150  # ボタン幅を広げる
         button_height = 50  # ボタン高さを高くする
         margin = 20  # マージンを広げる
         
-        # マウス位置を取得してホバー効果を適用
-        mouse_pos = pygame.mouse.get_pos()
-        
         # 画面サイズに応じてボタンを配置
         if self.width < 600:  # モバイルサイズ対応
             # 縦に並べる（1列）
@@ -758,43 +918,19 @@ class UI:
                 x = (self.width - button_width) // 2
                 y = self.height - 300 + i * (button_height + margin)
                 
-                # ホバー効果の判定
-                is_hover = x <= mouse_pos[0] <= x + button_width and y <= mouse_pos[1] <= y + button_height
+                # ボタンを登録してホバー状態を取得
+                is_hover = self.add_widget(f"action_{action}", (x, y, button_width, button_height), "action", action).hover
                 
                 # ボタンの背景
                 button_color = self.HOVER_COLOR if is_hover else self.LIGHT_BLUE
-                pygame.draw.rect(self.screen, button_color, (x, y, button_width, button_height), border_radius=10)
-                pygame.draw.rect(self.screen, self.BLACK, (x, y, button_width, button_height), 2, border_radius=10)
+                self.draw_panel((x, y, button_width, button_height), button_color, self.BLACK, 2, 10)
                 
-                # ボタンのテキスト
-                try:
-                    action_text = self.small_font.render(action, True, self.BLACK)
-                except:
-                    # フォールバック: 英語で表示
-                    action_name_map = {
-                        "ご飯をあげる": "Feed",
-                        "散歩にいく": "Walk",
-                        "しつけをする": "Train",
-                        "トイレを片付ける": "Clean",
-                        "おもちゃで遊ぶ": "Play"
-                    }
-                    action_text = self.default_small_font.render(action_name_map.get(action, action), True, self.BLACK)
-                
-                # テキストが長すぎる場合はフォントサイズを調整
-                if action_text.get_width() > button_width - 20:
-                    try:
-                        smaller_font = Utils.get_japanese_font(20)  # 小さいフォント
-                        action_text = smaller_font.render(action, True, self.BLACK)
-                    except:
-                        smaller_font = pygame.font.Font(None, 20)
-                        action_text = smaller_font.render(action_name_map.get(action, action), True, self.BLACK)
+                # ボタンのテキスト（長すぎる場合はフォントサイズを調整）
+                action_text = self.render_text_fit(self.tr(action), "small", "caption", button_width - 20)
                 
                 # テキストを中央に配置
                 self.screen.blit(action_text, (x + button_width // 2 - action_text.get_width() // 2, 
                                             y + button_height // 2 - action_text.get_height() // 2))
-                
-                # ボタンの位置を保存
-                self.action_buttons.append((x, y, button_width, button_height, action))
         else:
             # 画面幅に収まらない場合は2行に分ける
             if len(actions) > 3:
@@ -811,43 +947,19 @@ class UI:
                     x = (self.width - row_width) // 2 + col * (button_width + margin)
                     y = self.height - 150 + row * (button_height + margin)
                     
-                    # ホバー効果の判定
-                    is_hover = x <= mouse_pos[0] <= x + button_width and y <= mouse_pos[1] <= y + button_height
+                    # ボタンを登録してホバー状態を取得
+                    is_hover = self.add_widget(f"action_{action}", (x, y, button_width, button_height), "action", action).hover
                     
                     # ボタンの背景
                     button_color = self.HOVER_COLOR if is_hover else self.LIGHT_BLUE
-                    pygame.draw.rect(self.screen, button_color, (x, y, button_width, button_height), border_radius=10)
-                    pygame.draw.rect(self.screen, self.BLACK, (x, y, button_width, button_height), 2, border_radius=10)
-                    
-                    # ボタンのテキスト
-                    try:
-                        action_text = self.small_font.render(action, True, self.BLACK)
-                    except:
-                        # フォールバック: 英語で表示
-                        action_name_map = {
-                            "ご飯をあげる": "Feed",
-                            "散歩にいく": "Walk",
-                            "しつけをする": "Train",
-                            "トイレを片付ける": "Clean",
-                            "おもちゃで遊ぶ": "Play"
-                        }
-                        action_text = self.default_small_font.render(action_name_map.get(action, action), True, self.BLACK)
+                    self.draw_panel((x, y, button_width, button_height), button_color, self.BLACK, 2, 10)
                     
-                    # テキストが長すぎる場合はフォントサイズを調整
-                    if action_text.get_width() > button_width - 20:
-                        try:
-                            smaller_font = Utils.get_japanese_font(20)  # 小さいフォント
-                            action_text = smaller_font.render(action, True, self.BLACK)
-                        except:
-                            smaller_font = pygame.font.Font(None, 20)
-                            action_text = smaller_font.render(action_name_map.get(action, action), True, self.BLACK)
+                    # ボタンのテキスト（長すぎる場合はフォントサイズを調整）
+                    action_text = self.render_text_fit(self.tr(action), "small", "caption", button_width - 20)
                     
                     # テキストを中央に配置
                     self.screen.blit(action_text, (x + button_width // 2 - action_text.get_width() // 2, 
                                                 y + button_height // 2 - action_text.get_height() // 2))
-                    
-                    # ボタンの位置を保存
-                    self.action_buttons.append((x, y, button_width, button_height, action))
             else:
                 # 1行に収まる場合
                 total_width = button_width * len(actions) + margin * (len(actions) - 1)
@@ -856,98 +968,55 @@ class UI:
                     x = (self.width - total_width) // 2 + i * (button_width + margin)
                     y = self.height - 100
                     
-                    # ホバー効果の判定
-                    is_hover = x <= mouse_pos[0] <= x + button_width and y <= mouse_pos[1] <= y + button_height
+                    # ボタンを登録してホバー状態を取得
+                    is_hover = self.add_widget(f"action_{action}", (x, y, button_width, button_height), "action", action).hover
                     
                     # ボタンの背景
                     button_color = self.HOVER_COLOR if is_hover else self.LIGHT_BLUE
-                    pygame.draw.rect(self.screen, button_color, (x, y, button_width, button_height), border_radius=10)
-                    pygame.draw.rect(self.screen, self.BLACK, (x, y, button_width, button_height), 2, border_radius=10)
-                    
-                    # ボタンのテキスト
-                    try:
-                        action_text = self.small_font.render(action, True, self.BLACK)
-                    except:
-                        # フォールバック: 英語で表示
-                        action_name_map = {
-                            "ご飯をあげる": "Feed",
-                            "散歩にいく": "Walk",
-                            "しつけをする": "Train",
-                            "トイレを片付ける": "Clean",
-                            "おもちゃで遊ぶ": "Play"
-                        }
-                        action_text = self.default_small_font.render(action_name_map.get(action, action), True, self.BLACK)
+                    self.draw_panel((x, y, button_width, button_height), button_color, self.BLACK, 2, 10)
                     
-                    # テキストが長すぎる場合はフォントサイズを調整
-                    if action_text.get_width() > button_width - 20:
-                        try:
-                            smaller_font = Utils.get_japanese_font(20)  # 小さいフォント
-                            action_text = smaller_font.render(action, True, self.BLACK)
-                        except:
-                            smaller_font = pygame.font.Font(None, 20)
-                            action_text = smaller_font.render(action_name_map.get(action, action), True, self.BLACK)
+                    # ボタンのテキスト（長すぎる場合はフォントサイズを調整）
+                    action_text = self.render_text_fit(self.tr(action), "small", "caption", button_width - 20)
                     
                     # テキストを中央に配置
                     self.screen.blit(action_text, (x + button_width // 2 - action_text.get_width() // 2, 
                                                 y + button_height // 2 - action_text.get_height() // 2))
-                    
-                    # ボタンの位置を保存
-                    self.action_buttons.append((x, y, button_width, button_height, action))
     
     def draw_restart_button(self):
         """再スタートボタンを描画"""
-        self.action_buttons = []
-        
         button_width = 240
         button_height = 60
         x = self.width // 2 - button_width // 2
         y = self.height - 100
         
-        # マウス位置を取得してホバー効果を適用
-        mouse_pos = pygame.mouse.get_pos()
-        is_hover = x <= mouse_pos[0] <= x + button_width and y <= mouse_pos[1] <= y + button_height
+        # ボタンを登録してホバー状態を取得
+        is_hover = self.add_widget("restart", (x, y, button_width, button_height), "action", "restart").hover
         
-        # ボタンの背景
+        # ボタンの背景と枠線 - ホバー時は色を変えて枠線を太く
         button_color = self.HOVER_COLOR if is_hover else self.GREEN
-        pygame.draw.rect(self.screen, button_color, (x, y, button_width, button_height), border_radius=15)
-        
-        # ボタンの枠線 - ホバー時は太く
         border_width = 3 if is_hover else 2
-        pygame.draw.rect(self.screen, self.BLACK, (x, y, button_width, button_height), border_width, border_radius=15)
+        self.draw_panel((x, y, button_width, button_height), button_color, self.BLACK, border_width, 15)
         
         # ボタンのテキスト
-        try:
-            restart_text = self.normal_font.render("新しい犬を選ぶ", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            restart_text = self.default_normal_font.render("Choose a new dog", True, self.BLACK)
+        restart_text = self.render_text(self.tr("新しい犬を選ぶ"))
         
         self.screen.blit(restart_text, (x + button_width // 2 - restart_text.get_width() // 2, 
                                       y + button_height // 2 - restart_text.get_height() // 2))
-        
-        # ボタンの位置を保存
-        self.action_buttons.append((x, y, button_width, button_height, "restart"))
     
     def draw_back_button(self):
         """戻るボタンを描画"""
-        self.action_buttons = []
-        
         button_width = 120
         button_height = 50
         x = 20
         y = 20
         
-        # マウス位置を取得してホバー効果を適用
-        mouse_pos = pygame.mouse.get_pos()
-        is_hover = x <= mouse_pos[0] <= x + button_width and y <= mouse_pos[1] <= y + button_height
+        # ボタンを登録してホバー状態を取得
+        is_hover = self.add_widget("back", (x, y, button_width, button_height), "action", "back").hover
         
-        # ボタンの背景
+        # ボタンの背景と枠線 - ホバー時は色を変えて枠線を太く
         button_color = self.HOVER_COLOR if is_hover else self.ACTION_BUTTON_COLOR
-        pygame.draw.rect(self.screen, button_color, (x, y, button_width, button_height), border_radius=self.BUTTON_RADIUS)
-        
-        # ボタンの枠線 - ホバー時は太く
         border_width = 2 if is_hover else 1
-        pygame.draw.rect(self.screen, self.BLACK, (x, y, button_width, button_height), border_width, border_radius=self.BUTTON_RADIUS)
+        self.draw_panel((x, y, button_width, button_height), button_color, self.BLACK, border_width, self.BUTTON_RADIUS)
         
         # 戻る矢印を描画
         arrow_points = [(x + 20, y + button_height // 2), 
@@ -956,27 +1025,18 @@ class UI:
         pygame.draw.polygon(self.screen, self.BLACK, arrow_points)
         
         # ボタンのテキスト
-        try:
-            back_text = self.normal_font.render("戻る", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            back_text = self.default_normal_font.render("Back", True, self.BLACK)
+        back_text = self.render_text(self.tr("戻る"))
         
         self.screen.blit(back_text, (x + 45, y + button_height // 2 - back_text.get_height() // 2))
-        
-        # ボタンの位置を保存
-        self.action_buttons.append((x, y, button_width, button_height, "back"))
     
     def check_action_selection(self, mouse_pos):
         """アクションの選択をチェック"""
-        for x, y, width, height, action in self.action_buttons:
-            if x <= mouse_pos[0] <= x + width and y <= mouse_pos[1] <= y + height:
-                return action
-        
-        return None
+        return self.get_selection(mouse_pos, "action")
     
-    def draw_graveyard(self, graveyard):
-        """墓地画面を描画"""
+    def draw_graveyard(self, graveyard, positions=None, filters=None):
+        """墓地画面を描画（positions: 表示するお墓の墓地での位置、filters: 絞り込みの条件）"""
+        self.begin_screen("graveyard")
+        
         # 背景を塗りつぶす
         self.screen.fill((240, 240, 245))  # 墓地用の薄暗い背景色
         
@@ -985,11 +1045,7 @@ class UI:
         pygame.draw.line(self.screen, (200, 200, 210), (0, 80), (self.width, 80), 2)
         
         # タイトル
-        try:
-            title = self.title_font.render("犬の墓地", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            title = self.default_title_font.render("Dog Graveyard", True, self.BLACK)
+        title = self.render_text(self.tr("犬の墓地"), "title")
         
         self.screen.blit(title, (self.width // 2 - title.get_width() // 2, 20))
         
@@ -998,11 +1054,7 @@ class UI:
         
         if not graveyard:
             # 墓地が空の場合
-            try:
-                message = self.normal_font.render("まだ墓地はありません", True, self.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                message = self.default_normal_font.render("No graves yet", True, self.BLACK)
+            message = self.render_text(self.tr("まだ墓地はありません"))
             
             # メッセージの背景
             message_width = message.get_width() + 40
@@ -1010,88 +1062,156 @@ class UI:
             message_x = self.width // 2 - message_width // 2
             message_y = self.height // 2 - message_height // 2
             
-            pygame.draw.rect(self.screen, (255, 255, 255), 
-                            (message_x, message_y, message_width, message_height), 
-                            border_radius=10)
-            pygame.draw.rect(self.screen, (200, 200, 210), 
-                            (message_x, message_y, message_width, message_height), 
-                            2, border_radius=10)
+            self.draw_panel((message_x, message_y, message_width, message_height), 
+                            (255, 255, 255), (200, 200, 210), 2, 10)
             
             self.screen.blit(message, (self.width // 2 - message.get_width() // 2, self.height // 2 - message.get_height() // 2))
         else:
-            # 墓石を描画
-            max_per_row = 3
-            for i, grave in enumerate(graveyard):
-                row = i // max_per_row
-                col = i % max_per_row
-                
-                x = self.width // 4 * (col + 1) - 50
-                y = 100 + row * 180  # 間隔を狭める
-                
-                # 墓石の背景
-                grave_bg_width = 120
-                grave_bg_height = 160
-                grave_bg_x = x - 10
-                grave_bg_y = y - 10
-                
-                pygame.draw.rect(self.screen, (230, 230, 235), 
-                                (grave_bg_x, grave_bg_y, grave_bg_width, grave_bg_height), 
-                                border_radius=8)
-                pygame.draw.rect(self.screen, (210, 210, 220), 
-                                (grave_bg_x, grave_bg_y, grave_bg_width, grave_bg_height), 
-                                2, border_radius=8)
-                
-                # 墓石
-                self.screen.blit(self.tombstone_image, (x, y))
-                
-                # 犬の名前
-                try:
-                    name = self.small_font.render(grave["name"], True, self.BLACK)
-                except:
-                    # フォールバック: 英語で表示
-                    name = self.default_small_font.render(grave["name"], True, self.BLACK)
-                
-                self.screen.blit(name, (x + 50 - name.get_width() // 2, y + 130))
-                
-                # 犬種と成長段階を1行にまとめる
-                display_type = "ダックス" if grave["dog_type"] == "ミニチュアダックスフンド" else grave["dog_type"]
-                try:
-                    dog_info = self.small_font.render(f"{display_type} ({grave['growth_stage']})", True, self.BLACK)
-                except:
-                    # フォールバック: 英語で表示
-                    dog_names = {"コーギー": "Corgi", "ミニチュアダックスフンド": "Dachshund", "柴犬": "Shiba"}
-                    growth_names = {"子犬": "Puppy", "成犬": "Adult", "老犬": "Senior"}
-                    dog_info = self.default_small_font.render(
-                        f"{dog_names.get(grave['dog_type'], grave['dog_type'])} ({growth_names.get(grave['growth_stage'], grave['growth_stage'])})", 
-                        True, self.BLACK
-                    )
-                
-                # テキストが長すぎる場合は小さいフォントで表示
-                if dog_info.get_width() > grave_bg_width - 10:
-                    try:
-                        dog_info = self.tiny_font.render(f"{display_type} ({grave['growth_stage']})", True, self.BLACK)
-                    except:
-                        dog_info = self.default_tiny_font.render(
-                            f"{dog_names.get(grave['dog_type'], grave['dog_type'])} ({growth_names.get(grave['growth_stage'], grave['growth_stage'])})", 
-                            True, self.BLACK
-                        )
-                
-                self.screen.blit(dog_info, (x + 50 - dog_info.get_width() // 2, y + 150))
-                
-                # 生存日数
-                try:
-                    lifespan = self.small_font.render(f"{int(grave['lifespan'])}日", True, self.BLACK)
-                except:
-                    # フォールバック: 英語で表示
-                    lifespan = self.default_small_font.render(f"{int(grave['lifespan'])} days", True, self.BLACK)
-                
-                self.screen.blit(lifespan, (x + 50 - lifespan.get_width() // 2, y + 170))
+            if positions is None:
+                positions = range(len(graveyard))
+            if filters is not None:
+                self.draw_graveyard_filters(filters, len(positions))
+            
+            # 表示領域に入っている墓石だけを描画
+            self.graveyard_view.set_item_count(len(positions))
+            
+            previous_clip = self.screen.get_clip()
+            self.screen.set_clip(self.graveyard_view.rect.clip(previous_clip))
+            
+            start, end = self.graveyard_view.get_visible_range()
+            for i in range(start, end):
+                x, y = self.graveyard_view.get_item_position(i)
+                position = positions[i]
+                self.screen.blit(self.get_grave_card(position, graveyard[position]), (x, y))
+            
+            self.screen.set_clip(previous_clip)
+            
+            # スクロールバー
+            self.graveyard_view.draw_scrollbar(self.screen, (220, 220, 230), (180, 180, 190))
+            
+            if not positions:
+                # 条件に合うお墓が無い場合
+                message = self.render_text(self.tr("条件に合うお墓はありません"))
+                self.screen.blit(message, (self.width // 2 - message.get_width() // 2, self.height // 2 - message.get_height() // 2))
         
         # 戻るボタン
         self.draw_back_button()
+        
+        self.end_screen()
+    
+    def draw_graveyard_filters(self, filters, count):
+        """墓地の絞り込みのボタンと件数を描画（ボタンを押すと条件が切り替わる）"""
+        loc = self.localization
+        all_label = self.tr("すべて")
+        period = filters["period"]
+        if period is None:
+            period_label = all_label
+        elif period == 1:
+            period_label = self.tr("今日")
+        else:
+            period_label = loc.format("recent_days", days=period)
+        
+        buttons = [
+            ("filter_breed", 20, 160,
+             loc.format("filter_breed", value=loc.dog_type(filters["dog_type"]) if filters["dog_type"] else all_label)),
+            ("filter_stage", 190, 130,
+             loc.format("filter_stage", value=loc.text(filters["stage"]) if filters["stage"] else all_label)),
+            ("filter_period", 330, 140, loc.format("filter_period", value=period_label)),
+            # 名前はキーボードで入力し、ボタンを押すと解除
+            ("filter_name", 480, 170, loc.format("filter_name", value=filters["name_prefix"] + "_")),
+        ]
+        
+        y = 90
+        button_height = 35
+        for key, x, button_width, label in buttons:
+            is_hover = self.add_widget(key, (x, y, button_width, button_height), "action", key).hover
+            button_color = self.HOVER_COLOR if is_hover else self.ACTION_BUTTON_COLOR
+            self.draw_panel((x, y, button_width, button_height), button_color, self.BLACK, 2 if is_hover else 1, self.BUTTON_RADIUS)
+            
+            text = self.render_text_fit(label, "small", "tiny", button_width - 10)
+            self.screen.blit(text, (x + button_width // 2 - text.get_width() // 2, y + button_height // 2 - text.get_height() // 2))
+        
+        # 条件に合うお墓の数
+        count_text = self.render_text_fit(loc.format("result_count", count=count), "small", "tiny", self.width - 670)
+        self.screen.blit(count_text, (self.width - 10 - count_text.get_width(), y + button_height // 2 - count_text.get_height() // 2))
+    
+    def scroll_graveyard_to_top(self):
+        """墓地を先頭までスクロール（絞り込みの条件を変えた時）"""
+        self.graveyard_view.scroll_to_top()
+    
+    def scroll_graveyard(self, delta):
+        """墓地をスクロール（スクロールした場合はTrueを返す）"""
+        return self.graveyard_view.scroll(delta)
+    
+    def scroll_graveyard_page(self, pages):
+        """墓地を1画面分ずつスクロール"""
+        return self.graveyard_view.scroll(pages * self.graveyard_view.rect.height)
+    
+    def get_grave_card(self, index, grave):
+        """墓石のカードを取得（墓の記録は変わらないので一度だけ描画する）"""
+        cached = self.grave_card_cache.get(index)
+        if cached is not None and cached[0] is grave:
+            self.grave_card_cache.move_to_end(index)
+            return cached[1]
+        
+        card = self.render_grave_card(grave)
+        self.grave_card_cache[index] = (grave, card)
+        # 同じ位置のカードを描き直した場合も最近使ったものとして後ろに移す
+        self.grave_card_cache.move_to_end(index)
+        
+        # 古いカードを破棄
+        while len(self.grave_card_cache) > self.GRAVE_CARD_CACHE_SIZE:
+            self.grave_card_cache.popitem(last=False)
+        
+        return card
+    
+    def render_grave_card(self, grave):
+        """墓石のカードをサーフェスに描画"""
+        card = pygame.Surface((self.graveyard_view.item_width, self.GRAVE_CARD_HEIGHT), pygame.SRCALPHA)
+        
+        # カード内の墓石の位置
+        x = 50
+        y = 10
+        
+        # 墓石の背景
+        grave_bg_width = 120
+        grave_bg_height = 160
+        grave_bg_x = x - 10
+        grave_bg_y = y - 10
+        
+        self.draw_panel((grave_bg_x, grave_bg_y, grave_bg_width, grave_bg_height), 
+                        (230, 230, 235), (210, 210, 220), 2, 8, surface=card)
+        
+        # 墓石
+        card.blit(self.tombstone_image, (x, y))
+        
+        # 犬の名前（カードは一度だけ描画するので文字列はキャッシュしない）
+        loc = self.localization
+        name = self.small_font.render(grave["name"], True, self.BLACK)
+        
+        card.blit(name, (x + 50 - name.get_width() // 2, y + 130))
+        
+        # 犬種と成長段階を1行にまとめる
+        info = loc.format("grave_info", dog_type=loc.dog_type(grave["dog_type"]), stage=loc.text(grave["growth_stage"]))
+        dog_info = self.small_font.render(info, True, self.BLACK)
+        
+        # テキストが長すぎる場合は小さいフォントで表示
+        if dog_info.get_width() > grave_bg_width - 10:
+            dog_info = self.tiny_font.render(info, True, self.BLACK)
+        
+        card.blit(dog_info, (x + 50 - dog_info.get_width() // 2, y + 150))
+        
+        # 生存日数
+        lifespan = self.small_font.render(loc.format("days", days=int(grave["lifespan"])), True, self.BLACK)
+        
+        card.blit(lifespan, (x + 50 - lifespan.get_width() // 2, y + 170))
+        
+        return card
     
-    def draw_trainer_info(self, trainer_data):
-        """トレーナー画面を描画"""
+    def draw_trainer_info(self, trainer_data, graveyard_stats=None):
+        """トレーナー画面を描画（graveyard_statsがあれば犬種ごとの寿命などの統計も表示）"""
+        self.begin_screen("trainer_info")
+        
         # 背景を塗りつぶす
         self.screen.fill(self.BACKGROUND_COLOR)
         
@@ -1100,11 +1220,7 @@ class UI:
         pygame.draw.line(self.screen, (220, 220, 240), (0, 80), (self.width, 80), 2)
         
         # タイトル
-        try:
-            title = self.title_font.render("トレーナー", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            title = self.default_title_font.render("Trainer Info", True, self.BLACK)
+        title = self.render_text(self.tr("トレーナー"), "title")
         
         self.screen.blit(title, (self.width // 2 - title.get_width() // 2, 20))
         
@@ -1117,19 +1233,12 @@ class UI:
         info_bg_x = 20
         info_bg_y = 100
         
-        pygame.draw.rect(self.screen, (250, 250, 255), 
-                        (info_bg_x, info_bg_y, info_bg_width, info_bg_height), 
-                        border_radius=15)
-        pygame.draw.rect(self.screen, (230, 230, 245), 
-                        (info_bg_x, info_bg_y, info_bg_width, info_bg_height), 
-                        2, border_radius=15)
+        self.draw_panel((info_bg_x, info_bg_y, info_bg_width, info_bg_height), 
+                        (250, 250, 255), (230, 230, 245), 2, 15)
         
         # トレーナーレベル
-        try:
-            level_text = self.normal_font.render(f"トレーナーレベル: {trainer_data['trainer_level']}", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            level_text = self.default_normal_font.render(f"Trainer Level: {trainer_data['trainer_level']}", True, self.BLACK)
+        loc = self.localization
+        level_text = self.render_text(loc.format("trainer_level", level=trainer_data["trainer_level"]))
         
         self.screen.blit(level_text, (self.width // 2 - level_text.get_width() // 2, 120))
         
@@ -1145,9 +1254,7 @@ class UI:
         exp_ratio = min(1.0, current_exp / max_exp if max_exp > 0 else 0)
         
         # 経験値バーの背景
-        pygame.draw.rect(self.screen, self.GRAY, 
-                        (exp_bar_x, exp_bar_y, exp_bar_width, exp_bar_height), 
-                        border_radius=5)
+        self.draw_panel((exp_bar_x, exp_bar_y, exp_bar_width, exp_bar_height), self.GRAY, radius=5)
         
         # 経験値バーの進捗
         if exp_ratio > 0:
@@ -1156,16 +1263,10 @@ class UI:
                             border_radius=5)
         
         # 経験値バーの枠
-        pygame.draw.rect(self.screen, self.BLACK, 
-                        (exp_bar_x, exp_bar_y, exp_bar_width, exp_bar_height), 
-                        1, border_radius=5)
+        self.draw_panel((exp_bar_x, exp_bar_y, exp_bar_width, exp_bar_height), None, self.BLACK, 1, 5)
         
         # 経験値テキスト
-        try:
-            exp_text = self.small_font.render(f"経験値: {current_exp} / {max_exp}", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            exp_text = self.default_small_font.render(f"EXP: {current_exp} / {max_exp}", True, self.BLACK)
+        exp_text = self.render_text(loc.format("exp", exp=current_exp, max_exp=max_exp), "small")
         
         self.screen.blit(exp_text, (self.width // 2 - exp_text.get_width() // 2, exp_bar_y + exp_bar_height + 10))
         
@@ -1179,31 +1280,22 @@ class UI:
         dogs_bg_x = self.width // 2 - dogs_bg_width // 2
         dogs_bg_y = 220
         
-        pygame.draw.rect(self.screen, (245, 245, 255), 
-                        (dogs_bg_x, dogs_bg_y, dogs_bg_width, dogs_bg_height), 
-                        border_radius=8)
-        pygame.draw.rect(self.screen, (230, 230, 245), 
-                        (dogs_bg_x, dogs_bg_y, dogs_bg_width, dogs_bg_height), 
-                        1, border_radius=8)
+        self.draw_panel((dogs_bg_x, dogs_bg_y, dogs_bg_width, dogs_bg_height), 
+                        (245, 245, 255), (230, 230, 245), 1, 8)
         
-        try:
-            dogs_text = self.normal_font.render(f"育てた犬の総数: {total_dogs}", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            dogs_text = self.default_normal_font.render(f"Total Dogs Raised: {total_dogs}", True, self.BLACK)
+        dogs_text = self.render_text(loc.format("total_dogs", count=total_dogs))
         
         self.screen.blit(dogs_text, (self.width // 2 - dogs_text.get_width() // 2, dogs_bg_y + 5))
         
         # 犬種ごとの育成数
         y = 280
         for dog_type, count in dogs_raised.items():
-            display_type = "ダックス" if dog_type == "ミニチュアダックスフンド" else dog_type
-            try:
-                dog_text = self.small_font.render(f"{display_type}: {count}匹", True, self.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                dog_names = {"コーギー": "Corgi", "ミニチュアダックスフンド": "Dachshund", "柴犬": "Shiba"}
-                dog_text = self.default_small_font.render(f"{dog_names.get(dog_type, dog_type)}: {count}", True, self.BLACK)
+            buried, mean, std = graveyard_stats.get_lifespan(dog_type) if graveyard_stats is not None else (0, 0.0, 0.0)
+            if buried > 0:
+                dog_text = self.render_text(loc.format("dogs_raised_lifespan", dog_type=loc.dog_type(dog_type),
+                                                       count=count, mean=mean, std=std), "small")
+            else:
+                dog_text = self.render_text(loc.format("dogs_raised", dog_type=loc.dog_type(dog_type), count=count), "small")
             
             self.screen.blit(dog_text, (self.width // 2 - dog_text.get_width() // 2, y))
             y += 30
@@ -1214,29 +1306,28 @@ class UI:
         stats_bg_x = self.width // 2 - stats_bg_width // 2
         stats_bg_y = y + 10
         
-        pygame.draw.rect(self.screen, (245, 245, 255), 
-                        (stats_bg_x, stats_bg_y, stats_bg_width, stats_bg_height), 
-                        border_radius=8)
-        pygame.draw.rect(self.screen, (230, 230, 245), 
-                        (stats_bg_x, stats_bg_y, stats_bg_width, stats_bg_height), 
-                        1, border_radius=8)
+        self.draw_panel((stats_bg_x, stats_bg_y, stats_bg_width, stats_bg_height), 
+                        (245, 245, 255), (230, 230, 245), 1, 8)
         
-        # 死亡回数
-        try:
-            deaths_text = self.normal_font.render(f"死亡回数: {trainer_data['total_deaths']}", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            deaths_text = self.default_normal_font.render(f"Total Deaths: {trainer_data['total_deaths']}", True, self.BLACK)
+        # 死亡回数（統計があれば成長段階ごとの内訳も）
+        if graveyard_stats is not None:
+            deaths_text = self.render_text(loc.format(
+                "total_deaths_stages", count=trainer_data["total_deaths"],
+                puppy=loc.text("子犬"), puppy_count=graveyard_stats.get_stage_count("子犬"),
+                adult=loc.text("成犬"), adult_count=graveyard_stats.get_stage_count("成犬"),
+                senior=loc.text("老犬"), senior_count=graveyard_stats.get_stage_count("老犬")), "small")
+        else:
+            deaths_text = self.render_text(loc.format("total_deaths", count=trainer_data["total_deaths"]))
         
         self.screen.blit(deaths_text, (self.width // 2 - deaths_text.get_width() // 2, stats_bg_y + 10))
         
-        # 最大成長段階
-        try:
-            max_growth_text = self.normal_font.render(f"最大成長段階: {trainer_data['max_growth_stage']}", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            growth_names = {"子犬": "Puppy", "成犬": "Adult", "老犬": "Senior"}
-            max_growth_text = self.default_normal_font.render(f"Max Growth Stage: {growth_names.get(trainer_data['max_growth_stage'], trainer_data['max_growth_stage'])}", True, self.BLACK)
+        # 最大成長段階（統計があれば直近7日に亡くなった数も）
+        max_growth_stage = loc.text(trainer_data["max_growth_stage"])
+        if graveyard_stats is not None:
+            max_growth_text = self.render_text(loc.format("max_growth_recent", stage=max_growth_stage,
+                                                          recent=graveyard_stats.get_recent_deaths()), "small")
+        else:
+            max_growth_text = self.render_text(loc.format("max_growth", stage=max_growth_stage))
         
         self.screen.blit(max_growth_text, (self.width // 2 - max_growth_text.get_width() // 2, stats_bg_y + 45))
         
@@ -1249,18 +1340,10 @@ class UI:
         bonus_title_bg_x = self.width // 2 - bonus_title_bg_width // 2
         bonus_title_bg_y = stats_bg_y + stats_bg_height + 20
         
-        pygame.draw.rect(self.screen, (240, 240, 255), 
-                        (bonus_title_bg_x, bonus_title_bg_y, bonus_title_bg_width, bonus_title_bg_height), 
-                        border_radius=8)
-        pygame.draw.rect(self.screen, (220, 220, 240), 
-                        (bonus_title_bg_x, bonus_title_bg_y, bonus_title_bg_width, bonus_title_bg_height), 
-                        2, border_radius=8)
+        self.draw_panel((bonus_title_bg_x, bonus_title_bg_y, bonus_title_bg_width, bonus_title_bg_height), 
+                        (240, 240, 255), (220, 220, 240), 2, 8)
         
-        try:
-            bonus_text = self.normal_font.render("トレーナーボーナス", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            bonus_text = self.default_normal_font.render("Trainer Bonuses", True, self.BLACK)
+        bonus_text = self.render_text(self.tr("トレーナーボーナス"))
         
         self.screen.blit(bonus_text, (self.width // 2 - bonus_text.get_width() // 2, bonus_title_bg_y + 5))
         
@@ -1269,36 +1352,20 @@ class UI:
         col1_items = bonus_items[:3]  # 最初の3項目
         col2_items = bonus_items[3:]  # 残りの項目
         
-        name_map = {
-            "feed_bonus": ("ご飯効果", "Feed Effect"),
-            "happiness_bonus": ("幸福度効果", "Happiness Effect"),
-            "discipline_bonus": ("しつけ効果", "Discipline Effect"),
-            "cleanliness_bonus": ("清潔度効果", "Cleanliness Effect"),
-            "energy_bonus": ("元気度効果", "Energy Effect")
-        }
-        
         # ボーナス項目の背景
         bonus_bg_width = self.width - 80
         bonus_bg_height = 120
         bonus_bg_x = 40
         bonus_bg_y = bonus_title_bg_y + bonus_title_bg_height + 10
         
-        pygame.draw.rect(self.screen, (250, 250, 255), 
-                        (bonus_bg_x, bonus_bg_y, bonus_bg_width, bonus_bg_height), 
-                        border_radius=8)
-        pygame.draw.rect(self.screen, (230, 230, 245), 
-                        (bonus_bg_x, bonus_bg_y, bonus_bg_width, bonus_bg_height), 
-                        1, border_radius=8)
+        self.draw_panel((bonus_bg_x, bonus_bg_y, bonus_bg_width, bonus_bg_height), 
+                        (250, 250, 255), (230, 230, 245), 1, 8)
         
         # 1列目
         bonus_y = bonus_bg_y + 20
         col1_x = self.width // 4
         for bonus_name, bonus_value in col1_items:
-            jp_name, en_name = name_map.get(bonus_name, (bonus_name, bonus_name))
-            try:
-                bonus_item_text = self.small_font.render(f"{jp_name}: x{bonus_value:.2f}", True, self.BLACK)
-            except:
-                bonus_item_text = self.default_small_font.render(f"{en_name}: x{bonus_value:.2f}", True, self.BLACK)
+            bonus_item_text = self.render_text(loc.format("bonus", name=loc.bonus(bonus_name), value=bonus_value), "small")
             
             self.screen.blit(bonus_item_text, (col1_x - bonus_item_text.get_width() // 2, bonus_y))
             bonus_y += 30
@@ -1307,17 +1374,16 @@ class UI:
         bonus_y = bonus_bg_y + 20
         col2_x = self.width * 3 // 4
         for bonus_name, bonus_value in col2_items:
-            jp_name, en_name = name_map.get(bonus_name, (bonus_name, bonus_name))
-            try:
-                bonus_item_text = self.small_font.render(f"{jp_name}: x{bonus_value:.2f}", True, self.BLACK)
-            except:
-                bonus_item_text = self.default_small_font.render(f"{en_name}: x{bonus_value:.2f}", True, self.BLACK)
+            bonus_item_text = self.render_text(loc.format("bonus", name=loc.bonus(bonus_name), value=bonus_value), "small")
             
             self.screen.blit(bonus_item_text, (col2_x - bonus_item_text.get_width() // 2, bonus_y))
             bonus_y += 30
         
         # 戻るボタン
         self.draw_back_button()
+        
+        self.end_screen()
+    
     def handle_key_event(self, event, dog):
         """キーボードイベント処理: dキーで犬を死亡させる"""
         if event.type == pygame.KEYDOWN:
@@ -1335,19 +1401,11 @@ class UI:
         x = self.width - button_width - 20
         y = 20
         
-        # マウス位置を取得してホバー効果を適用
-        mouse_pos = pygame.mouse.get_pos()
-        
         # ボタンの背景
-        pygame.draw.rect(self.screen, self.LIGHT_BLUE, (x, y, button_width, button_height), border_radius=self.BUTTON_RADIUS)
-        pygame.draw.rect(self.screen, self.BLACK, (x, y, button_width, button_height), 1, border_radius=self.BUTTON_RADIUS)
+        self.draw_panel((x, y, button_width, button_height), self.LIGHT_BLUE, self.BLACK, 1, self.BUTTON_RADIUS)
         
         # 音量ラベル
-        try:
-            volume_text = self.small_font.render("音量:", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            volume_text = self.default_small_font.render("Volume:", True, self.BLACK)
+        volume_text = self.render_text(self.tr("音量:"), "small")
         
         self.screen.blit(volume_text, (x + 10, y + button_height // 2 - volume_text.get_height() // 2))
         
@@ -1360,14 +1418,14 @@ class UI:
        
         
         # バーの背景
-        pygame.draw.rect(self.screen, self.GRAY, (bar_x, bar_y, bar_width, bar_height), border_radius=5)
+        self.draw_panel((bar_x, bar_y, bar_width, bar_height), self.GRAY, radius=5)
         
         # 現在の音量を表示
         volume_width = int(bar_width * self.volume)
         pygame.draw.rect(self.screen, self.GREEN, (bar_x, bar_y, volume_width, bar_height), border_radius=5)
         
         # バーの枠
-        pygame.draw.rect(self.screen, self.BLACK, (bar_x, bar_y, bar_width, bar_height), 1, border_radius=5)
+        self.draw_panel((bar_x, bar_y, bar_width, bar_height), None, self.BLACK, 1, 5)
         
         # 音量調整ボタン（- と +）
         minus_x = bar_x - 20
@@ -1376,24 +1434,23 @@ class UI:
         plus_y = bar_y - 5
         button_size = 20
         
+        # ボタンを登録してホバー状態を取得
+        is_minus_hover = self.add_widget("volume_down", (minus_x, minus_y, button_size, button_size),
+                                         "action", "volume_down").hover
+        is_plus_hover = self.add_widget("volume_up", (plus_x, plus_y, button_size, button_size),
+                                        "action", "volume_up").hover
+        
         # マイナスボタン
-        is_minus_hover = minus_x <= mouse_pos[0] <= minus_x + button_size and minus_y <= mouse_pos[1] <= minus_y + button_size
         minus_color = self.HOVER_COLOR if is_minus_hover else self.YELLOW
-        pygame.draw.rect(self.screen, minus_color, (minus_x, minus_y, button_size, button_size), border_radius=5)
-        pygame.draw.rect(self.screen, self.BLACK, (minus_x, minus_y, button_size, button_size), 1, border_radius=5)
+        self.draw_panel((minus_x, minus_y, button_size, button_size), minus_color, self.BLACK, 1, 5)
         pygame.draw.line(self.screen, self.BLACK, (minus_x + 5, minus_y + button_size // 2), (minus_x + button_size - 5, minus_y + button_size // 2), 2)
         
         # プラスボタン
-        is_plus_hover = plus_x <= mouse_pos[0] <= plus_x + button_size and plus_y <= mouse_pos[1] <= plus_y + button_size
         plus_color = self.HOVER_COLOR if is_plus_hover else self.YELLOW
-        pygame.draw.rect(self.screen, plus_color, (plus_x, plus_y, button_size, button_size), border_radius=5)
-        pygame.draw.rect(self.screen, self.BLACK, (plus_x, plus_y, button_size, button_size), 1, border_radius=5)
+        self.draw_panel((plus_x, plus_y, button_size, button_size), plus_color, self.BLACK, 1, 5)
         pygame.draw.line(self.screen, self.BLACK, (plus_x + 5, plus_y + button_size // 2), (plus_x + button_size - 5, plus_y + button_size // 2), 2)
         pygame.draw.line(self.screen, self.BLACK, (plus_x + button_size // 2, plus_y + 5), (plus_x + button_size // 2, plus_y + button_size - 5), 2)
-        
-        # ボタンの位置を保存
-        self.action_buttons.append((minus_x, minus_y, button_size, button_size, "volume_down"))
-        self.action_buttons.append((plus_x, plus_y, button_size, button_size, "volume_up"))
+
     
     def update_volume(self, change):
         """音量を更新"""
@@ -1401,6 +1458,8 @@ class UI:
         return self.volume
     def draw_dog_management(self, dogs):
         """犬管理画面を描画"""
+        self.begin_screen("dog_management")
+        
         # 背景を塗りつぶす
         self.screen.fill(self.BACKGROUND_COLOR)
         
@@ -1409,11 +1468,7 @@ class UI:
         pygame.draw.line(self.screen, (220, 220, 240), (0, 80), (self.width, 80), 2)
         
         # タイトル
-        try:
-            title = self.title_font.render("飼っている犬", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            title = self.default_title_font.render("Your Dogs", True, self.BLACK)
+        title = self.render_text(self.tr("飼っている犬"), "title")
         
         self.screen.blit(title, (self.width // 2 - title.get_width() // 2, 20))
         
@@ -1422,11 +1477,7 @@ class UI:
         
         if not dogs:
             # 犬がいない場合
-            try:
-                message = self.normal_font.render("まだ犬を飼っていません", True, self.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                message = self.default_normal_font.render("You don't have any dogs yet", True, self.BLACK)
+            message = self.render_text(self.tr("まだ犬を飼っていません"))
             
             # メッセージの背景
             message_width = message.get_width() + 40
@@ -1434,12 +1485,8 @@ class UI:
             message_x = self.width // 2 - message_width // 2
             message_y = self.height // 2 - message_height // 2
             
-            pygame.draw.rect(self.screen, (255, 255, 255), 
-                            (message_x, message_y, message_width, message_height), 
-                            border_radius=10)
-            pygame.draw.rect(self.screen, (200, 200, 210), 
-                            (message_x, message_y, message_width, message_height), 
-                            2, border_radius=10)
+            self.draw_panel((message_x, message_y, message_width, message_height), 
+                            (255, 255, 255), (200, 200, 210), 2, 10)
             
             self.screen.blit(message, (self.width // 2 - message.get_width() // 2, self.height // 2 - message.get_height() // 2))
         else:
@@ -1451,144 +1498,124 @@ class UI:
         
         # メニューボタン
         self.draw_menu_buttons(["墓地を見る", "トレーナー"])
+        
+        self.end_screen()
     
     def draw_dog_list(self, dogs):
-        """犬のリストを描画"""
-        self.dog_buttons = []  # 犬ボタンのリストをクリア
+        """犬のリストを描画（表示領域に入っている犬だけを描画）"""
+        self.dog_list_dogs = dogs
+        self.dog_list_view.set_item_count(len(dogs))
         
-        # マウス位置を取得してホバー効果を適用
-        mouse_pos = pygame.mouse.get_pos()
+        # ホバー中の犬（マウスの移動時に更新）
+        hover_index = self.dog_list_view.get_index_at(self.mouse_pos)
+        self.dog_list_hover_index = hover_index
         
-        # 犬カードのサイズと配置
-        card_width = 220
-        card_height = 180
-        margin_x = 30
-        margin_y = 20
-        cards_per_row = 3
+        # 表示領域の外にはみ出さないようにクリップ
+        previous_clip = self.screen.get_clip()
+        self.screen.set_clip(self.dog_list_view.rect.clip(previous_clip))
         
-        # スクロール可能な領域を作成
-        list_area_y = 100
-        list_area_height = self.height - list_area_y - 80  # 下部のボタン用にスペースを確保
-        
-        for i, dog in enumerate(dogs):
-            row = i // cards_per_row
-            col = i % cards_per_row
-            
-            x = margin_x + col * (card_width + margin_x)
-            y = list_area_y + row * (card_height + margin_y)
-            
-            # ホバー効果の判定
-            is_hover = x <= mouse_pos[0] <= x + card_width and y <= mouse_pos[1] <= y + card_height
-            
-            # カードの背景
-            card_color = self.HOVER_COLOR if is_hover else self.BUTTON_COLOR
-            pygame.draw.rect(self.screen, card_color, (x, y, card_width, card_height), border_radius=10)
-            
-            # カードの枠線 - ホバー時は太く
-            border_width = 3 if is_hover else 2
-            border_color = (100, 200, 100) if dog.is_alive else (200, 100, 100)
-            pygame.draw.rect(self.screen, border_color, (x, y, card_width, card_height), border_width, border_radius=10)
-            
-            # 犬の画像
-            try:
-                if dog.dog_type == "コーギー":
-                    dog_img = pygame.image.load(os.path.join("dog_inubiyori", "assets", "dogs", "corgi.png"))
-                elif dog.dog_type == "ミニチュアダックスフンド":
-                    dog_img = pygame.image.load(os.path.join("dog_inubiyori", "assets", "dogs", "dachsuhund.png"))
-                elif dog.dog_type == "柴犬":
-                    dog_img = pygame.image.load(os.path.join("dog_inubiyori", "assets", "dogs", "shiba.png"))
-                else:
-                    # 未知の犬種の場合はプレースホルダーを使用
-                    dog_img = self.placeholder_images[dog.dog_type]["small"]
-                
-                # 画像サイズを調整
-                dog_img = pygame.transform.scale(dog_img, (80, 80))
-                self.screen.blit(dog_img, (x + 20, y + 20))
-            except Exception as e:
-                # エラーが発生した場合はプレースホルダーを使用
-                self.screen.blit(self.placeholder_images[dog.dog_type]["small"], (x + 20, y + 20))
-            
-            # 犬の名前
-            try:
-                name = self.normal_font.render(dog.name, True, self.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                name = self.default_normal_font.render(dog.name, True, self.BLACK)
-            
-            # 名前が長すぎる場合は小さいフォントで表示
-            if name.get_width() > card_width - 120:
-                try:
-                    name = self.small_font.render(dog.name, True, self.BLACK)
-                except:
-                    name = self.default_small_font.render(dog.name, True, self.BLACK)
-            
-            self.screen.blit(name, (x + 120, y + 30))
-            
-            # 犬種
-            display_type = "ダックス" if dog.dog_type == "ミニチュアダックスフンド" else dog.dog_type
-            try:
-                dog_type = self.small_font.render(display_type, True, self.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                dog_names = {"コーギー": "Corgi", "ミニチュアダックスフンド": "Dachshund", "柴犬": "Shiba"}
-                dog_type = self.default_small_font.render(dog_names.get(dog.dog_type, dog.dog_type), True, self.BLACK)
-            
-            self.screen.blit(dog_type, (x + 120, y + 60))
-            
-            # 成長段階
-            try:
-                growth = self.small_font.render(f"成長: {dog.growth_stage}", True, self.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                growth_names = {"子犬": "Puppy", "成犬": "Adult", "老犬": "Senior"}
-                growth = self.default_small_font.render(f"Growth: {growth_names.get(dog.growth_stage, dog.growth_stage)}", True, self.BLACK)
+        start, end = self.dog_list_view.get_visible_range()
+        mini_bars = []
+        mini_bars_x = (self.dog_list_view.item_width - self.status_panel.get_mini_bars_width()) // 2
+        for i in range(start, end):
+            x, y = self.dog_list_view.get_item_position(i)
+            card = self.get_dog_card(dogs[i], i == hover_index)
+            self.screen.blit(card, (x, y))
             
-            self.screen.blit(growth, (x + 120, y + 90))
-            
-            # 生存日数
-            try:
-                days = self.small_font.render(f"{int(dog.lifespan_days)}日", True, self.BLACK)
-            except:
-                # フォールバック: 英語で表示
-                days = self.default_small_font.render(f"{int(dog.lifespan_days)} days", True, self.BLACK)
-            
-            self.screen.blit(days, (x + 120, y + 120))
-            
-            # 状態表示
-            status_color = (100, 200, 100) if dog.is_alive else (200, 100, 100)
-            status_text = dog.get_mood() if dog.is_alive else "死亡"
-            try:
-                status = self.small_font.render(status_text, True, status_color)
-            except:
-                # フォールバック: 英語で表示
-                status_names = {
-                    "とても幸せ": "Very Happy", 
-                    "幸せ": "Happy", 
-                    "普通": "Normal", 
-                    "不満": "Unsatisfied", 
-                    "不機嫌": "Grumpy", 
-                    "病気": "Sick",
-                    "死亡": "Dead"
-                }
-                status = self.default_small_font.render(status_names.get(status_text, status_text), True, status_color)
-            
-            # 状態の背景
-            status_bg_width = status.get_width() + 10
-            status_bg_height = status.get_height() + 6
-            status_bg_x = x + card_width - status_bg_width - 10
-            status_bg_y = y + 10
-            
-            pygame.draw.rect(self.screen, (255, 255, 255, 180), 
-                            (status_bg_x, status_bg_y, status_bg_width, status_bg_height), 
-                            border_radius=5)
-            pygame.draw.rect(self.screen, status_color, 
-                            (status_bg_x, status_bg_y, status_bg_width, status_bg_height), 
-                            1, border_radius=5)
-            
-            self.screen.blit(status, (status_bg_x + 5, status_bg_y + 3))
-            
-            # ボタンの位置を保存
-            self.dog_buttons.append((x, y, card_width, card_height, dog.id))
+            # ステータスはカードに含めず、小さいバーで上から重ねる（値が変わってもカードを描き直さない）
+            if dogs[i].is_alive:
+                mini_bars.append((dogs[i], (x + mini_bars_x, y + self.dog_list_view.item_height - 20)))
+        
+        self.status_panel.draw_mini_bars(self.screen, mini_bars, self.STATUS_COLORS)
+        
+        self.screen.set_clip(previous_clip)
+        
+        # スクロールバー
+        self.dog_list_view.draw_scrollbar(self.screen, self.GRAY, self.BROWN)
+    
+    def scroll_dog_list(self, delta):
+        """犬のリストをスクロール（スクロールした場合はTrueを返す）"""
+        return self.dog_list_view.scroll(delta)
+    
+    def get_dog_card(self, dog, is_hover):
+        """犬のカードを取得（表示内容が変わらない限りキャッシュを使う）"""
+        status_text = dog.get_mood() if dog.is_alive else "死亡"
+        key = (dog.id, dog.name, dog.dog_type, dog.growth_stage, int(dog.lifespan_days),
+               status_text, dog.is_alive, is_hover)
+        
+        cache_key = (dog.id, is_hover)
+        cached = self.dog_card_cache.get(cache_key)
+        if cached is not None and cached[0] == key:
+            self.dog_card_cache.move_to_end(cache_key)
+            return cached[1]
+        
+        card = self.render_dog_card(dog, is_hover, status_text)
+        self.dog_card_cache[cache_key] = (key, card)
+        self.dog_card_cache.move_to_end(cache_key)
+        
+        # 古いカードを破棄
+        while len(self.dog_card_cache) > self.DOG_CARD_CACHE_SIZE:
+            self.dog_card_cache.popitem(last=False)
+        
+        return card
+    
+    def render_dog_card(self, dog, is_hover, status_text):
+        """犬のカードをサーフェスに描画"""
+        card_width = self.dog_list_view.item_width
+        card_height = self.dog_list_view.item_height
+        card = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
+        
+        # カードの背景と枠線 - ホバー時は色を変えて枠線を太く
+        card_color = self.HOVER_COLOR if is_hover else self.BUTTON_COLOR
+        border_width = 3 if is_hover else 2
+        border_color = (100, 200, 100) if dog.is_alive else (200, 100, 100)
+        self.draw_panel((0, 0, card_width, card_height), card_color, border_color, border_width, 10, surface=card)
+        
+        # 犬の画像
+        dog_img = self.get_dog_image(dog.dog_type, (80, 80))
+        card.blit(dog_img, (20, 20))
+        
+        # 犬の名前（カードはキャッシュされるので文字列はキャッシュしない）
+        loc = self.localization
+        name = self.normal_font.render(dog.name, True, self.BLACK)
+        
+        # 名前が長すぎる場合は小さいフォントで表示
+        if name.get_width() > card_width - 120:
+            name = self.small_font.render(dog.name, True, self.BLACK)
+        
+        card.blit(name, (120, 30))
+        
+        # 犬種
+        dog_type = self.render_text(loc.dog_type(dog.dog_type), "small")
+        
+        card.blit(dog_type, (120, 60))
+        
+        # 成長段階
+        growth = self.render_text(loc.format("growth", stage=loc.text(dog.growth_stage)), "small")
+        
+        card.blit(growth, (120, 90))
+        
+        # 生存日数
+        days = self.render_text(loc.format("days", days=int(dog.lifespan_days)), "small")
+        
+        card.blit(days, (120, 120))
+        
+        # 状態表示
+        status_color = (100, 200, 100) if dog.is_alive else (200, 100, 100)
+        status = self.render_text(loc.text(status_text), "small", status_color)
+        
+        # 状態の背景
+        status_bg_width = status.get_width() + 10
+        status_bg_height = status.get_height() + 6
+        status_bg_x = card_width - status_bg_width - 10
+        status_bg_y = 10
+        
+        self.draw_panel((status_bg_x, status_bg_y, status_bg_width, status_bg_height), 
+                        (255, 255, 255), status_color, 1, 5, surface=card)
+        
+        card.blit(status, (status_bg_x + 5, status_bg_y + 3))
+        
+        return card
     
     def draw_add_dog_button(self):
         """新しい犬を追加するボタンを描画"""
@@ -1597,35 +1624,25 @@ class UI:
         x = self.width // 2 - button_width // 2
         y = self.height - button_height - 20
         
-        # マウス位置を取得してホバー効果を適用
-        mouse_pos = pygame.mouse.get_pos()
-        is_hover = x <= mouse_pos[0] <= x + button_width and y <= mouse_pos[1] <= y + button_height
+        # ボタンを登録してホバー状態を取得
+        is_hover = self.add_widget("add_dog", (x, y, button_width, button_height), "action", "add_dog").hover
         
-        # ボタンの背景
+        # ボタンの背景と枠線 - ホバー時は色を変えて枠線を太く
         button_color = self.HOVER_COLOR if is_hover else self.GREEN
-        pygame.draw.rect(self.screen, button_color, (x, y, button_width, button_height), border_radius=10)
-        
-        # ボタンの枠線 - ホバー時は太く
         border_width = 3 if is_hover else 2
-        pygame.draw.rect(self.screen, self.BLACK, (x, y, button_width, button_height), border_width, border_radius=10)
+        self.draw_panel((x, y, button_width, button_height), button_color, self.BLACK, border_width, 10)
         
         # ボタンのテキスト
-        try:
-            button_text = self.normal_font.render("新しい犬を追加", True, self.BLACK)
-        except:
-            # フォールバック: 英語で表示
-            button_text = self.default_normal_font.render("Add New Dog", True, self.BLACK)
+        button_text = self.render_text(self.tr("新しい犬を追加"))
         
         self.screen.blit(button_text, (x + button_width // 2 - button_text.get_width() // 2, 
                                       y + button_height // 2 - button_text.get_height() // 2))
-        
-        # ボタンの位置を保存
-        self.action_buttons.append((x, y, button_width, button_height, "add_dog"))
     
     def check_dog_selection_from_list(self, mouse_pos):
         """犬リストからの選択をチェック"""
-        for x, y, width, height, dog_id in self.dog_buttons:
-            if x <= mouse_pos[0] <= x + width and y <= mouse_pos[1] <= y + height:
-                return dog_id
+        # 位置から項目の番号を直接計算する
+        index = self.dog_list_view.get_index_at(mouse_pos)
+        if index is None or index >= len(self.dog_list_dogs):
+            return None
         
-        return None
+        return self.dog_list_dogs[index].id
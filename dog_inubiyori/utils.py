@@ -1,67 +1,262 @@
 import platform
 import os
+import re
 import json
+import shutil
+import logging
 import pygame
 import time
 from datetime import datetime
+from localization import Localization
+from graveyard_stats import GraveyardStats
+from graveyard_index import GraveyardIndex, to_epoch
+
+logger = logging.getLogger(__name__)
 
 class Utils:
+    # OSごとの日本語フォントの候補
+    FONT_PATHS = {
+        "Windows": [
+            "C:\\Windows\\Fonts\\msgothic.ttc",
+            "C:\\Windows\\Fonts\\meiryo.ttc",
+            "C:\\Windows\\Fonts\\YuGothM.ttc"
+        ],
+        "Darwin": [
+            "/System/Library/Fonts/Hiragino Sans GB.ttc",
+            "/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc",
+            "/System/Library/Fonts/AppleGothic.ttf",
+            "/Library/Fonts/Osaka.ttf"
+        ]
+    }
+    
+    # Linuxでフォントを探すディレクトリ
+    LINUX_FONT_DIRS = [
+        "/usr/share/fonts",
+        "/usr/local/share/fonts",
+        "~/.local/share/fonts",
+        "~/.fonts"
+    ]
+    
+    # ファイル名にこれらを含むフォントから先に調べる（小文字で比較）
+    CJK_FONT_HINTS = ("notosanscjk", "notoserifcjk", "notosansjp", "sourcehansans", "ipag", "ipaexg",
+                      "takao", "vl-gothic", "vlgothic", "umefont", "ume-", "droidsansfallback", "wqy")
+    FONT_EXTENSIONS = (".ttf", ".ttc", ".otf")
+    
+    # ゲームで使う文字が表示できるかを調べるための文字
+    FONT_COVERAGE_SAMPLE = "犬びよりご飯散歩墓地子成老トレーナー"
+    
+    # 中身を確認するフォントの最大数（フォントが大量にある環境で時間がかかりすぎないように）
+    MAX_FONT_CHECKS = 200
+    
+    FONT_CACHE_VERSION = 1
+    
+    # 見つけた日本語フォントのパス（Noneは見つからなかった場合、Falseは未探索）
+    japanese_font_path = False
+    # サイズ -> フォント
+    japanese_fonts = {}
+    
     @staticmethod
-    def get_japanese_font(size):
-        """OSに応じた日本語フォントを取得する"""
+    def get_cache_dir():
+        """キャッシュ用のディレクトリを取得（XDG_CACHE_HOME か ~/.cache の下）"""
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.path.join(base, "inubiyori")
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+    
+    @staticmethod
+    def get_font_dirs():
+        """フォントを探すディレクトリを取得"""
         system = platform.system()
+        if system in Utils.FONT_PATHS:
+            return sorted({os.path.dirname(path) for path in Utils.FONT_PATHS[system]})
+        return [os.path.expanduser(path) for path in Utils.LINUX_FONT_DIRS]
+    
+    @staticmethod
+    def get_mtime(path):
+        """更新時刻を取得（存在しない場合はNone）"""
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+    
+    @staticmethod
+    def get_font_coverage(path):
+        """フォントでゲームの文字がどれだけ表示できるか（0.0 ~ 1.0）"""
+        try:
+            font = pygame.font.Font(path, 16)
+        except Exception:
+            return 0.0
         
-        if system == "Windows":
-            # Windowsの場合
-            try:
-                # まずはシステムフォントパスを試す
-                font_paths = [
-                    "C:\\Windows\\Fonts\\msgothic.ttc",
-                    "C:\\Windows\\Fonts\\meiryo.ttc",
-                    "C:\\Windows\\Fonts\\YuGothM.ttc"
-                ]
-                
-                for path in font_paths:
-                    if os.path.exists(path):
-                        return pygame.font.Font(path, size)
-            except:
-                pass
-            
-            # フォールバック: SysFontを試す
+        sample = set(Utils.FONT_COVERAGE_SAMPLE)
+        covered = sum(1 for char in sample if Localization.can_render_japanese(font, char))
+        return covered / len(sample)
+    
+    @staticmethod
+    def scan_font_files(font_dirs):
+        """フォントディレクトリを探索して (フォントファイル, 探索したディレクトリの更新時刻) を返す"""
+        font_files = []
+        dir_mtimes = {}
+        for font_dir in font_dirs:
+            dir_mtimes[font_dir] = Utils.get_mtime(font_dir)
+            for root, dirs, files in os.walk(font_dir):
+                if root != font_dir:
+                    dir_mtimes[root] = Utils.get_mtime(root)
+                for filename in files:
+                    if filename.lower().endswith(Utils.FONT_EXTENSIONS):
+                        font_files.append(os.path.join(root, filename))
+        return font_files, dir_mtimes
+    
+    @staticmethod
+    def discover_japanese_font():
+        """日本語を表示できるフォントを探す（(パス, 表示できる割合, ディレクトリの更新時刻) を返す）"""
+        system = platform.system()
+        if system in Utils.FONT_PATHS:
+            # Windows/macOSは決まった場所のフォントを使う
+            candidates = [path for path in Utils.FONT_PATHS[system] if os.path.exists(path)]
+            dir_mtimes = {font_dir: Utils.get_mtime(font_dir) for font_dir in Utils.get_font_dirs()}
+        else:
+            # Linuxはフォントディレクトリを探索し、名前から日本語フォントらしいものを先に調べる
+            candidates, dir_mtimes = Utils.scan_font_files(Utils.get_font_dirs())
+            candidates.sort(key=lambda path: (not Utils.is_cjk_font_name(path), path))
+        
+        best_path, best_coverage = None, 0.0
+        for path in candidates[:Utils.MAX_FONT_CHECKS]:
+            coverage = Utils.get_font_coverage(path)
+            if coverage > best_coverage:
+                best_path, best_coverage = path, coverage
+            if coverage >= 1.0:
+                break
+        
+        # 一部の文字しか表示できないフォントは使わない
+        if best_coverage < 1.0:
+            best_path = None
+        return best_path, best_coverage, dir_mtimes
+    
+    @staticmethod
+    def is_cjk_font_name(path):
+        """ファイル名が日本語フォントらしいかどうか"""
+        name = os.path.basename(path).lower().replace(" ", "")
+        return any(hint in name for hint in Utils.CJK_FONT_HINTS)
+    
+    @staticmethod
+    def find_japanese_font():
+        """日本語フォントのパスを取得（探索結果はキャッシュファイルに保存して次回の起動で使う）"""
+        if Utils.japanese_font_path is not False:
+            return Utils.japanese_font_path
+        
+        try:
+            cache_file = os.path.join(Utils.get_cache_dir(), "fonts.json")
+        except OSError:
+            cache_file = None
+        
+        # キャッシュが有効ならフォントディレクトリを探索しない
+        cache = Utils.load_font_cache(cache_file)
+        if cache is not None:
+            Utils.japanese_font_path = cache["path"]
+            return cache["path"]
+        
+        path, coverage, dir_mtimes = Utils.discover_japanese_font()
+        Utils.japanese_font_path = path
+        
+        if cache_file is not None:
+            data = {
+                "version": Utils.FONT_CACHE_VERSION,
+                "system": platform.system(),
+                "sample": Utils.FONT_COVERAGE_SAMPLE,
+                "path": path,
+                "coverage": coverage,
+                "dir_mtimes": dir_mtimes
+            }
             try:
-                return pygame.font.SysFont("Arial", size)
-            except:
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+            except OSError:
                 pass
-                
-        elif system == "Darwin":  # macOS
-            # macOSの場合
+        return path
+    
+    @staticmethod
+    def load_font_cache(cache_file):
+        """フォントのキャッシュを読み込む（フォントが追加・削除された場合はNone）"""
+        if cache_file is None or not os.path.exists(cache_file):
+            return None
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if (cache.get("version") != Utils.FONT_CACHE_VERSION or cache.get("system") != platform.system()
+                or cache.get("sample") != Utils.FONT_COVERAGE_SAMPLE):
+            return None
+        if cache.get("path") is not None and not os.path.exists(cache["path"]):
+            return None
+        
+        # フォントのインストールや削除はディレクトリの更新時刻で分かる
+        dir_mtimes = cache.get("dir_mtimes", {})
+        if not set(Utils.get_font_dirs()) <= set(dir_mtimes):
+            return None
+        for font_dir, mtime in dir_mtimes.items():
+            if Utils.get_mtime(font_dir) != mtime:
+                return None
+        return cache
+    
+    @staticmethod
+    def get_japanese_font(size):
+        """OSに応じた日本語フォントを取得する（サイズごとに一度だけ作成する）"""
+        font = Utils.japanese_fonts.get(size)
+        if font is not None:
+            return font
+        
+        path = Utils.find_japanese_font()
+        font = None
+        if path is not None:
             try:
-                # システムフォントパスを試す
-                font_paths = [
-                    "/System/Library/Fonts/Hiragino Sans GB.ttc",
-                    "/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc",
-                    "/System/Library/Fonts/AppleGothic.ttf",
-                    "/Library/Fonts/Osaka.ttf"
-                ]
-                
-                for path in font_paths:
-                    if os.path.exists(path):
-                        return pygame.font.Font(path, size)
-            except:
+                font = pygame.font.Font(path, size)
+            except Exception:
                 pass
-            
+        
+        if font is None and platform.system() in Utils.FONT_PATHS:
             # フォールバック: SysFontを試す
             try:
-                return pygame.font.SysFont("Arial", size)
-            except:
+                font = pygame.font.SysFont("Arial", size)
+            except Exception:
                 pass
         
-        # 最終フォールバック: デフォルトフォント
-        return pygame.font.Font(pygame.font.get_default_font(), size)
+        if font is None:
+            # 最終フォールバック: デフォルトフォント
+            font = pygame.font.Font(pygame.font.get_default_font(), size)
+        
+        Utils.japanese_fonts[size] = font
+        return font
 
 class SaveManager:
-    def __init__(self):
-        self.save_dir = "saves"
+    # セーブデータの場所（起動したディレクトリによらず、このファイルの隣の saves）
+    # 環境変数 INUBIYORI_SAVE_DIR で別の場所を指定できる（ベンチマークなど）
+    SAVES_DIR = os.path.abspath(os.environ.get("INUBIYORI_SAVE_DIR")
+                                or os.path.join(os.path.dirname(os.path.abspath(__file__)), "saves"))
+    
+    # 以前のバージョンのセーブデータの場所（起動したディレクトリの saves、リポジトリの直下から起動した場合が多い）
+    LEGACY_SAVES_DIRS = [os.path.abspath("saves"),
+                         os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "saves")]
+    
+    # 以前のセーブデータを移したことを記録するファイル（2回目以降は移さない）
+    LEGACY_MIGRATED_FILE = ".legacy_migrated"
+    
+    # トレーナーごとのセーブデータの場所（saves/trainers/<トレーナーID>/）
+    TRAINERS_DIR = os.path.join(SAVES_DIR, "trainers")
+    
+    # トレーナーIDに使える文字（ディレクトリ名になるので制限する）
+    TRAINER_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+    
+    # 墓地のデータを少しずつ読む時の1回の読み込みの大きさ（文字数）
+    READ_CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, save_dir=None, load=True):
+        """セーブデータの管理の初期化（save_dirを省略した場合は SAVES_DIR）
+        
+        load=False の場合はデータを読み込まない（エクスポートなどでファイルを1件ずつ扱う場合）
+        """
+        self.save_dir = os.path.abspath(save_dir) if save_dir is not None else self.SAVES_DIR
         self.ensure_save_directory()
         
         # トレーナーデータのファイルパス
@@ -70,28 +265,105 @@ class SaveManager:
         # 墓地データのファイルパス
         self.graveyard_file = os.path.join(self.save_dir, "graveyard.json")
         
+        # 墓地の統計情報のファイルパス（墓地と一緒に更新する）
+        self.graveyard_stats_file = os.path.join(self.save_dir, "graveyard_stats.json")
+        
+        # 墓地の検索用のインデックス（最初に検索する時か、事前読み込みで作る）
+        self.graveyard_index = None
+        # インデックスをワーカースレッドで作っている間はTrue（同じ作業を何度も頼まないように）
+        self.graveyard_index_building = False
+        
+        # ディスクへの書き込みと削除を任せる関数（Noneの場合はその場で行う）
+        # asyncioのランナーが1スレッドのワーカーで順番に行うために設定する
+        self.disk_writer = None
+        
         # 犬のデータディレクトリ
         self.dogs_dir = os.path.join(self.save_dir, "dogs")
         self.ensure_dogs_directory()
         
+        if not load:
+            self.trainer_data = None
+            self.graveyard = None
+            self.graveyard_stats = None
+            self.current_dogs = None
+            return
+        
         # トレーナーデータの初期化
         self.trainer_data = self.load_trainer_data()
         
         # 墓地データの初期化
         self.graveyard = self.load_graveyard()
+        self.graveyard_stats = self.load_graveyard_stats()
         
         # 現在飼っている犬のリスト
         self.current_dogs = self.load_all_dogs()
     
+    @staticmethod
+    def migrate_legacy_saves():
+        """以前の場所（SAVES_DIR 以外の saves）のセーブデータを SAVES_DIR に一度だけコピーする
+
+        SAVES_DIR に既に犬がいる場合は上書きせずに警告だけ出す（以前のデータは消さずに残す）
+        """
+        marker = os.path.join(SaveManager.SAVES_DIR, SaveManager.LEGACY_MIGRATED_FILE)
+        if os.path.exists(marker):
+            return
+        
+        dogs_dir = os.path.join(SaveManager.SAVES_DIR, "dogs")
+        for legacy_dir in dict.fromkeys(SaveManager.LEGACY_SAVES_DIRS):
+            legacy_dogs_dir = os.path.join(legacy_dir, "dogs")
+            if legacy_dir == SaveManager.SAVES_DIR or not os.path.isdir(legacy_dogs_dir):
+                continue
+            legacy_dogs = [name for name in os.listdir(legacy_dogs_dir) if name.endswith(".json")]
+            if not legacy_dogs:
+                continue
+            
+            if os.path.isdir(dogs_dir) and any(name.endswith(".json") for name in os.listdir(dogs_dir)):
+                logger.warning("Legacy save data in %s was not migrated because %s already has dogs",
+                               legacy_dir, SaveManager.SAVES_DIR)
+                return
+            
+            os.makedirs(dogs_dir, exist_ok=True)
+            for name in ("trainer_data.json", "graveyard.json", "graveyard_stats.json"):
+                legacy_file = os.path.join(legacy_dir, name)
+                target_file = os.path.join(SaveManager.SAVES_DIR, name)
+                if os.path.exists(legacy_file):
+                    shutil.copy2(legacy_file, target_file)
+                elif name == "graveyard_stats.json" and os.path.exists(target_file):
+                    # 墓地に合わない統計が残らないように消して、読み込み時に作り直す
+                    os.remove(target_file)
+            for name in legacy_dogs:
+                shutil.copy2(os.path.join(legacy_dogs_dir, name), os.path.join(dogs_dir, name))
+            
+            with open(marker, 'w', encoding='utf-8') as f:
+                f.write(legacy_dir + "\n")
+            logger.info("Migrated legacy save data from %s to %s (%d dogs)",
+                           legacy_dir, SaveManager.SAVES_DIR, len(legacy_dogs))
+            return
+    
+    @staticmethod
+    def is_valid_trainer_id(trainer_id):
+        """トレーナーIDとして使えるかどうか"""
+        return isinstance(trainer_id, str) and SaveManager.TRAINER_ID_PATTERN.fullmatch(trainer_id) is not None
+    
+    @staticmethod
+    def get_trainer_save_dir(trainer_id, root_dir=None):
+        """トレーナーのセーブデータのディレクトリ（絶対パス）"""
+        if not SaveManager.is_valid_trainer_id(trainer_id):
+            raise ValueError(f"invalid trainer id: {trainer_id!r}")
+        return os.path.join(os.path.abspath(root_dir or SaveManager.TRAINERS_DIR), trainer_id)
+    
+    @staticmethod
+    def has_save_data(save_dir):
+        """セーブデータのディレクトリがあるかどうか"""
+        return os.path.isdir(save_dir)
+    
     def ensure_save_directory(self):
         """セーブディレクトリが存在することを確認"""
-        if not os.path.exists(self.save_dir):
-            os.makedirs(self.save_dir)
+        os.makedirs(self.save_dir, exist_ok=True)
     
     def ensure_dogs_directory(self):
         """犬のデータディレクトリが存在することを確認"""
-        if not os.path.exists(self.dogs_dir):
-            os.makedirs(self.dogs_dir)
+        os.makedirs(self.dogs_dir, exist_ok=True)
     
     def load_trainer_data(self):
         """トレーナーデータをロード"""
@@ -102,7 +374,11 @@ class SaveManager:
             except:
                 pass
         
-        # デフォルトのトレーナーデータ
+        return SaveManager.default_trainer_data()
+    
+    @staticmethod
+    def default_trainer_data():
+        """デフォルトのトレーナーデータ"""
         return {
             "trainer_level": 1,
             "trainer_exp": 0,
@@ -134,25 +410,118 @@ class SaveManager:
         # デフォルトの墓地データ
         return []
     
+    def load_graveyard_stats(self):
+        """墓地の統計情報をロード（無い場合や古い場合は墓地から作り直す）"""
+        stats = GraveyardStats.load(self.graveyard_stats_file, len(self.graveyard))
+        if stats is None:
+            stats = GraveyardStats.rebuild(self.graveyard)
+            try:
+                stats.save(self.graveyard_stats_file)
+            except OSError:
+                pass
+        return stats
+    
+    def get_graveyard_index(self):
+        """墓地の検索用のインデックスを取得（まだ無ければ作る）"""
+        if self.graveyard_index is None:
+            self.graveyard_index = GraveyardIndex(self.graveyard)
+        return self.graveyard_index
+    
+    def prefetch_graveyard_index(self):
+        """墓地のインデックスを作る作業の (compute, apply) の一覧（ワーカースレッドで作ってメインスレッドで反映）"""
+        if self.graveyard_index is not None or self.graveyard_index_building:
+            return []
+        self.graveyard_index_building = True
+        
+        def build():
+            try:
+                # 墓地のコピーもメインスレッドを止めないようにワーカースレッドで作る
+                return GraveyardIndex(list(self.graveyard))
+            except BaseException:
+                self.graveyard_index_building = False
+                raise
+        
+        def apply(index):
+            self.graveyard_index_building = False
+            if self.graveyard_index is None:
+                # 作っている間に増えたお墓を加える
+                for grave in self.graveyard[len(index):]:
+                    index.add(grave)
+                self.graveyard_index = index
+        
+        return [(build, apply)]
+    
+    def query_graveyard(self, dog_type=None, stage=None, start=None, end=None, name_prefix=None):
+        """条件に合うお墓の墓地での位置を墓地の順で取得（Noneの条件は使わない）
+        
+        start, end: 亡くなった日時の範囲（datetimeか "YYYY-MM-DD HH:MM:SS"、start以上end未満）
+        """
+        return self.get_graveyard_index().query(
+            dog_type, stage,
+            to_epoch(start) if start is not None else None,
+            to_epoch(end) if end is not None else None,
+            name_prefix)
+    
     def load_all_dogs(self):
         """すべての犬のデータをロード"""
-        dogs_data = []
-        
-        if os.path.exists(self.dogs_dir):
-            for filename in os.listdir(self.dogs_dir):
-                if filename.endswith('.json'):
-                    dog_file = os.path.join(self.dogs_dir, filename)
-                    try:
-                        with open(dog_file, 'r', encoding='utf-8') as f:
-                            dog_data = json.load(f)
-                            # 犬のIDをファイル名から取得
-                            dog_id = filename.replace('.json', '')
-                            dog_data['id'] = dog_id
-                            dogs_data.append(dog_data)
-                    except:
-                        pass
-        
-        return dogs_data
+        return list(self.iter_dogs())
+    
+    def iter_dogs(self):
+        """犬のデータを1匹ずつ読み込む（すべてをメモリに置かない）"""
+        if not os.path.exists(self.dogs_dir):
+            return
+        
+        with os.scandir(self.dogs_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+                try:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        dog_data = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                # 犬のIDをファイル名から取得
+                dog_data['id'] = entry.name[:-len('.json')]
+                yield dog_data
+    
+    def iter_graveyard(self):
+        """墓地のデータを1件ずつ読み込む（ファイル全体を読み込まない）"""
+        if not os.path.exists(self.graveyard_file):
+            return
+        
+        decoder = json.JSONDecoder()
+        with open(self.graveyard_file, 'r', encoding='utf-8') as f:
+            buffer = f.read(self.READ_CHUNK_SIZE).lstrip()
+            if not buffer.startswith('['):
+                raise ValueError(f"graveyard is not a JSON array: {self.graveyard_file}")
+            position = 1
+            end_of_file = False
+            
+            while True:
+                # 要素の間の空白とカンマを読み飛ばす
+                while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                    position += 1
+                if position < len(buffer) and buffer[position] == ']':
+                    return
+                
+                try:
+                    grave, position = decoder.raw_decode(buffer, position)
+                except ValueError:
+                    # 要素の途中で読み込みが終わっている場合は続きを読む
+                    if end_of_file:
+                        raise
+                    chunk = f.read(self.READ_CHUNK_SIZE)
+                    end_of_file = not chunk
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    continue
+                yield grave
+    
+    def write_dog_file(self, dog_id, save_data, dogs_dir=None):
+        """犬のデータをファイルに書き込む（IDはファイル名になるので save_data には含めない）"""
+        dog_file = os.path.join(dogs_dir or self.dogs_dir, f"{dog_id}.json")
+        with open(dog_file, 'w', encoding='utf-8') as f:
+            json.dump(save_data, f, ensure_ascii=False, indent=2)
     
     def load_dog(self, dog_id):
         """特定の犬のデータをロード"""
@@ -168,21 +537,40 @@ class SaveManager:
         
         return None
     
+    def write_later(self, write, *args):
+        """書き込みや削除を disk_writer に任せる（無ければその場で行う）
+        
+        別スレッドで行う場合があるので、args には後から変更されないデータを渡す
+        """
+        if self.disk_writer is None:
+            write(*args)
+        else:
+            self.disk_writer(write, *args)
+    
+    def write_text_file(self, path, text):
+        """文字列をファイルに書き込む"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    
     def save_trainer_data(self):
         """トレーナーデータを保存"""
-        with open(self.trainer_file, 'w', encoding='utf-8') as f:
-            json.dump(self.trainer_data, f, ensure_ascii=False, indent=2)
+        self.write_later(self.write_text_file, self.trainer_file,
+                         json.dumps(self.trainer_data, ensure_ascii=False, indent=2))
     
     def save_graveyard(self):
-        """墓地データを保存"""
+        """墓地データを保存（書き込み中に墓地が増えてもよいように、その時点のリストを書き込む）"""
+        self.write_later(self.write_graveyard_file, list(self.graveyard))
+    
+    def write_graveyard_file(self, graveyard):
+        """墓地データをファイルに書き込む"""
         with open(self.graveyard_file, 'w', encoding='utf-8') as f:
-            json.dump(self.graveyard, f, ensure_ascii=False, indent=2)
+            json.dump(graveyard, f, ensure_ascii=False, indent=2)
     
     def save_dog(self, dog_data):
         """犬のデータを保存"""
         # 犬のIDがない場合は新しく生成
         if 'id' not in dog_data:
-            dog_id = f"dog_{int(time.time())}"
+            dog_id = self.new_dog_id()
             dog_data['id'] = dog_id
         else:
             dog_id = dog_data['id']
@@ -192,15 +580,24 @@ class SaveManager:
         if 'id' in save_data:
             del save_data['id']
         
-        dog_file = os.path.join(self.dogs_dir, f"{dog_id}.json")
-        with open(dog_file, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, ensure_ascii=False, indent=2)
+        self.write_later(self.write_dog_file, dog_id, save_data)
         
         # 現在の犬リストを更新
         self.update_dog_in_list(dog_data)
         
         return dog_id
     
+    def new_dog_id(self):
+        """新しい犬のIDを作成（同じ秒に作られた犬とは連番で区別する）"""
+        base_id = f"dog_{int(time.time())}"
+        used_ids = {dog['id'] for dog in self.current_dogs}
+        dog_id = base_id
+        number = 1
+        while dog_id in used_ids or os.path.exists(os.path.join(self.dogs_dir, f"{dog_id}.json")):
+            number += 1
+            dog_id = f"{base_id}_{number}"
+        return dog_id
+    
     def update_dog_in_list(self, dog_data):
         """犬リストの中の特定の犬を更新"""
         dog_id = dog_data['id']
@@ -216,13 +613,17 @@ class SaveManager:
     
     def delete_dog(self, dog_id):
         """犬のデータを削除"""
-        dog_file = os.path.join(self.dogs_dir, f"{dog_id}.json")
-        if os.path.exists(dog_file):
-            os.remove(dog_file)
+        self.write_later(self.remove_dog_file, dog_id)
         
         # 現在の犬リストから削除
         self.current_dogs = [dog for dog in self.current_dogs if dog['id'] != dog_id]
     
+    def remove_dog_file(self, dog_id):
+        """犬のデータのファイルを削除"""
+        dog_file = os.path.join(self.dogs_dir, f"{dog_id}.json")
+        if os.path.exists(dog_file):
+            os.remove(dog_file)
+    
     def add_to_graveyard(self, dog):
         """墓地に犬を追加"""
         grave = {
@@ -236,6 +637,12 @@ class SaveManager:
         self.graveyard.append(grave)
         self.save_graveyard()
         
+        # 統計情報とインデックスも1件分だけ更新
+        self.graveyard_stats.add(grave)
+        self.write_later(GraveyardStats.write, self.graveyard_stats_file, self.graveyard_stats.dumps())
+        if self.graveyard_index is not None:
+            self.graveyard_index.add(grave)
+        
         # トレーナーデータも更新
         self.trainer_data["total_deaths"] += 1
         self.trainer_data["dogs_raised"][dog.dog_type] += 1
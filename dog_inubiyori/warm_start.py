@@ -0,0 +1,145 @@
+import os
+import json
+import struct
+import hashlib
+import logging
+import pygame
+from utils import Utils
+
+logger = logging.getLogger(__name__)
+
+class WarmStartCache:
+    # ファイル形式のバージョン（形式を変えた場合は上げる）
+    VERSION = 1
+    MAGIC = b"INUBIYORI-WARM"
+
+    # 描画結果に影響するコード（変更されたらキャッシュを作り直す）
+    SOURCE_FILES = ["ui.py", "animation.py", "sprite_atlas.py", "warm_start.py"]
+
+    # 描画結果に影響するアセット（更新時刻とサイズで変更を調べる）
+    ASSET_FILES = [os.path.join("assets", "logo.png")]
+
+    def __init__(self, extra_key=(), path=None):
+        """起動時に作成するサーフェスのキャッシュの初期化
+
+        extra_key: コードとアセット以外で描画結果に影響するもの（フォントなど）
+        """
+        if path is None:
+            try:
+                path = os.path.join(Utils.get_cache_dir(), "warm_start.bin")
+            except OSError:
+                path = None
+        self.path = path
+        self.key = self.compute_key(extra_key)
+
+        # 名前 -> サーフェス
+        self.surfaces = {}
+        # サーフェス以外の情報（アトラスの矩形など）
+        self.meta = {}
+
+        # 読み込んだキャッシュが使えたかどうか
+        self.loaded = False
+
+    def compute_key(self, extra_key):
+        """コードとアセットのハッシュ"""
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha256()
+        digest.update(f"{self.VERSION}:{pygame.version.ver}:{list(extra_key)}".encode("utf-8"))
+
+        for filename in self.SOURCE_FILES:
+            try:
+                with open(os.path.join(base_dir, filename), "rb") as f:
+                    digest.update(f.read())
+            except OSError:
+                digest.update(b"missing")
+
+        for filename in self.ASSET_FILES:
+            try:
+                stat = os.stat(os.path.join(base_dir, filename))
+                digest.update(f"{filename}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+            except OSError:
+                digest.update(f"{filename}:missing".encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def load(self):
+        """キャッシュファイルを1回の読み込みで読み、キーが一致すればサーフェスを復元する"""
+        if self.path is None or not os.path.exists(self.path):
+            return False
+
+        try:
+            # 復元したサーフェスがそのまま参照できるように書き換え可能なバッファに読み込む
+            data = bytearray(os.path.getsize(self.path))
+            with open(self.path, "rb") as f:
+                f.readinto(data)
+
+            # 先頭: MAGIC, ヘッダー(JSON)の長さ, ヘッダー, その後にピクセルデータが並ぶ
+            if not data.startswith(self.MAGIC):
+                return False
+            offset = len(self.MAGIC)
+            (header_length,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            header = json.loads(bytes(data[offset:offset + header_length]).decode("utf-8"))
+            offset += header_length
+
+            if header.get("key") != self.key:
+                logger.debug("Warm-start cache is stale: %s", self.path)
+                return False
+
+            view = memoryview(data)
+            surfaces = {}
+            for name, (width, height, start, length) in header["surfaces"].items():
+                pixels = view[offset + start:offset + start + length]
+                surfaces[name] = pygame.image.frombuffer(pixels, (width, height), "RGBA")
+        except (OSError, ValueError, KeyError, struct.error, pygame.error) as e:
+            logger.debug("Ignoring warm-start cache %s: %s", self.path, e)
+            return False
+
+        # frombufferのサーフェスは読み込んだデータを参照し続ける
+        self.surfaces = surfaces
+        self.meta = header.get("meta", {})
+        self.loaded = True
+        logger.debug("Warm-start cache loaded: %d surfaces (%d bytes)", len(surfaces), len(data))
+        return True
+
+    def get(self, name):
+        """キャッシュのサーフェスを取得（無い場合はNone）"""
+        return self.surfaces.get(name)
+
+    def put(self, name, surface):
+        """保存するサーフェスを登録"""
+        self.surfaces[name] = surface
+
+    def save(self):
+        """登録されたサーフェスをまとめて1つのファイルに書き出す"""
+        if self.path is None:
+            return False
+
+        entries = {}
+        chunks = []
+        offset = 0
+        for name, surface in self.surfaces.items():
+            pixels = pygame.image.tobytes(surface, "RGBA")
+            entries[name] = (surface.get_width(), surface.get_height(), offset, len(pixels))
+            chunks.append(pixels)
+            offset += len(pixels)
+
+        header = json.dumps({"key": self.key, "surfaces": entries, "meta": self.meta},
+                            ensure_ascii=False).encode("utf-8")
+
+        # 書き込み途中のファイルを読まないように一時ファイルから置き換える
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(self.MAGIC)
+                f.write(struct.pack("<I", len(header)))
+                f.write(header)
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning("Failed to save warm-start cache %s: %s", self.path, e)
+            return False
+
+        logger.debug("Warm-start cache saved: %d surfaces (%d bytes)", len(entries), offset)
+        return True
@@ -0,0 +1,143 @@
+import pygame
+
+class Widget:
+    def __init__(self, key, rect, kind, value):
+        """画面上のボタンなどの部品の初期化"""
+        self.key = key          # 画面内で一意なキー
+        self.rect = pygame.Rect(rect)
+        self.kind = kind        # "action", "menu", "dog_type" など
+        self.value = value      # 選択された時に返す値
+        # 状態が変わった時に描き直す範囲（ツールチップなど部品の外に描くものも含める）
+        self.redraw_rect = self.rect
+        self.hover = False
+        self.dirty = False      # ホバー状態が変わって再描画が必要かどうか
+        self.seen = True        # このフレームで描画されたかどうか
+
+class SpatialGrid:
+    def __init__(self, cell_size=64):
+        """当たり判定用の一様グリッドの初期化"""
+        self.cell_size = cell_size
+        # (セルX, セルY) -> 部品のリスト
+        self.cells = {}
+
+    def get_cells(self, rect):
+        """矩形が重なるセルの一覧を取得"""
+        left = rect.left // self.cell_size
+        right = (rect.right - 1) // self.cell_size
+        top = rect.top // self.cell_size
+        bottom = (rect.bottom - 1) // self.cell_size
+        return [(cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)]
+
+    def insert(self, widget):
+        """部品を登録"""
+        for cell in self.get_cells(widget.rect):
+            self.cells.setdefault(cell, []).append(widget)
+
+    def remove(self, widget):
+        """部品を削除"""
+        for cell in self.get_cells(widget.rect):
+            widgets = self.cells.get(cell)
+            if widgets and widget in widgets:
+                widgets.remove(widget)
+                if not widgets:
+                    del self.cells[cell]
+
+    def query(self, pos):
+        """位置を含むセルに登録された部品を取得"""
+        return self.cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size), [])
+
+class WidgetLayer:
+    def __init__(self, name, cell_size=64):
+        """画面ごとの部品の集まりの初期化"""
+        self.name = name
+        self.widgets = {}
+        self.grid = SpatialGrid(cell_size)
+
+        # ホバー中の部品
+        self.hovered = set()
+
+        # 最後に分かっているマウスの位置
+        self.mouse_pos = (-1, -1)
+
+    def begin_frame(self):
+        """描画の開始（このフレームで描画されなかった部品は後で削除する）"""
+        for widget in self.widgets.values():
+            widget.seen = False
+
+    def ensure(self, key, rect, kind, value, redraw_rect=None):
+        """部品を取得（なければ作成し、位置が変わった場合だけ登録し直す）
+
+        描画中に呼ばれるので、作成や移動では再描画のフラグを立てない
+        """
+        widget = self.widgets.get(key)
+        rect = pygame.Rect(rect)
+
+        if widget is None:
+            widget = Widget(key, rect, kind, value)
+            self.widgets[key] = widget
+            self.grid.insert(widget)
+            self.set_hover(widget, rect.collidepoint(self.mouse_pos))
+            widget.dirty = False
+        elif widget.rect != rect:
+            self.grid.remove(widget)
+            widget.rect = rect
+            self.grid.insert(widget)
+            self.set_hover(widget, rect.collidepoint(self.mouse_pos))
+            widget.dirty = False
+
+        widget.redraw_rect = pygame.Rect(redraw_rect) if redraw_rect is not None else widget.rect
+
+        widget.kind = kind
+        widget.value = value
+        widget.seen = True
+        return widget
+
+    def end_frame(self):
+        """このフレームで描画されなかった部品を削除"""
+        removed = [key for key, widget in self.widgets.items() if not widget.seen]
+        for key in removed:
+            widget = self.widgets.pop(key)
+            self.grid.remove(widget)
+            self.hovered.discard(widget)
+
+    def set_hover(self, widget, hover):
+        """部品のホバー状態を設定（変わった場合はTrueを返す）"""
+        if widget.hover == hover:
+            return False
+
+        widget.hover = hover
+        widget.dirty = True
+        if hover:
+            self.hovered.add(widget)
+        else:
+            self.hovered.discard(widget)
+        return True
+
+    def hit_test(self, pos, kind=None):
+        """位置にある部品を取得（後から登録された部品を優先）"""
+        for widget in reversed(self.grid.query(pos)):
+            if (kind is None or widget.kind == kind) and widget.rect.collidepoint(pos):
+                return widget
+        return None
+
+    def update_hover(self, pos):
+        """マウスの移動に応じてホバー状態を更新し、状態が変わった部品を返す"""
+        self.mouse_pos = pos
+        changed = []
+
+        # 以前ホバーしていた部品と、新しい位置にある部品だけを調べる
+        candidates = list(self.hovered)
+        candidates.extend(self.grid.query(pos))
+
+        for widget in candidates:
+            if self.set_hover(widget, widget.rect.collidepoint(pos)):
+                changed.append(widget)
+
+        return changed
+
+    def take_dirty(self):
+        """再描画が必要な部品を取得してフラグをクリア（部品の範囲だけを描き直すため）"""
+        dirty = [widget for widget in self.widgets.values() if widget.dirty]
+        for widget in dirty:
+            widget.dirty = False
+        return dirty